@@ -4,36 +4,447 @@ Advanced Job Application Automation System
 Handles error messages, anti-detection, and intelligent navigation
 """
 
+import sys
 import time
 import random
 import json
 import logging
+import logging.handlers
+import queue
+import atexit
+import hashlib
+import functools
+import sqlite3
+import string
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from selenium import webdriver
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+# The driver, waits and action chains are imported where they are used
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
-from config import config
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException, StaleElementReferenceException
+import config as _cfg
+
+# Query parameters that only track the visit and don't change the page
+_TRACKING_PARAMS = frozenset({'trk', 'trkinfo', 'trackingid', 'refid', 'lipi', 'ebp', 'recommendedflavor', 'referer', 'position', 'pagenum'})
+
+def normalize_job_url(url):
+    """Strip tracking parameters and fragments so one job maps to one URL"""
+    parts = urlsplit(url)
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith('utm_')
+    ]
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path.rstrip('/') or '/', urlencode(sorted(query)), ''))
+
+# Platform-specific login/search settings; credentials are added per instance
+_PLATFORM_CONFIGS = {
+    'linkedin': {
+        'name': 'LinkedIn',
+        'credentials_key': 'LINKEDIN',
+        'login_url': 'https://www.linkedin.com/login',
+        'jobs_url': 'https://www.linkedin.com/jobs/',
+        'session_check_url': 'https://www.linkedin.com/feed/',
+        'email_selectors': ('#username', 'input[name="session_key"]', 'input[type="email"]'),
+        'password_selectors': ('#password', 'input[name="session_password"]', 'input[type="password"]'),
+        'login_button_selectors': ('button[type="submit"]', '.btn__primary--large', 'button[aria-label*="Sign in"]'),
+        'success_indicators': frozenset({'feed', 'mynetwork', 'jobs', 'messaging'}),
+        'jobs_nav_selectors': ('a[href*="/jobs"]', '.global-nav__primary-link[href*="jobs"]'),
+        'search_selectors': ('input[aria-label*="Search by title"]', '.jobs-search-box__text-input', '#jobs-search-box-keyword'),
+        'location_selectors': ('input[aria-label*="City"]', '.jobs-search-box__text-input[placeholder*="City"]', '#jobs-search-box-location'),
+        'search_button_selectors': ('button[aria-label*="Search"]', '.jobs-search-box__submit-button', 'button[type="submit"]'),
+        'blocked_patterns': ('*linkedin.com/li/track*', '*px.ads.linkedin.com*', '*snap.licdn.com*')
+    },
+    'internshala': {
+        'name': 'Internshala',
+        'credentials_key': 'INTERNSHALA',
+        'login_url': 'https://internshala.com/login',
+        'jobs_url': 'https://internshala.com/internships',
+        'session_check_url': 'https://internshala.com/student/dashboard',
+        'email_selectors': ('#email', 'input[name="email"]', 'input[type="email"]'),
+        'password_selectors': ('#password', 'input[name="password"]', 'input[type="password"]'),
+        'login_button_selectors': ('button[type="submit"]', '.login-btn', '#login_submit'),
+        'success_indicators': frozenset({'dashboard', 'student', 'internships'}),
+        'jobs_nav_selectors': ('a[href*="internships"]',),
+        'search_selectors': ('#search_internships', 'input[placeholder*="search"]', '.search-input'),
+        'location_selectors': ('#location_filter', 'input[placeholder*="location"]', '.location-filter'),
+        'search_button_selectors': ('button[type="submit"]', '.search-btn', 'input[type="submit"]'),
+        'blocked_patterns': ('*clarity.ms*', '*googleadservices.com*')
+    }
+}
+
+# Each selector tuple also gets a joined form (e.g. 'email_selector_union')
+# so it can be matched with a single WebDriver call
+for _platform_config in _PLATFORM_CONFIGS.values():
+    for _key in [key for key in _platform_config if key.endswith('_selectors')]:
+        _platform_config[_key[:-len('_selectors')] + '_selector_union'] = ", ".join(_platform_config[_key])
+
+def _tag_selector(selector):
+    """Return (By, selector) for a tagged pair or a plain CSS/XPath string"""
+    if isinstance(selector, tuple):
+        return selector
+    # XPath expressions start with a path or a parenthesised group
+    if selector.startswith(('/', './', '(')):
+        return (By.XPATH, selector)
+    return (By.CSS_SELECTOR, selector)
+
+@functools.lru_cache(maxsize=256)
+def _tag_selectors(selectors):
+    """Tag every entry of a selector tuple with its locator type, once per distinct tuple"""
+    return tuple(_tag_selector(selector) for selector in selectors)
+
+# Job card selectors tried in order until one matches
+_JOB_CARD_SELECTORS = {
+    'linkedin': ('.job-card-container', '.jobs-search-results__list-item', '.job-card-list__entity', 'a[href*="/jobs/view/"]'),
+    'internshala': ('.individual_internship', '.internship_meta', '.job-card', 'a[href*="/internship/detail/"]')
+}
+
+# Card field selectors
+_LI_TITLE = ('.job-card-list__title a', '.job-card-container__link', 'a[data-control-name="job_card_title"]', 'h3 a')
+_LI_COMPANY = ('.job-card-container__company-name', '.job-card-list__company-name', 'a[data-control-name="job_card_company_link"]')
+_LI_LOCATION = ('.job-card-container__metadata-item',)
+_IS_TITLE = ('.job-title a', '.profile h3 a', 'h3 a', 'h4 a')
+_IS_COMPANY = ('.company-name', '.company h4 a', 'a[href*="company"]')
+_IS_LOCATION = ('.locations span', '.location_link')
+
+# Application flow selectors; button text matches go through XPath
+_LI_EASY_APPLY = ('button[aria-label*="Easy Apply"]', '.jobs-apply-button', 'button[data-control-name="jobdetails_topcard_inapply"]')
+_LI_NEXT = (
+    'button[aria-label="Continue to next step"]',
+    'button[data-control-name="continue_unify"]',
+    (By.XPATH, '//button[contains(normalize-space(.), "Next") or contains(normalize-space(.), "Continue")]')
+)
+_LI_SUBMIT = (
+    'button[aria-label*="Submit application"]',
+    'button[data-control-name="submit_unify"]',
+    (By.XPATH, '//button[contains(normalize-space(.), "Submit")]')
+)
+_IS_APPLY = (
+    '.apply_now_button',
+    '.btn-primary',
+    (By.XPATH, '//button[contains(normalize-space(.), "Apply")]'),
+    (By.XPATH, '//a[contains(normalize-space(.), "Apply")]')
+)
+_IS_COVER_LETTER = ('textarea[name*="cover"]', 'textarea[placeholder*="cover"]', 'textarea')
+_IS_SUBMIT = (
+    'button[type="submit"]',
+    '.submit-btn',
+    'input[type="submit"]',
+    (By.XPATH, '//button[contains(normalize-space(.), "Submit")]')
+)
+_GENERIC_APPLY = (
+    (By.XPATH, '//button[contains(normalize-space(.), "Apply")]'),
+    (By.XPATH, '//a[contains(normalize-space(.), "Apply")]'),
+    '.apply-btn',
+    '.apply-button',
+    'input[value*="Apply"]'
+)
+
+# Basic stealth options passed to every Chrome instance
+_STATIC_CHROME_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-extensions",
+    "--disable-plugins",
+    "--disable-javascript-harmony-shipping",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+)
+
+_UA_TUPLE = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+)
+
+_WINDOW_SIZES = ("1366,768", "1920,1080", "1440,900", "1536,864")
+
+# Idle browsers kept alive between sessions, keyed by (user agent, window size, profile dir)
+_DRIVER_POOL = {}
+
+def shutdown_driver_pool():
+    """Quit every pooled browser"""
+    for drivers in _DRIVER_POOL.values():
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+    _DRIVER_POOL.clear()
+
+atexit.register(shutdown_driver_pool)
+
+# Background thread writing log records to file/console off the hot path
+_LOG_LISTENER = None
+
+def stop_log_listener():
+    """Flush queued log records and stop the listener thread"""
+    global _LOG_LISTENER
+    if _LOG_LISTENER:
+        _LOG_LISTENER.stop()
+        _LOG_LISTENER = None
+
+atexit.register(stop_log_listener)
 
 class AdvancedJobApplier:
     """Advanced job application automation with comprehensive error handling"""
     
+    # Common popup close button selectors (plain CSS only)
+    POPUP_CLOSE_SELECTORS = (
+        # Generic close buttons
+        'button[aria-label*="close" i]',
+        'button[aria-label*="dismiss" i]',
+        'button[title*="close" i]',
+        '[data-dismiss="modal"]',
+        '[data-dismiss="alert"]',
+        '.close',
+        '.modal-close',
+        '.popup-close',
+        '.dialog-close',
+        
+        # X buttons
+        '.fa-times',
+        '.fa-close',
+        '[aria-label="Close"]',
+        
+        # Platform-specific selectors
+        '.artdeco-modal__dismiss',  # LinkedIn
+        '.swal-button',             # SweetAlert
+        '.alert .btn-close',        # Bootstrap alerts
+        '.toast-close-button',      # Toast notifications
+        
+        # CAPTCHA close buttons
+        'button[aria-label*="captcha" i]',
+        '.captcha-close',
+        
+        # Error dialog buttons
+        '.error-dialog button',
+        '.alert-dialog button',
+        '.notification-close'
+    )
+    POPUP_CLOSE_CSS = ", ".join(POPUP_CLOSE_SELECTORS)
+    
+    # Text-matched close buttons (CSS has no :contains(), so these use XPath).
+    # Short labels must match exactly so e.g. "Book" or "Continue to next step"
+    # are not treated as popup buttons.
+    _LOWER_TEXT = "translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+    POPUP_CLOSE_XPATH = (
+        f".//button[{_LOWER_TEXT}='ok' or {_LOWER_TEXT}='continue' or {_LOWER_TEXT}='×'"
+        f" or contains({_LOWER_TEXT}, 'dismiss') or contains({_LOWER_TEXT}, 'got it')"
+        f" or contains({_LOWER_TEXT}, 'close')]"
+        " | .//span[normalize-space(.)='×']"
+    )
+    
+    CAPTCHA_SELECTORS = (
+        'iframe[src*="captcha"]',
+        'iframe[src*="recaptcha"]',
+        '.captcha',
+        '.recaptcha',
+        '#captcha',
+        '[data-captcha]',
+        'img[src*="captcha"]'
+    )
+    CAPTCHA_CSS = ", ".join(CAPTCHA_SELECTORS)
+    
+    # Requests blocked through CDP (--disable-images is ignored by current Chrome)
+    BLOCKED_URL_PATTERNS = (
+        # Images, fonts and media
+        '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.ico',
+        '*.woff', '*.woff2', '*.ttf', '*.otf',
+        '*.mp4', '*.webm', '*.mp3',
+        
+        # Third-party analytics
+        '*google-analytics.com*',
+        '*googletagmanager.com*',
+        '*doubleclick.net*',
+        '*facebook.net*',
+        '*hotjar.com*'
+    )
+    
+    # True once the DOM is parsed; ads and beacons loading after that don't
+    # affect the forms and buttons the flows interact with
+    PAGE_IDLE_JS = "return document.readyState !== 'loading';"
+    
+    # [index, element] for the first selector in arguments[0] with a visible
+    # match, or null; selectors the browser can't parse are skipped
+    FIRST_VISIBLE_MATCH_JS = """
+        const visible = e => {
+            const s = window.getComputedStyle(e);
+            return s.display !== 'none' && s.visibility !== 'hidden' && e.getClientRects().length > 0;
+        };
+        const selectors = arguments[0];
+        for (let i = 0; i < selectors.length; i++) {
+            const [by, selector] = selectors[i];
+            let matches;
+            try {
+                if (by === 'xpath') {
+                    const snapshot = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                    matches = Array.from({length: snapshot.snapshotLength}, (_, j) => snapshot.snapshotItem(j));
+                } else {
+                    matches = document.querySelectorAll(selector);
+                }
+            } catch (e) {
+                continue;
+            }
+            for (const e of matches) {
+                if (e.nodeType === 1 && visible(e)) return [i, e];
+            }
+        }
+        return null;
+    """
+    
+    # Nodes whose insertion means a popup scan is worth doing
+    POPUP_WATCH_CSS = ", ".join(
+        POPUP_CLOSE_SELECTORS + CAPTCHA_SELECTORS + ('[role="dialog"]', '[role="alertdialog"]', '.modal')
+    )
+    
+    # Installed on every new document; queues popup-like nodes as they are
+    # added (guarded so the script never sets up a second observer)
+    POPUP_OBSERVER_JS = """
+        if (window.__popupQueue === undefined) {
+            window.__popupQueue = [];
+            new MutationObserver(mutations => {
+                const selector = __SELECTOR__;
+                for (const m of mutations) {
+                    for (const node of m.addedNodes) {
+                        if (node.nodeType !== 1 || window.__popupQueue.length >= 50) continue;
+                        const hit = node.matches(selector) ? node : node.querySelector(selector);
+                        if (hit) window.__popupQueue.push(hit);
+                    }
+                }
+            }).observe(document, {childList: true, subtree: true});
+        }
+    """.replace('__SELECTOR__', json.dumps(POPUP_WATCH_CSS))
+    
+    # Number of queued popup nodes still in the page, or null without the observer
+    POPUP_QUEUE_DRAIN_JS = """
+        const q = window.__popupQueue;
+        if (q === undefined) return null;
+        window.__popupQueue = [];
+        return q.filter(e => e.isConnected).length;
+    """
+    
+    # Seconds during which repeat popup scans are skipped
+    POPUP_SCAN_DEBOUNCE = 1.5
+    
+    # Scrolls the element into view and clicks it unless it is disabled or
+    # not rendered (e.g. only shown under a :hover rule on a parent)
+    JS_CLICK_JS = """
+        const e = arguments[0];
+        e.scrollIntoView({block: 'center'});
+        if (e.disabled) return 'disabled';
+        const s = window.getComputedStyle(e);
+        if (s.display === 'none' || s.visibility === 'hidden' || e.getClientRects().length === 0) return 'hidden';
+        e.click();
+        return 'clicked';
+    """
+    
+    # Comma-joined selectors so each card field is one query
+    LINKEDIN_TITLE_SEL = ", ".join(_LI_TITLE)
+    LINKEDIN_COMPANY_SEL = ", ".join(_LI_COMPANY)
+    LINKEDIN_LOCATION_SEL = ", ".join(_LI_LOCATION)
+    INTERNSHALA_TITLE_SEL = ", ".join(_IS_TITLE)
+    INTERNSHALA_COMPANY_SEL = ", ".join(_IS_COMPANY)
+    INTERNSHALA_LOCATION_SEL = ", ".join(_IS_LOCATION)
+    
+    # Apply-flow buttons mix CSS and XPath, find_element_safe groups them
+    LINKEDIN_EASY_APPLY_SEL = _LI_EASY_APPLY
+    LINKEDIN_NEXT_SEL = _LI_NEXT
+    LINKEDIN_SUBMIT_SEL = _LI_SUBMIT
+    INTERNSHALA_APPLY_SEL = _IS_APPLY
+    INTERNSHALA_COVER_LETTER_SEL = _IS_COVER_LETTER
+    INTERNSHALA_SUBMIT_SEL = _IS_SUBMIT
+    GENERIC_APPLY_SEL = _GENERIC_APPLY
+    
+    # Server-rendered job cards LinkedIn serves to logged-out visitors
+    LINKEDIN_GUEST_JOBS_URL = 'https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search'
+    
+    # Placeholder titles for cards whose title couldn't be read
+    DEFAULT_JOB_TITLES = {'linkedin': "LinkedIn Job", 'internshala': "Internship"}
+    
+    # Cover letters typed into application forms
+    LINKEDIN_COVER_TPL = string.Template(
+        "Dear $company Team,\n\nI am excited to apply for the $title position. I believe my skills and enthusiasm make me a great fit for this role.\n\nThank you for considering my application.\n\nBest regards"
+    )
+    INTERNSHALA_COVER_TPL = string.Template(
+        "Dear $company Team,\n\nI am excited to apply for the $title position. As a motivated individual, I am eager to contribute to your team and gain valuable experience.\n\nThank you for considering my application.\n\nBest regards"
+    )
+    
+    # Card field selectors by platform, shared by both extraction paths
+    CARD_FIELD_SELECTORS = {
+        'linkedin': {'title': LINKEDIN_TITLE_SEL, 'company': LINKEDIN_COMPANY_SEL, 'location': LINKEDIN_LOCATION_SEL},
+        'internshala': {'title': INTERNSHALA_TITLE_SEL, 'company': INTERNSHALA_COMPANY_SEL, 'location': INTERNSHALA_LOCATION_SEL}
+    }
+    
+    # Picks the first card selector with matches and returns the fields of
+    # up to arguments[1] cards; hrefs come back already absolute
+    JOB_CARDS_JS = """
+        const [cardSelectors, maxJobs, fields] = arguments;
+        const first = (card, selector) => {
+            if (!selector) return ['', ''];
+            for (const el of card.querySelectorAll(selector)) {
+                if (el.innerText.trim()) return [el.innerText.trim(), el.href || ''];
+            }
+            return ['', ''];
+        };
+        let cards = [];
+        for (const sel of cardSelectors) {
+            cards = Array.from(document.querySelectorAll(sel));
+            if (cards.length) break;
+        }
+        return cards.slice(0, maxJobs).map(card => {
+            const [title, url] = first(card, fields.title);
+            const isLink = card.tagName === 'A';
+            return {
+                title: title || (isLink ? card.innerText.trim() : ''),
+                url: url || (isLink ? card.href : ''),
+                company: first(card, fields.company)[0],
+                location: first(card, fields.location)[0]
+            };
+        });
+    """
+    
+    DOM_LENGTH_JS = "return document.body ? document.body.innerHTML.length : 0;"
+    
+    # Returns [visible, enabled, text, aria-label, title] for each element
+    ELEMENT_STATE_JS = """
+        return arguments[0].map(e => {
+            const s = window.getComputedStyle(e);
+            const visible = s.display !== 'none' && s.visibility !== 'hidden' && e.getClientRects().length > 0;
+            return [visible, !e.disabled, e.innerText || '', e.getAttribute('aria-label') || '', e.getAttribute('title') || ''];
+        });
+    """
+    
     def __init__(self, platform="linkedin"):
         self.platform = platform.lower()
         self.driver = None
         self.wait = None
-        self.actions = None
+        self._actions = None
+        self.fingerprint = None
+        self._last_popup_scan = 0.0
+        
+        platform_config = _PLATFORM_CONFIGS.get(self.platform, _PLATFORM_CONFIGS['linkedin'])
+        email, password = _cfg.get_config().CREDENTIALS[platform_config['credentials_key']]
+        self.platform_config = {
+            **platform_config,
+            'email': email,
+            'password': password
+        }
+        
+        self.search_preferences = {}
+        
         self.logger = self.setup_logging()
         self.session_stats = {
             'jobs_found': 0,
             'jobs_applied': 0,
             'applications_successful': 0,
             'applications_failed': 0,
+            'jobs_skipped': 0,
             'errors_handled': 0,
             'captchas_detected': 0,
             'start_time': datetime.now()
@@ -46,6 +457,13 @@ class AdvancedJobApplier:
             'scroll_delay': (0.5, 1.5),    # seconds between scroll steps
             'click_delay': (1, 3)          # seconds between clicks
         }
+        
+        # Gap between applications: stays short while the platform is happy,
+        # doubles whenever a CAPTCHA shows up
+        self.current_delay = 3
+        
+        # Jobs applied to in earlier sessions, so they can be skipped for free
+        self.history, self.applied_hashes = self.load_application_history()
     
     def setup_logging(self):
         """Setup comprehensive logging"""
@@ -54,56 +472,143 @@ class AdvancedJobApplier:
         
         log_file = log_dir / f'{self.platform}_automation_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        )
+        global _LOG_LISTENER
+        root = logging.getLogger()
+        
+        # Same no-op-if-configured behaviour as basicConfig, but records are
+        # only queued here and written by a background listener thread
+        if _LOG_LISTENER is None and not root.handlers:
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            handlers = [logging.FileHandler(log_file), logging.StreamHandler()]
+            for handler in handlers:
+                handler.setFormatter(formatter)
+            
+            log_queue = queue.Queue(-1)
+            _LOG_LISTENER = logging.handlers.QueueListener(log_queue, *handlers)
+            _LOG_LISTENER.start()
+            
+            root.setLevel(logging.INFO)
+            root.addHandler(logging.handlers.QueueHandler(log_queue))
         
         logger = logging.getLogger(__name__)
-        logger.info(f"Starting {self.platform} job application automation")
+        logger.info("Starting %s job application automation", self.platform)
         return logger
     
-    def create_stealth_browser(self):
+    def load_application_history(self):
+        """Open the applied-jobs table and load the hashes already stored for this platform"""
+        db_path = _cfg.get_config().DATABASE_URL.replace('sqlite:///', '')
+        try:
+            history = sqlite3.connect(db_path)
+            history.execute('CREATE TABLE IF NOT EXISTS applied (url_hash BLOB PRIMARY KEY, platform TEXT, ts REAL)')
+            applied = {row[0] for row in history.execute('SELECT url_hash FROM applied WHERE platform = ?', (self.platform,))}
+            return history, applied
+        except sqlite3.Error as e:
+            self.logger.warning("Application history unavailable: %s", e)
+            return None, set()
+    
+    def job_url_hash(self, url):
+        """Stable 8-byte key for a job posting, ignoring tracking parameters"""
+        return hashlib.blake2b(normalize_job_url(url).encode(), digest_size=8).digest()
+    
+    def record_application(self, url):
+        """Remember a successful application across sessions"""
+        url_hash = self.job_url_hash(url)
+        self.applied_hashes.add(url_hash)
+        
+        if self.history is None:
+            return
+        try:
+            self.history.execute('INSERT OR IGNORE INTO applied VALUES (?, ?, ?)', (url_hash, self.platform, time.time()))
+            self.history.commit()
+        except sqlite3.Error as e:
+            self.logger.warning("Could not record application: %s", e)
+    
+    def profile_dir(self):
+        """Chrome user-data-dir that keeps this platform's login between runs"""
+        return Path(_cfg.get_config().BROWSER_PROFILE_PATH).resolve() / f'{self.platform}_profile'
+    
+    def reuse_pooled_browser(self, profile=None):
+        """Take an idle browser from the pool and reset its state"""
+        for fingerprint, drivers in _DRIVER_POOL.items():
+            # A profile directory can only be open in one browser at a time,
+            # so profile browsers are only handed back to the same profile
+            if fingerprint[2] != profile:
+                continue
+            
+            while drivers:
+                driver = drivers.pop()
+                try:
+                    # The persisted profile's cookies are the point of using it
+                    if profile is None:
+                        try:
+                            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+                        except Exception:
+                            driver.delete_all_cookies()
+                    driver.get('about:blank')
+                except WebDriverException:
+                    # Browser died while idle
+                    try:
+                        driver.quit()
+                    except Exception:
+                        pass
+                    continue
+                
+                from selenium.webdriver.support.ui import WebDriverWait
+                
+                self.driver = driver
+                self.fingerprint = fingerprint
+                self.wait = WebDriverWait(self.driver, 15)
+                self._actions = None
+                self.block_heavy_resources()
+                self.install_popup_observer()
+                self.logger.info("Reusing pooled browser")
+                return True
+        
+        return False
+    
+    def create_stealth_browser(self, use_profile=True):
         """Create browser with advanced anti-detection measures"""
         print("🛡️ Creating stealth browser with anti-detection measures...")
         self.logger.info("Creating stealth browser")
         
+        profile = str(self.profile_dir()) if use_profile else None
+        
+        # Skip the Chrome startup cost when an earlier session left a browser behind
+        if self.reuse_pooled_browser(profile):
+            print("✅ Reusing existing stealth browser")
+            return True
+        
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.support.ui import WebDriverWait
+        
         options = Options()
         
-        # Basic stealth options
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-plugins")
-        options.add_argument("--disable-images")  # Faster loading
-        options.add_argument("--disable-javascript-harmony-shipping")
-        options.add_argument("--disable-background-timer-throttling")
-        options.add_argument("--disable-backgrounding-occluded-windows")
-        options.add_argument("--disable-renderer-backgrounding")
-        options.add_argument("--disable-features=TranslateUI")
-        options.add_argument("--disable-ipc-flooding-protection")
-        
-        # Realistic user agent
-        user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
-        ]
-        options.add_argument(f"--user-agent={random.choice(user_agents)}")
+        for arg in _STATIC_CHROME_ARGS:
+            options.add_argument(arg)
+        
+        # driver.get returns at DOMContentLoaded; elements the flows need are
+        # waited for explicitly by find_element_safe
+        options.page_load_strategy = 'eager'
         
-        # Window size randomization
-        window_sizes = ["1366,768", "1920,1080", "1440,900", "1536,864"]
-        options.add_argument(f"--window-size={random.choice(window_sizes)}")
+        # Realistic user agent and randomized window size
+        user_agent = random.choice(_UA_TUPLE)
+        options.add_argument(f"--user-agent={user_agent}")
+        
+        window_size = random.choice(_WINDOW_SIZES)
+        options.add_argument(f"--window-size={window_size}")
+        
+        # Persisted profile: cookies and local storage survive between runs
+        if profile:
+            options.add_argument(f"--user-data-dir={profile}")
+            options.add_argument("--profile-directory=Default")
         
         try:
             self.driver = webdriver.Chrome(options=options)
+            self.block_heavy_resources()
+            self.fingerprint = (user_agent, window_size, profile)
             self.wait = WebDriverWait(self.driver, 15)
-            self.actions = ActionChains(self.driver)
+            self._actions = None
             
             # Execute anti-detection scripts
             self.driver.execute_script("""
@@ -113,15 +618,43 @@ class AdvancedJobApplier:
                 window.chrome = {runtime: {}};
             """)
             
+            self.install_popup_observer()
+            
             print("✅ Stealth browser created successfully!")
             self.logger.info("Stealth browser created successfully")
             return True
             
         except Exception as e:
             print(f"❌ Browser creation failed: {str(e)}")
-            self.logger.error(f"Browser creation failed: {str(e)}")
+            self.logger.error("Browser creation failed: %s", e)
             return False
     
+    def install_popup_observer(self):
+        """Queue popup-like nodes on every page so scans only run when one appeared"""
+        # Registered scripts outlive the session that added them, so a pooled
+        # browser keeps the identifier and is not registered a second time
+        if vars(self.driver).get('_popup_observer_id'):
+            return
+        
+        try:
+            result = self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': self.POPUP_OBSERVER_JS})
+            self.driver._popup_observer_id = result.get('identifier')
+        except Exception as e:
+            # popups_pending falls back to always scanning
+            self.logger.warning("Could not install popup observer: %s", e)
+    
+    def block_heavy_resources(self):
+        """Stop the browser from downloading images, fonts, media and tracking requests"""
+        try:
+            # Platform tracking endpoints fail instantly instead of holding up the page
+            patterns = list(self.BLOCKED_URL_PATTERNS) + list(self.platform_config.get('blocked_patterns', ()))
+            
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+            self.logger.info("Blocking %s resource patterns", len(patterns))
+        except Exception as e:
+            self.logger.warning("Could not block resources: %s", e)
+    
     def human_delay(self, delay_type='action_delay'):
         """Add human-like delays"""
         min_delay, max_delay = self.human_delays[delay_type]
@@ -129,29 +662,52 @@ class AdvancedJobApplier:
         time.sleep(delay)
         return delay
     
+    def wait_for_idle(self, timeout=5):
+        """Wait for the page to become interactive instead of sleeping a fixed time"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(
+                lambda driver: driver.execute_script(self.PAGE_IDLE_JS)
+            )
+            return True
+        except TimeoutException:
+            self.logger.info("Page still loading after %ss, continuing", timeout)
+            return False
+    
     def human_type(self, element, text, clear_first=True):
         """Type text with human-like speed and patterns"""
         if clear_first:
             element.clear()
             self.human_delay('click_delay')
         
-        # Add some typing variations
-        for i, char in enumerate(text):
-            element.send_keys(char)
+        # Send a burst of 20-40 characters per call rather than one key per
+        # round-trip; slicing keeps the newlines a cover letter relies on
+        position = 0
+        while position < len(text):
+            chunk_size = random.randint(20, 40)
+            element.send_keys(text[position:position + chunk_size])
+            position += chunk_size
             
             # Occasional longer pauses (thinking)
             if random.random() < 0.1:  # 10% chance
                 time.sleep(random.uniform(0.3, 0.8))
             else:
                 self.human_delay('typing_speed')
-            
-            # Occasional backspace and retype (human error simulation)
-            if random.random() < 0.02 and i > 0:  # 2% chance
-                element.send_keys(Keys.BACKSPACE)
-                time.sleep(random.uniform(0.1, 0.3))
-                element.send_keys(char)
         
-        self.logger.info(f"Typed text with human-like patterns: {text[:20]}...")
+        self.logger.info("Typed text with human-like patterns: %s...", text[:20])
+    
+    def fast_fill(self, element, text):
+        """Set a field's value in one call (for fields where typing speed isn't watched)"""
+        # Use the native value setter so framework-controlled inputs see the change
+        self.driver.execute_script("""
+            const el = arguments[0];
+            const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+            Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, arguments[1]);
+            el.dispatchEvent(new Event('input', {bubbles: true}));
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+        """, element, text)
+        self.logger.info("Filled field: %s...", text[:20])
     
     def human_scroll(self, direction='down', steps=3):
         """Scroll page with human-like patterns"""
@@ -166,104 +722,114 @@ class AdvancedJobApplier:
             self.human_delay('scroll_delay')
             scroll_amount = random.randint(150, 350)  # Vary scroll amount
     
+    def popups_pending(self):
+        """Drain the popup observer queue; True when a scan is needed"""
+        try:
+            queued = self.driver.execute_script(self.POPUP_QUEUE_DRAIN_JS)
+        except Exception:
+            return True
+        
+        # No observer on this page (e.g. opened before it was installed)
+        if queued is None:
+            return True
+        
+        return queued > 0
+    
+    @property
+    def actions(self):
+        """ActionChains for the current driver, only built when a hover is needed"""
+        if self._actions is None:
+            from selenium.webdriver.common.action_chains import ActionChains
+            self._actions = ActionChains(self.driver)
+        return self._actions
+    
+    def dom_length(self):
+        """Size of the page markup, used as a cheap did-anything-change check"""
+        try:
+            return self.driver.execute_script(self.DOM_LENGTH_JS)
+        except Exception:
+            return None
+    
     def detect_and_handle_popups(self, max_attempts=5):
         """Comprehensive popup and error message detection and handling"""
+        # Collapse back-to-back calls from the same action (click, then
+        # navigate, then fill); anything the observer queued meanwhile is
+        # still there for the next scan
+        if time.monotonic() - self._last_popup_scan < self.POPUP_SCAN_DEBOUNCE:
+            return False
+        
+        if not self.popups_pending():
+            return False
+        
         print("🔍 Scanning for popups and error messages...")
-        self.logger.info("Scanning for popups and error messages")
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        if log_info:
+            self.logger.info("Scanning for popups and error messages")
         
         popup_handled = False
         attempts = 0
+        prev_dom_length = self.dom_length()
         
         while attempts < max_attempts:
             attempts += 1
             
-            # Common popup close button selectors
-            close_selectors = [
-                # Generic close buttons
-                'button[aria-label*="close" i]',
-                'button[aria-label*="dismiss" i]',
-                'button[title*="close" i]',
-                '[data-dismiss="modal"]',
-                '[data-dismiss="alert"]',
-                '.close',
-                '.modal-close',
-                '.popup-close',
-                '.dialog-close',
-                
-                # X buttons
-                'button:contains("×")',
-                'span:contains("×")',
-                '.fa-times',
-                '.fa-close',
-                '[aria-label="Close"]',
-                
-                # OK/Dismiss buttons
-                'button:contains("OK")',
-                'button:contains("Ok")',
-                'button:contains("Dismiss")',
-                'button:contains("Close")',
-                'button:contains("Got it")',
-                'button:contains("Continue")',
-                
-                # Platform-specific selectors
-                '.artdeco-modal__dismiss',  # LinkedIn
-                '.swal-button',             # SweetAlert
-                '.alert .btn-close',        # Bootstrap alerts
-                '.toast-close-button',      # Toast notifications
-                
-                # CAPTCHA close buttons
-                'button[aria-label*="captcha" i]',
-                '.captcha-close',
-                
-                # Error dialog buttons
-                '.error-dialog button',
-                '.alert-dialog button',
-                '.notification-close'
-            ]
-            
             popup_found = False
             
-            for selector in close_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+            # One CSS query for every close-button selector plus one XPath
+            # query for the text-based ones, instead of a query per selector
+            try:
+                elements = self.driver.find_elements(By.CSS_SELECTOR, self.POPUP_CLOSE_CSS)
+                elements += self.driver.find_elements(By.XPATH, self.POPUP_CLOSE_XPATH)
+            except Exception as e:
+                self.logger.warning("Popup scan failed: %s", e)
+                elements = []
+            
+            # Read visibility/enabled/text/aria/title for every candidate in
+            # a single round-trip instead of five WebDriver calls per element
+            try:
+                states = self.driver.execute_script(self.ELEMENT_STATE_JS, elements) if elements else []
+            except Exception as e:
+                self.logger.warning("Popup state read failed: %s", e)
+                states = []
+            
+            close_keywords = ['close', 'dismiss', 'ok', 'got it', 'continue', '×', 'x']
+            
+            for element, (visible, enabled, text, aria, title) in zip(elements, states):
+                if not (visible and enabled):
+                    continue
+                
+                # Check if it's actually a close/dismiss button
+                element_text = (text or '').lower()
+                element_aria = aria.lower()
+                element_title = title.lower()
+                
+                if any(keyword in element_text or keyword in element_aria or keyword in element_title 
+                       for keyword in close_keywords):
                     
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            # Check if it's actually a close/dismiss button
-                            element_text = element.text.lower()
-                            element_aria = (element.get_attribute('aria-label') or '').lower()
-                            element_title = (element.get_attribute('title') or '').lower()
-                            
-                            close_keywords = ['close', 'dismiss', 'ok', 'got it', 'continue', '×', 'x']
-                            
-                            if any(keyword in element_text or keyword in element_aria or keyword in element_title 
-                                   for keyword in close_keywords):
-                                
-                                print(f"   🖱️ Closing popup: {element_text or element_aria or element_title or 'Unknown'}")
-                                self.logger.info(f"Closing popup with selector: {selector}")
-                                
-                                # Try multiple click methods
-                                try:
-                                    element.click()
-                                except:
-                                    try:
-                                        self.driver.execute_script("arguments[0].click();", element)
-                                    except:
-                                        self.actions.move_to_element(element).click().perform()
-                                
-                                popup_handled = True
-                                popup_found = True
-                                self.session_stats['errors_handled'] += 1
-                                
-                                # Wait for popup to close
-                                time.sleep(2)
-                                break
+                    label = element_text or element_aria or element_title or 'Unknown'
+                    print(f"   🖱️ Closing popup: {label}")
+                    if log_info:
+                        self.logger.info("Closing popup: %s", label)
                     
-                    if popup_found:
-                        break
-                        
-                except Exception as e:
-                    continue
+                    # Try multiple click methods, cheapest first
+                    try:
+                        self.driver.execute_script("arguments[0].click();", element)
+                    except:
+                        try:
+                            element.click()
+                        except:
+                            try:
+                                self.actions.move_to_element(element).click().perform()
+                            except:
+                                continue
+                    
+                    popup_handled = True
+                    popup_found = True
+                    self.session_stats['errors_handled'] += 1
+                    
+                    # Wait for popup to close
+                    time.sleep(2)
+                    break
             
             # Check for CAPTCHA
             captcha_detected = self.detect_captcha()
@@ -274,48 +840,51 @@ class AdvancedJobApplier:
             if not popup_found:
                 break
             
+            # Only rescan when the close changed the page and something new
+            # showed up; otherwise the next pass would find the same buttons
+            dom_length = self.dom_length()
+            if dom_length == prev_dom_length or not self.popups_pending():
+                break
+            prev_dom_length = dom_length
+            
             # Brief pause before next scan
             time.sleep(1)
         
         if popup_handled:
             print("✅ Popup handling completed")
-            self.logger.info("Popup handling completed")
+            if log_info:
+                self.logger.info("Popup handling completed")
         else:
             print("ℹ️ No popups detected")
         
+        self._last_popup_scan = time.monotonic()
         return popup_handled
     
     def detect_captcha(self):
         """Detect CAPTCHA and handle appropriately"""
-        captcha_selectors = [
-            'iframe[src*="captcha"]',
-            'iframe[src*="recaptcha"]',
-            '.captcha',
-            '.recaptcha',
-            '#captcha',
-            '[data-captcha]',
-            'img[src*="captcha"]'
-        ]
-        
-        for selector in captcha_selectors:
-            try:
-                captcha_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if any(elem.is_displayed() for elem in captcha_elements):
-                    print("🤖 CAPTCHA detected!")
-                    self.logger.warning("CAPTCHA detected - pausing for manual completion")
-                    self.session_stats['captchas_detected'] += 1
-                    
-                    print("⏸️ CAPTCHA DETECTED - Manual intervention required")
-                    print("📋 Please complete the CAPTCHA in the browser window")
-                    print("⌨️ Press ENTER after completing the CAPTCHA...")
-                    
-                    input()  # Wait for user to complete CAPTCHA
-                    
-                    print("✅ Continuing after CAPTCHA completion")
-                    self.logger.info("Continuing after CAPTCHA completion")
-                    return True
-            except:
-                continue
+        try:
+            captcha_elements = self.driver.find_elements(By.CSS_SELECTOR, self.CAPTCHA_CSS)
+            if not captcha_elements:
+                return False
+            
+            # Visibility of all matches in one round-trip
+            states = self.driver.execute_script(self.ELEMENT_STATE_JS, captcha_elements)
+            if any(visible for visible, *_ in states):
+                print("🤖 CAPTCHA detected!")
+                self.logger.warning("CAPTCHA detected - pausing for manual completion")
+                self.session_stats['captchas_detected'] += 1
+                
+                print("⏸️ CAPTCHA DETECTED - Manual intervention required")
+                print("📋 Please complete the CAPTCHA in the browser window")
+                print("⌨️ Press ENTER after completing the CAPTCHA...")
+                
+                input()  # Wait for user to complete CAPTCHA
+                
+                print("✅ Continuing after CAPTCHA completion")
+                self.logger.info("Continuing after CAPTCHA completion")
+                return True
+        except:
+            pass
         
         return False
     
@@ -324,21 +893,21 @@ class AdvancedJobApplier:
         for attempt in range(max_retries):
             try:
                 print(f"🔗 Navigating to: {url} (attempt {attempt + 1})")
-                self.logger.info(f"Navigating to: {url} (attempt {attempt + 1})")
+                self.logger.info("Navigating to: %s (attempt %s)", url, attempt + 1)
                 
                 self.driver.get(url)
-                self.human_delay('action_delay')
+                self.wait_for_idle()
                 
                 # Handle any popups that appear after navigation
                 self.detect_and_handle_popups()
                 
                 print(f"✅ Successfully navigated to: {self.driver.title}")
-                self.logger.info(f"Successfully navigated to: {self.driver.title}")
+                self.logger.info("Successfully navigated to: %s", self.driver.title)
                 return True
                 
             except WebDriverException as e:
                 print(f"⚠️ Navigation attempt {attempt + 1} failed: {str(e)}")
-                self.logger.warning(f"Navigation attempt {attempt + 1} failed: {str(e)}")
+                self.logger.warning("Navigation attempt %s failed: %s", attempt + 1, e)
                 
                 if attempt < max_retries - 1:
                     wait_time = (attempt + 1) * 2  # Exponential backoff
@@ -355,79 +924,117 @@ class AdvancedJobApplier:
         """Click element with error handling and retries"""
         for attempt in range(max_retries):
             try:
-                # Scroll element into view
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                self.human_delay('scroll_delay')
-                
-                # Wait for element to be clickable
-                self.wait.until(EC.element_to_be_clickable(element))
-                
-                # Add human-like mouse movement
-                self.actions.move_to_element(element).perform()
+                # Scroll into view and click in one round-trip; the script
+                # reports back when the element can't take a plain click
                 self.human_delay('click_delay')
-                
-                # Try multiple click methods
                 try:
-                    element.click()
+                    result = self.driver.execute_script(self.JS_CLICK_JS, element)
                 except:
-                    try:
-                        self.driver.execute_script("arguments[0].click();", element)
-                    except:
-                        self.actions.move_to_element(element).click().perform()
+                    # Script blocked on this page, fall back to a native click
+                    element.click()
+                    result = 'clicked'
+                
+                if result == 'disabled':
+                    raise WebDriverException(f"{description} is disabled")
+                
+                if result == 'hidden':
+                    # Only revealed on hover (menus, card actions)
+                    self.actions.move_to_element(element).click().perform()
                 
                 print(f"✅ Successfully clicked: {description}")
-                self.logger.info(f"Successfully clicked: {description}")
+                self.logger.info("Successfully clicked: %s", description)
                 
-                # Handle any popups that appear after clicking
-                self.human_delay('action_delay')
+                # Let any resulting page load settle, then handle popups
+                self.wait_for_idle()
                 self.detect_and_handle_popups()
                 
                 return True
                 
             except Exception as e:
                 print(f"⚠️ Click attempt {attempt + 1} failed for {description}: {str(e)}")
-                self.logger.warning(f"Click attempt {attempt + 1} failed for {description}: {str(e)}")
+                self.logger.warning("Click attempt %s failed for %s: %s", attempt + 1, description, e)
                 
                 if attempt < max_retries - 1:
                     time.sleep(1)
                 else:
                     print(f"❌ All click attempts failed for {description}")
-                    self.logger.error(f"All click attempts failed for {description}")
+                    self.logger.error("All click attempts failed for %s", description)
                     return False
         
         return False
     
     def find_element_safe(self, selectors, description="element", timeout=10):
         """Find element with multiple selectors and error handling"""
-        if isinstance(selectors, str):
-            selectors = [selectors]
+        from selenium.webdriver.support.ui import WebDriverWait
         
-        for selector in selectors:
-            try:
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                
-                if element.is_displayed():
-                    print(f"✅ Found {description} with selector: {selector}")
-                    self.logger.info(f"Found {description} with selector: {selector}")
-                    return element
-                    
-            except TimeoutException:
-                continue
-            except Exception as e:
-                self.logger.warning(f"Error finding {description} with selector {selector}: {str(e)}")
-                continue
+        selectors = (selectors,) if isinstance(selectors, str) else tuple(selectors)
+        tagged = _tag_selectors(selectors)
+        
+        # Every selector is tried in list order inside one script, so a poll
+        # is a single round-trip and earlier selectors keep their priority
+        def find_visible(driver):
+            return driver.execute_script(self.FIRST_VISIBLE_MATCH_JS, tagged)
+        
+        try:
+            # A single wait for any visible match instead of one wait per selector
+            index, element = WebDriverWait(self.driver, timeout, ignored_exceptions=(StaleElementReferenceException,)).until(find_visible)
+            
+            print(f"✅ Found {description}")
+            self.logger.info("Found %s with selector: %s", description, tagged[index][1])
+            return element
+            
+        except TimeoutException:
+            pass
+        except Exception as e:
+            self.logger.warning("Error finding %s: %s", description, e)
         
         print(f"❌ Could not find {description}")
-        self.logger.error(f"Could not find {description}")
+        self.logger.error("Could not find %s", description)
         return None
     
+    def url_matches_indicators(self, url, platform_config):
+        """Check whether any URL path segment is one of the platform's success indicators"""
+        segments = set(urlsplit(url).path.lower().strip('/').split('/'))
+        return not segments.isdisjoint(platform_config.get('success_indicators', frozenset()))
+    
+    def session_active(self, platform_config):
+        """True if the browser is already logged in to the platform"""
+        # Logged-out visits to this page redirect to the login form
+        self.driver.get(platform_config['session_check_url'])
+        self.wait_for_idle()
+        
+        return self.url_matches_indicators(self.driver.current_url, platform_config)
+    
+    def restore_session(self, platform_config):
+        """Reuse the persisted profile or saved cookies; True if still logged in"""
+        try:
+            # A persisted profile usually still holds the last login
+            if self.fingerprint and self.fingerprint[2] and self.session_active(platform_config):
+                print("🍪 Browser profile is still logged in")
+                self.logger.info("Browser profile is still logged in")
+                return True
+            
+            if not self.load_session_cookies(self.session_cookies_file(), platform_config):
+                return False
+            
+            if self.session_active(platform_config):
+                print("🍪 Restored saved login session")
+                self.logger.info("Restored saved login session")
+                return True
+        except Exception as e:
+            self.logger.warning("Could not restore saved session: %s", e)
+        
+        return False
+    
     def enhanced_login(self, platform_config):
         """Enhanced login with comprehensive error handling"""
         print(f"\n🔐 ENHANCED {platform_config['name'].upper()} LOGIN")
         print("="*50)
         
+        # Skip the login form entirely when saved cookies still work
+        if self.restore_session(platform_config):
+            return True
+        
         # Navigate to login page
         if not self.safe_navigate(platform_config['login_url']):
             return False
@@ -447,7 +1054,7 @@ class AdvancedJobApplier:
                 
                 # Find and fill email field
                 email_field = self.find_element_safe(
-                    platform_config['email_selectors'], 
+                    platform_config['email_selector_union'], 
                     "email field"
                 )
                 
@@ -459,7 +1066,7 @@ class AdvancedJobApplier:
                 
                 # Find and fill password field
                 password_field = self.find_element_safe(
-                    platform_config['password_selectors'],
+                    platform_config['password_selector_union'],
                     "password field"
                 )
                 
@@ -471,7 +1078,7 @@ class AdvancedJobApplier:
                 
                 # Find and click login button
                 login_button = self.find_element_safe(
-                    platform_config['login_button_selectors'],
+                    platform_config['login_button_selector_union'],
                     "login button"
                 )
                 
@@ -496,17 +1103,23 @@ class AdvancedJobApplier:
                 print(f"🌐 Current URL: {current_url}")
                 print(f"📄 Page title: {page_title}")
                 
-                # Check success indicators
-                success_indicators = platform_config.get('success_indicators', [])
-                login_successful = any(indicator in current_url.lower() for indicator in success_indicators)
+                # Check success indicators against URL path segments only, so
+                # query strings like ?ref=jobs-email can't cause false matches
+                login_successful = self.url_matches_indicators(current_url, platform_config)
                 
                 if login_successful:
                     print("🎉 LOGIN SUCCESSFUL!")
                     self.logger.info("Login successful")
+                    
+                    # Save the session so the next run can skip logging in
+                    try:
+                        self.save_session_cookies(self.session_cookies_file())
+                    except Exception as e:
+                        self.logger.warning("Could not save session cookies: %s", e)
                     return True
                 else:
                     print(f"❌ Login attempt {attempt + 1} failed")
-                    self.logger.warning(f"Login attempt {attempt + 1} failed")
+                    self.logger.warning("Login attempt %s failed", attempt + 1)
                     
                     if attempt < max_login_attempts - 1:
                         print("🔄 Retrying login...")
@@ -514,7 +1127,7 @@ class AdvancedJobApplier:
             
             except Exception as e:
                 print(f"❌ Login attempt {attempt + 1} error: {str(e)}")
-                self.logger.error(f"Login attempt {attempt + 1} error: {str(e)}")
+                self.logger.error("Login attempt %s error: %s", attempt + 1, e)
                 
                 if attempt < max_login_attempts - 1:
                     time.sleep(3)
@@ -534,14 +1147,14 @@ class AdvancedJobApplier:
             
             # Look for jobs navigation link
             jobs_nav = self.find_element_safe(
-                platform_config['jobs_nav_selectors'],
+                platform_config['jobs_nav_selector_union'],
                 "jobs navigation"
             )
             
             if jobs_nav:
                 print("🖱️ Clicking Jobs navigation...")
                 if self.safe_click(jobs_nav, "jobs navigation"):
-                    self.human_delay('action_delay')
+                    self.wait_for_idle()
                     print("✅ Successfully navigated to jobs section")
                     self.logger.info("Successfully navigated to jobs section")
                     return True
@@ -555,7 +1168,7 @@ class AdvancedJobApplier:
             
         except Exception as e:
             print(f"❌ Jobs navigation error: {str(e)}")
-            self.logger.error(f"Jobs navigation error: {str(e)}")
+            self.logger.error("Jobs navigation error: %s", e)
             return False
     
     def apply_job_filters(self, search_preferences, platform_config):
@@ -563,6 +1176,9 @@ class AdvancedJobApplier:
         print("\n🔍 APPLYING JOB SEARCH FILTERS")
         print("="*40)
         
+        # Kept for find_jobs, which can list jobs without the rendered page
+        self.search_preferences = dict(search_preferences)
+        
         try:
             # Handle popups
             self.detect_and_handle_popups()
@@ -572,12 +1188,12 @@ class AdvancedJobApplier:
                 print(f"🔍 Searching for: {search_preferences['job_title']}")
                 
                 search_box = self.find_element_safe(
-                    platform_config['search_selectors'],
+                    platform_config['search_selector_union'],
                     "job search box"
                 )
                 
                 if search_box:
-                    self.human_type(search_box, search_preferences['job_title'])
+                    self.fast_fill(search_box, search_preferences['job_title'])
                     self.human_delay('action_delay')
             
             # Location filter
@@ -585,77 +1201,46 @@ class AdvancedJobApplier:
                 print(f"📍 Setting location: {search_preferences['location']}")
                 
                 location_box = self.find_element_safe(
-                    platform_config['location_selectors'],
+                    platform_config['location_selector_union'],
                     "location search box"
                 )
                 
                 if location_box:
-                    self.human_type(location_box, search_preferences['location'])
+                    self.fast_fill(location_box, search_preferences['location'])
                     self.human_delay('action_delay')
             
             # Apply search
             search_button = self.find_element_safe(
-                platform_config['search_button_selectors'],
+                platform_config['search_button_selector_union'],
                 "search button"
             )
             
             if search_button:
                 print("🖱️ Applying search filters...")
                 if self.safe_click(search_button, "search button"):
-                    self.human_delay('action_delay')
+                    self.wait_for_idle()
                     print("✅ Search filters applied successfully")
                     return True
             
             # Alternative: press Enter in search box
             if search_preferences.get('job_title') and search_box:
+                from selenium.webdriver.common.keys import Keys
+                
                 print("⌨️ Pressing Enter to search...")
                 search_box.send_keys(Keys.RETURN)
-                self.human_delay('action_delay')
+                self.wait_for_idle()
                 return True
             
             return False
             
         except Exception as e:
             print(f"❌ Filter application error: {str(e)}")
-            self.logger.error(f"Filter application error: {str(e)}")
+            self.logger.error("Filter application error: %s", e)
             return False
     
     def get_platform_config(self):
         """Get platform-specific configuration"""
-        configs = {
-            'linkedin': {
-                'name': 'LinkedIn',
-                'login_url': 'https://www.linkedin.com/login',
-                'jobs_url': 'https://www.linkedin.com/jobs/',
-                'email': config.LINKEDIN_EMAIL,
-                'password': config.LINKEDIN_PASSWORD,
-                'email_selectors': ['#username', 'input[name="session_key"]', 'input[type="email"]'],
-                'password_selectors': ['#password', 'input[name="session_password"]', 'input[type="password"]'],
-                'login_button_selectors': ['button[type="submit"]', '.btn__primary--large', 'button[aria-label*="Sign in"]'],
-                'success_indicators': ['feed', 'mynetwork', 'jobs', 'messaging'],
-                'jobs_nav_selectors': ['a[href*="/jobs"]', 'nav a:contains("Jobs")', '.global-nav__primary-link[href*="jobs"]'],
-                'search_selectors': ['input[aria-label*="Search by title"]', '.jobs-search-box__text-input', '#jobs-search-box-keyword'],
-                'location_selectors': ['input[aria-label*="City"]', '.jobs-search-box__text-input[placeholder*="City"]', '#jobs-search-box-location'],
-                'search_button_selectors': ['button[aria-label*="Search"]', '.jobs-search-box__submit-button', 'button[type="submit"]']
-            },
-            'internshala': {
-                'name': 'Internshala',
-                'login_url': 'https://internshala.com/login',
-                'jobs_url': 'https://internshala.com/internships',
-                'email': config.INTERNSHALA_EMAIL,
-                'password': config.INTERNSHALA_PASSWORD,
-                'email_selectors': ['#email', 'input[name="email"]', 'input[type="email"]'],
-                'password_selectors': ['#password', 'input[name="password"]', 'input[type="password"]'],
-                'login_button_selectors': ['button[type="submit"]', '.login-btn', '#login_submit'],
-                'success_indicators': ['dashboard', 'student', 'internships'],
-                'jobs_nav_selectors': ['a[href*="internships"]', 'nav a:contains("Internships")'],
-                'search_selectors': ['#search_internships', 'input[placeholder*="search"]', '.search-input'],
-                'location_selectors': ['#location_filter', 'input[placeholder*="location"]', '.location-filter'],
-                'search_button_selectors': ['button[type="submit"]', '.search-btn', 'input[type="submit"]']
-            }
-        }
-        
-        return configs.get(self.platform, configs['linkedin'])
+        return self.platform_config
 
     def find_jobs(self, platform_config, max_jobs=10):
         """Find job listings with error handling"""
@@ -663,6 +1248,22 @@ class AdvancedJobApplier:
         print("="*50)
 
         try:
+            # LinkedIn serves plain HTML job cards to guests; parsing those is
+            # far cheaper than waiting on the rendered search page
+            if self.platform == 'linkedin' and self.search_preferences.get('job_title'):
+                jobs = self.fetch_linkedin_guest_jobs(
+                    self.search_preferences['job_title'],
+                    self.search_preferences.get('location', ''),
+                    max_jobs
+                )
+                if jobs:
+                    print(f"✅ Found {len(jobs)} job listings")
+                    for job_info in jobs:
+                        print(f"   {job_info['index']}. {job_info['title']} at {job_info['company']}")
+
+                    self.session_stats['jobs_found'] = len(jobs)
+                    return jobs
+
             # Handle popups
             self.detect_and_handle_popups()
 
@@ -670,33 +1271,31 @@ class AdvancedJobApplier:
             time.sleep(3)
 
             # Platform-specific job card selectors
-            job_selectors = {
-                'linkedin': [
-                    '.job-card-container',
-                    '.jobs-search-results__list-item',
-                    '.job-card-list__entity',
-                    'a[href*="/jobs/view/"]'
-                ],
-                'internshala': [
-                    '.individual_internship',
-                    '.internship_meta',
-                    '.job-card',
-                    'a[href*="/internship/detail/"]'
-                ]
-            }
+            selectors = _JOB_CARD_SELECTORS.get(self.platform, _JOB_CARD_SELECTORS['linkedin'])
+
+            # Read every card's fields in one script instead of several
+            # find_element/text/get_attribute round-trips per card
+            jobs = self.read_job_cards(selectors, max_jobs)
+            if jobs is not None:
+                if not jobs:
+                    print("❌ No job listings found")
+                    return []
 
-            selectors = job_selectors.get(self.platform, job_selectors['linkedin'])
+                print(f"✅ Found {len(jobs)} job listings")
+                for job_info in jobs:
+                    print(f"   {job_info['index']}. {job_info['title']} at {job_info['company']}")
+
+                self.session_stats['jobs_found'] = len(jobs)
+                print(f"\n✅ Successfully extracted {len(jobs)} job details")
+                return jobs
 
             jobs_found = []
             for selector in selectors:
-                try:
-                    job_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if len(job_elements) > 0:
-                        print(f"✅ Found {len(job_elements)} job listings")
-                        jobs_found = job_elements[:max_jobs]
-                        break
-                except:
-                    continue
+                job_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                if job_elements:
+                    print(f"✅ Found {len(job_elements)} job listings")
+                    jobs_found = job_elements[:max_jobs]
+                    break
 
             if not jobs_found:
                 print("❌ No job listings found")
@@ -711,7 +1310,7 @@ class AdvancedJobApplier:
                         jobs.append(job_info)
                         print(f"   {i}. {job_info['title']} at {job_info['company']}")
                 except Exception as e:
-                    self.logger.warning(f"Error extracting job {i}: {str(e)}")
+                    self.logger.warning("Error extracting job %s: %s", i, e)
 
             self.session_stats['jobs_found'] = len(jobs)
             print(f"\n✅ Successfully extracted {len(jobs)} job details")
@@ -719,9 +1318,104 @@ class AdvancedJobApplier:
 
         except Exception as e:
             print(f"❌ Job finding error: {str(e)}")
-            self.logger.error(f"Job finding error: {str(e)}")
+            self.logger.error("Job finding error: %s", e)
             return []
 
+    def fetch_linkedin_guest_jobs(self, keywords, location, max_jobs):
+        """List LinkedIn jobs from the guest search endpoint without the browser
+
+        Returns None when the endpoint refuses or fails so the caller can
+        fall back to the rendered search page.
+        """
+        try:
+            import requests
+            import lxml.html
+        except ImportError as e:
+            self.logger.warning("Guest job search unavailable: %s", e)
+            return None
+        
+        # The guest endpoint is unauthenticated, so the logged-in session's
+        # cookies are deliberately not sent with it
+        headers = {'User-Agent': self.fingerprint[0] if self.fingerprint else _UA_TUPLE[0]}
+
+        jobs = []
+        with requests.Session() as session:
+            while len(jobs) < max_jobs:
+                try:
+                    response = session.get(
+                        self.LINKEDIN_GUEST_JOBS_URL,
+                        params={'keywords': keywords, 'location': location, 'start': len(jobs)},
+                        headers=headers,
+                        timeout=15
+                    )
+                except requests.RequestException as e:
+                    self.logger.warning("Guest job search failed: %s", e)
+                    return jobs or None
+
+                if response.status_code == 429:
+                    self.logger.warning("Guest job search rate limited, using the search page")
+                    return jobs or None
+                if response.status_code != 200 or not response.text.strip():
+                    break
+
+                cards = lxml.html.fromstring(response.text).xpath('//div[contains(@class, "base-card")]')
+                if not cards:
+                    break
+
+                found_before = len(jobs)
+                for card in cards[:max_jobs - len(jobs)]:
+                    links = card.xpath('.//a[contains(@class, "base-card__full-link")]/@href') or card.xpath('.//a/@href')
+                    if not links:
+                        continue
+
+                    index = len(jobs) + 1
+                    jobs.append({
+                        'index': index,
+                        'title': card.xpath('normalize-space(.//h3[contains(@class, "base-search-card__title")])') or f"LinkedIn Job {index}",
+                        'company': card.xpath('normalize-space(.//h4[contains(@class, "base-search-card__subtitle")])') or "Company",
+                        'location': card.xpath('normalize-space(.//span[contains(@class, "job-search-card__location")])') or "Remote",
+                        'url': normalize_job_url(links[0]),
+                        'platform': 'linkedin'
+                    })
+
+                if len(jobs) == found_before:
+                    break
+
+        self.logger.info("Guest job search returned %s jobs", len(jobs))
+        return jobs or None
+
+    def read_job_cards(self, card_selectors, max_jobs):
+        """Extract title/company/location/url for all job cards in one call
+
+        Returns None when the script can't run so the caller can fall back
+        to per-element extraction.
+        """
+        fields = self.CARD_FIELD_SELECTORS.get(self.platform, {'title': '', 'company': '', 'location': ''})
+
+        try:
+            cards = self.driver.execute_script(self.JOB_CARDS_JS, card_selectors, max_jobs, fields)
+        except Exception as e:
+            self.logger.warning("Batched job card extraction failed: %s", e)
+            return None
+
+        jobs = []
+        for index, card in enumerate(cards, 1):
+            location = card['location']
+            # LinkedIn's first metadata item is sometimes the posting age
+            if self.platform == 'linkedin' and 'ago' in location.lower():
+                location = ""
+
+            jobs.append({
+                'index': index,
+                'title': card['title'] or f"{self.DEFAULT_JOB_TITLES.get(self.platform, 'Job')} {index}",
+                'company': card['company'] or "Company",
+                'location': location or "Remote",
+                'url': card['url'],
+                'platform': self.platform
+            })
+
+        return jobs
+
     def extract_job_info(self, job_element, index, platform_config):
         """Extract job information from element"""
         try:
@@ -734,32 +1428,20 @@ class AdvancedJobApplier:
                 return self.extract_generic_job_info(job_element, index)
 
         except Exception as e:
-            self.logger.warning(f"Error extracting job info: {str(e)}")
+            self.logger.warning("Error extracting job info: %s", e)
             return None
 
     def extract_linkedin_job_info(self, job_element, index):
         """Extract LinkedIn job information"""
         try:
             # Find title and URL
-            title_selectors = [
-                '.job-card-list__title a',
-                '.job-card-container__link',
-                'a[data-control-name="job_card_title"]',
-                'h3 a'
-            ]
-
             title = f"LinkedIn Job {index}"
             job_url = ""
 
-            for selector in title_selectors:
-                try:
-                    title_elem = job_element.find_element(By.CSS_SELECTOR, selector)
-                    title = title_elem.text.strip()
-                    job_url = title_elem.get_attribute('href')
-                    if title and job_url:
-                        break
-                except:
-                    continue
+            title_elems = job_element.find_elements(By.CSS_SELECTOR, self.LINKEDIN_TITLE_SEL)
+            if title_elems:
+                title = title_elems[0].text.strip() or title
+                job_url = title_elems[0].get_attribute('href') or ""
 
             # If job_element is a link itself
             if not job_url and job_element.tag_name == 'a':
@@ -767,31 +1449,18 @@ class AdvancedJobApplier:
                 title = job_element.text.strip() or f"LinkedIn Job {index}"
 
             # Find company
-            company_selectors = [
-                '.job-card-container__company-name',
-                '.job-card-list__company-name',
-                'a[data-control-name="job_card_company_link"]'
-            ]
-
             company = "Company"
-            for selector in company_selectors:
-                try:
-                    company_elem = job_element.find_element(By.CSS_SELECTOR, selector)
-                    company = company_elem.text.strip()
-                    if company:
-                        break
-                except:
-                    continue
+            company_elems = job_element.find_elements(By.CSS_SELECTOR, self.LINKEDIN_COMPANY_SEL)
+            if company_elems:
+                company = company_elems[0].text.strip() or company
 
             # Find location
             location = "Remote"
-            try:
-                location_elem = job_element.find_element(By.CSS_SELECTOR, '.job-card-container__metadata-item')
-                location_text = location_elem.text.strip()
+            location_elems = job_element.find_elements(By.CSS_SELECTOR, self.LINKEDIN_LOCATION_SEL)
+            if location_elems:
+                location_text = location_elems[0].text.strip()
                 if location_text and 'ago' not in location_text.lower():
                     location = location_text
-            except:
-                pass
 
             return {
                 'index': index,
@@ -799,8 +1468,7 @@ class AdvancedJobApplier:
                 'company': company,
                 'location': location,
                 'url': job_url,
-                'platform': 'linkedin',
-                'element': job_element
+                'platform': 'linkedin'
             }
 
         except Exception as e:
@@ -810,50 +1478,25 @@ class AdvancedJobApplier:
         """Extract Internshala job information"""
         try:
             # Find title and URL
-            title_selectors = [
-                '.job-title a',
-                '.profile h3 a',
-                'h3 a',
-                'h4 a'
-            ]
-
             title = f"Internship {index}"
             job_url = ""
 
-            for selector in title_selectors:
-                try:
-                    title_elem = job_element.find_element(By.CSS_SELECTOR, selector)
-                    title = title_elem.text.strip()
-                    job_url = title_elem.get_attribute('href')
-                    if title and job_url:
-                        break
-                except:
-                    continue
+            title_elems = job_element.find_elements(By.CSS_SELECTOR, self.INTERNSHALA_TITLE_SEL)
+            if title_elems:
+                title = title_elems[0].text.strip() or title
+                job_url = title_elems[0].get_attribute('href') or ""
 
             # Find company
-            company_selectors = [
-                '.company-name',
-                '.company h4 a',
-                'a[href*="company"]'
-            ]
-
             company = "Company"
-            for selector in company_selectors:
-                try:
-                    company_elem = job_element.find_element(By.CSS_SELECTOR, selector)
-                    company = company_elem.text.strip()
-                    if company:
-                        break
-                except:
-                    continue
+            company_elems = job_element.find_elements(By.CSS_SELECTOR, self.INTERNSHALA_COMPANY_SEL)
+            if company_elems:
+                company = company_elems[0].text.strip() or company
 
             # Find location
             location = "Remote"
-            try:
-                location_elem = job_element.find_element(By.CSS_SELECTOR, '.locations span, .location_link')
-                location = location_elem.text.strip()
-            except:
-                pass
+            location_elems = job_element.find_elements(By.CSS_SELECTOR, self.INTERNSHALA_LOCATION_SEL)
+            if location_elems:
+                location = location_elems[0].text.strip()
 
             return {
                 'index': index,
@@ -861,8 +1504,7 @@ class AdvancedJobApplier:
                 'company': company,
                 'location': location,
                 'url': job_url if job_url and job_url.startswith('http') else f"https://internshala.com{job_url}" if job_url else "",
-                'platform': 'internshala',
-                'element': job_element
+                'platform': 'internshala'
             }
 
         except Exception as e:
@@ -880,8 +1522,7 @@ class AdvancedJobApplier:
                 'company': "Company",
                 'location': "Location",
                 'url': job_url,
-                'platform': self.platform,
-                'element': job_element
+                'platform': self.platform
             }
 
         except Exception as e:
@@ -896,10 +1537,21 @@ class AdvancedJobApplier:
 
         for i, job in enumerate(jobs, 1):
             print(f"\n🎯 Applying to job {i}/{len(jobs)}: {job['title']}")
-            self.logger.info(f"Applying to job {i}: {job['title']} at {job['company']}")
+            self.logger.info("Applying to job %s: %s at %s", i, job['title'], job['company'])
+
+            # Duplicates never touch the browser, so they don't need a delay either
+            if job['url'] and self.job_url_hash(job['url']) in self.applied_hashes:
+                print("   ⏭️ Already applied to this job, skipping")
+                continue
 
             try:
-                if self.apply_to_single_job(job, platform_config):
+                captchas_before = self.session_stats['captchas_detected']
+                success = self.apply_to_single_job(job, platform_config)
+                if success is None:
+                    self.session_stats['jobs_skipped'] += 1
+                    continue
+
+                if success:
                     applications_made += 1
                     self.session_stats['applications_successful'] += 1
                     print(f"   ✅ Application successful!")
@@ -908,27 +1560,131 @@ class AdvancedJobApplier:
                     print(f"   ❌ Application failed")
 
                 self.session_stats['jobs_applied'] += 1
+                self.adjust_backoff(success, self.session_stats['captchas_detected'] > captchas_before)
 
                 # Human-like delay between applications
                 if i < len(jobs):
-                    delay = random.randint(30, 60)
-                    print(f"   ⏳ Waiting {delay} seconds before next application...")
+                    delay = self.application_delay()
+                    print(f"   ⏳ Waiting {delay:.1f} seconds before next application...", flush=True)
                     time.sleep(delay)
 
             except Exception as e:
                 print(f"   ❌ Application error: {str(e)}")
-                self.logger.error(f"Application error for job {i}: {str(e)}")
+                self.logger.error("Application error for job %s: %s", i, e)
                 self.session_stats['applications_failed'] += 1
 
+            sys.stdout.flush()
+
         return applications_made
 
+    def application_delay(self):
+        """Seconds to wait before the next application, with jitter"""
+        return self.current_delay + random.uniform(0, self.current_delay * 0.3)
+
+    def adjust_backoff(self, success, captcha_seen):
+        """Back off after a CAPTCHA, ease back towards the minimum after a success"""
+        if captcha_seen:
+            self.current_delay = min(self.current_delay * 2, 120)
+        elif success:
+            self.current_delay = max(self.current_delay * 0.8, 2)
+
+    def apply_to_jobs_parallel(self, jobs, platform_config, max_workers=2):
+        """Apply to jobs from several browsers, one per worker process"""
+        # Drop duplicates up front, as the serial loop does, so no worker
+        # opens a job that is already in the history
+        new_jobs = [
+            job for job in jobs
+            if not (job['url'] and self.job_url_hash(job['url']) in self.applied_hashes)
+        ]
+        if len(new_jobs) < len(jobs):
+            print(f"   ⏭️ Already applied to {len(jobs) - len(new_jobs)} of these jobs, skipping them")
+        jobs = new_jobs
+        
+        if max_workers <= 1 or len(jobs) <= 1:
+            return self.apply_to_jobs(jobs, platform_config)
+        
+        print(f"\n📝 APPLYING TO {len(jobs)} JOBS WITH {max_workers} BROWSERS")
+        print("="*50)
+        
+        # Workers start with fresh browsers, so hand them this session's login
+        cookies_file = self.session_cookies_file()
+        self.save_session_cookies(cookies_file)
+        
+        applications_made = 0
+        
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_apply_worker,
+            initargs=(self.platform, str(cookies_file))
+        ) as executor:
+            for i, (job, success) in enumerate(zip(jobs, executor.map(_apply_in_worker, jobs)), 1):
+                if success is None:
+                    self.session_stats['jobs_skipped'] += 1
+                    print(f"   ⏭️ {i}. {job['title']} - already applied, skipped", flush=True)
+                    continue
+                
+                self.session_stats['jobs_applied'] += 1
+                
+                if success:
+                    applications_made += 1
+                    self.session_stats['applications_successful'] += 1
+                    print(f"   ✅ {i}. {job['title']} - application successful!", flush=True)
+                else:
+                    self.session_stats['applications_failed'] += 1
+                    print(f"   ❌ {i}. {job['title']} - application failed", flush=True)
+        
+        return applications_made
+    
+    def session_cookies_file(self):
+        """Path of the saved login cookies for this platform"""
+        return Path(_cfg.get_config().BROWSER_PROFILE_PATH) / f'{self.platform}_session.json'
+    
+    def save_session_cookies(self, cookies_file):
+        """Save the browser's cookies so another browser can reuse the login"""
+        cookies_file = Path(cookies_file)
+        cookies_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(cookies_file, 'w') as f:
+            json.dump(self.driver.get_cookies(), f)
+        
+        self.logger.info("Saved session cookies to %s", cookies_file)
+    
+    def load_session_cookies(self, cookies_file, platform_config):
+        """Restore cookies saved by save_session_cookies"""
+        cookies_file = Path(cookies_file)
+        if not cookies_file.exists():
+            return False
+        
+        with open(cookies_file) as f:
+            cookies = json.load(f)
+        
+        # Cookies can only be set for the domain that is currently loaded
+        self.driver.get(platform_config['jobs_url'])
+        
+        loaded = 0
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+                loaded += 1
+            except WebDriverException:
+                continue
+        
+        self.logger.info("Loaded %s session cookies from %s", loaded, cookies_file)
+        return loaded > 0
+    
     def apply_to_single_job(self, job, platform_config):
-        """Apply to a single job with error handling"""
+        """Apply to a single job; True/False for the outcome, None when it was skipped"""
         try:
             if not job['url']:
                 print("   ⚠️ No job URL available")
                 return False
 
+            # Skip postings applied to in this or an earlier session
+            if self.job_url_hash(job['url']) in self.applied_hashes:
+                print("   ⏭️ Already applied to this job, skipping")
+                self.logger.info("Skipping already applied job: %s", job['url'])
+                return None
+
             # Navigate to job page
             print("   🌐 Opening job page...")
             if not self.safe_navigate(job['url']):
@@ -936,28 +1692,26 @@ class AdvancedJobApplier:
 
             # Platform-specific application logic
             if self.platform == 'linkedin':
-                return self.apply_linkedin_job(job)
+                applied = self.apply_linkedin_job(job)
             elif self.platform == 'internshala':
-                return self.apply_internshala_job(job)
+                applied = self.apply_internshala_job(job)
             else:
-                return self.apply_generic_job(job)
+                applied = self.apply_generic_job(job)
+
+            if applied:
+                self.record_application(job['url'])
+            return applied
 
         except Exception as e:
             print(f"   ❌ Single job application error: {str(e)}")
-            self.logger.error(f"Single job application error: {str(e)}")
+            self.logger.error("Single job application error: %s", e)
             return False
 
     def apply_linkedin_job(self, job):
         """Apply to LinkedIn job"""
         try:
             # Look for Easy Apply button
-            easy_apply_selectors = [
-                'button[aria-label*="Easy Apply"]',
-                '.jobs-apply-button',
-                'button[data-control-name="jobdetails_topcard_inapply"]'
-            ]
-
-            easy_apply_button = self.find_element_safe(easy_apply_selectors, "Easy Apply button")
+            easy_apply_button = self.find_element_safe(self.LINKEDIN_EASY_APPLY_SEL, "Easy Apply button")
 
             if easy_apply_button and 'easy apply' in easy_apply_button.text.lower():
                 print("   🖱️ Clicking Easy Apply...")
@@ -979,6 +1733,8 @@ class AdvancedJobApplier:
             max_steps = 5
             current_step = 1
 
+            cover_letter = self.LINKEDIN_COVER_TPL.substitute(company=job['company'], title=job['title'])
+
             while current_step <= max_steps:
                 print(f"   📋 Easy Apply step {current_step}...")
 
@@ -990,17 +1746,10 @@ class AdvancedJobApplier:
                 for textarea in text_areas:
                     if textarea.is_displayed() and not textarea.get_attribute('value'):
                         print("   ✍️ Filling cover letter...")
-                        cover_letter = f"Dear {job['company']} Team,\n\nI am excited to apply for the {job['title']} position. I believe my skills and enthusiasm make me a great fit for this role.\n\nThank you for considering my application.\n\nBest regards"
                         self.human_type(textarea, cover_letter)
 
                 # Look for Next button
-                next_selectors = [
-                    'button[aria-label="Continue to next step"]',
-                    'button[data-control-name="continue_unify"]',
-                    'button:contains("Next")'
-                ]
-
-                next_button = self.find_element_safe(next_selectors, "Next button", timeout=5)
+                next_button = self.find_element_safe(self.LINKEDIN_NEXT_SEL, "Next button", timeout=5)
                 if next_button and ('next' in next_button.text.lower() or 'continue' in next_button.text.lower()):
                     print(f"   🖱️ Clicking: {next_button.text}")
                     if self.safe_click(next_button, "Next button"):
@@ -1008,13 +1757,7 @@ class AdvancedJobApplier:
                         continue
 
                 # Look for Submit button
-                submit_selectors = [
-                    'button[aria-label*="Submit application"]',
-                    'button[data-control-name="submit_unify"]',
-                    'button:contains("Submit")'
-                ]
-
-                submit_button = self.find_element_safe(submit_selectors, "Submit button", timeout=5)
+                submit_button = self.find_element_safe(self.LINKEDIN_SUBMIT_SEL, "Submit button", timeout=5)
                 if submit_button and 'submit' in submit_button.text.lower():
                     print("   🚀 Submitting LinkedIn application...")
                     if self.safe_click(submit_button, "Submit button"):
@@ -1034,14 +1777,7 @@ class AdvancedJobApplier:
         """Apply to Internshala job"""
         try:
             # Look for apply button
-            apply_selectors = [
-                '.apply_now_button',
-                '.btn-primary',
-                'button[contains(text(), "Apply")]',
-                'a[contains(text(), "Apply")]'
-            ]
-
-            apply_button = self.find_element_safe(apply_selectors, "Apply button")
+            apply_button = self.find_element_safe(self.INTERNSHALA_APPLY_SEL, "Apply button")
 
             if apply_button and 'apply' in apply_button.text.lower():
                 print("   🖱️ Clicking Apply button...")
@@ -1064,27 +1800,14 @@ class AdvancedJobApplier:
             self.detect_and_handle_popups()
 
             # Fill cover letter
-            cover_letter_selectors = [
-                'textarea[name*="cover"]',
-                'textarea[placeholder*="cover"]',
-                'textarea'
-            ]
-
-            cover_letter_field = self.find_element_safe(cover_letter_selectors, "cover letter field", timeout=5)
+            cover_letter_field = self.find_element_safe(self.INTERNSHALA_COVER_LETTER_SEL, "cover letter field", timeout=5)
             if cover_letter_field:
                 print("   ✍️ Writing cover letter...")
-                cover_letter_text = f"Dear {job['company']} Team,\n\nI am excited to apply for the {job['title']} position. As a motivated individual, I am eager to contribute to your team and gain valuable experience.\n\nThank you for considering my application.\n\nBest regards"
+                cover_letter_text = self.INTERNSHALA_COVER_TPL.substitute(company=job['company'], title=job['title'])
                 self.human_type(cover_letter_field, cover_letter_text)
 
             # Submit application
-            submit_selectors = [
-                'button[type="submit"]',
-                '.submit-btn',
-                'input[type="submit"]',
-                'button[contains(text(), "Submit")]'
-            ]
-
-            submit_button = self.find_element_safe(submit_selectors, "Submit button")
+            submit_button = self.find_element_safe(self.INTERNSHALA_SUBMIT_SEL, "Submit button")
             if submit_button:
                 print("   🚀 Submitting Internshala application...")
                 if self.safe_click(submit_button, "Submit button"):
@@ -1104,15 +1827,7 @@ class AdvancedJobApplier:
             print("   📝 Attempting generic job application...")
 
             # Look for common apply button patterns
-            apply_selectors = [
-                'button[contains(text(), "Apply")]',
-                'a[contains(text(), "Apply")]',
-                '.apply-btn',
-                '.apply-button',
-                'input[value*="Apply"]'
-            ]
-
-            apply_button = self.find_element_safe(apply_selectors, "Apply button")
+            apply_button = self.find_element_safe(self.GENERIC_APPLY_SEL, "Apply button")
             if apply_button:
                 print("   🖱️ Clicking Apply button...")
                 return self.safe_click(apply_button, "Apply button")
@@ -1136,6 +1851,7 @@ class AdvancedJobApplier:
         print(f"📝 Jobs Applied To: {self.session_stats['jobs_applied']}")
         print(f"✅ Successful Applications: {self.session_stats['applications_successful']}")
         print(f"❌ Failed Applications: {self.session_stats['applications_failed']}")
+        print(f"⏭️ Already Applied (Skipped): {self.session_stats['jobs_skipped']}")
         print(f"🛡️ Errors Handled: {self.session_stats['errors_handled']}")
         print(f"🤖 CAPTCHAs Detected: {self.session_stats['captchas_detected']}")
         
@@ -1143,17 +1859,83 @@ class AdvancedJobApplier:
             success_rate = (self.session_stats['applications_successful'] / self.session_stats['jobs_applied']) * 100
             print(f"📈 Success Rate: {success_rate:.1f}%")
         
-        print("="*70)
-        self.logger.info(f"Session completed - {self.session_stats}")
+        print("="*70, flush=True)
+        self.logger.info("Session completed - %s", self.session_stats)
     
-    def close(self):
-        """Close browser and cleanup"""
+    def close(self, keep_alive=False):
+        """Release the browser; quit it, or with keep_alive park it in the pool for the next session"""
         if self.driver:
-            self.driver.quit()
-            self.logger.info("Browser closed")
+            if keep_alive:
+                _DRIVER_POOL.setdefault(self.fingerprint, []).append(self.driver)
+                self.logger.info("Browser returned to pool")
+            else:
+                self.driver.quit()
+                self.logger.info("Browser closed")
+            self.driver = None
+        
+        if self.history is not None:
+            self.history.close()
+            self.history = None
+
+# Applier owned by the current process-pool worker
+_worker_applier = None
+
+def _close_worker_applier():
+    """Quit the worker's browser when the worker process exits"""
+    if _worker_applier:
+        _worker_applier.close()
+    stop_log_listener()
+
+def _init_apply_worker(platform, cookies_file):
+    """Process-pool initializer: give each worker its own logged-in browser"""
+    global _worker_applier, _LOG_LISTENER
+    
+    # A forked worker inherits the parent's queue handler but not the
+    # listener thread draining it; drop both so setup_logging starts fresh
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    _LOG_LISTENER = None
+    
+    _worker_applier = AdvancedJobApplier(platform)
+    multiprocessing.util.Finalize(None, _close_worker_applier, exitpriority=10)
+    
+    # The parent's browser holds the profile directory, so workers use
+    # throwaway profiles and log in with the exported cookies instead
+    if _worker_applier.create_stealth_browser(use_profile=False):
+        _worker_applier.load_session_cookies(cookies_file, _worker_applier.get_platform_config())
+
+def _apply_in_worker(job):
+    """Apply to one job from inside a process-pool worker"""
+    applier = _worker_applier
+    if applier is None or applier.driver is None:
+        return False
+    
+    # Keep the human-like gap between this worker's applications
+    if applier.session_stats['jobs_applied'] > 0:
+        time.sleep(applier.application_delay())
+    applier.session_stats['jobs_applied'] += 1
+    
+    captchas_before = applier.session_stats['captchas_detected']
+    try:
+        success = applier.apply_to_single_job(job, applier.get_platform_config())
+    except Exception as e:
+        applier.logger.error("Worker application error: %s", e)
+        success = False
+    
+    applier.adjust_backoff(success, applier.session_stats['captchas_detected'] > captchas_before)
+    sys.stdout.flush()
+    return success
 
 def main():
     """Main function"""
+    # Block-buffer progress output only when it is piped to a file or
+    # another process; a terminal keeps line buffering so progress shows live
+    if hasattr(sys.stdout, 'reconfigure') and not sys.stdout.isatty():
+        sys.stdout.reconfigure(line_buffering=False)
+    
+    _cfg.init_config()
+    
     print("🚀 ADVANCED JOB APPLICATION AUTOMATION SYSTEM")
     print("="*60)
     print("✨ Features:")
@@ -1205,9 +1987,11 @@ def main():
             # Step 7: Find and apply to jobs
             max_applications = int(input("\nHow many jobs to apply to? (default: 5): ").strip() or "5")
 
+            parallel_browsers = int(input("Parallel browsers (default: 1): ").strip() or "1")
+
             jobs = applier.find_jobs(platform_config, max_applications)
             if jobs:
-                applications_made = applier.apply_to_jobs(jobs, platform_config)
+                applications_made = applier.apply_to_jobs_parallel(jobs, platform_config, parallel_browsers)
                 print(f"\n🎉 Applied to {applications_made} jobs successfully!")
             else:
                 print("❌ No jobs found to apply to")
@@ -1220,7 +2004,7 @@ def main():
     
     except Exception as e:
         print(f"\n❌ Unexpected error: {str(e)}")
-        applier.logger.error(f"Unexpected error: {str(e)}")
+        applier.logger.error("Unexpected error: %s", e)
     
     finally:
         applier.print_session_summary()
@@ -4,156 +4,253 @@ Handles environment variables and application settings
 """
 
 import os
+import sys
+import functools
+from dataclasses import dataclass, field, fields
+from typing import Dict, Optional
 from dotenv import load_dotenv
-from typing import Optional
 
-# Load environment variables
-load_dotenv()
+def _env_int(env: Dict[str, str], name: str, default: int) -> int:
+    """Read an integer setting, falling back to the default if it is malformed"""
+    value = env.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        print(f"Warning: {name}={value!r} is not an integer, using {default}")
+        return default
 
+# Values (lower-cased) that switch a boolean setting on
+_TRUTHY = frozenset({'true', 't', 'yes', 'y', 'on', '1'})
+
+def _env_bool(env: Dict[str, str], name: str, default: bool) -> bool:
+    """Read a true/false setting; anything in _TRUTHY (any case) is true"""
+    value = env.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUTHY
+
+def _env_str(env: Dict[str, str], name: str, default: str) -> str:
+    """Read a string setting"""
+    return env.get(name, default)
+
+def _env_csv(env: Dict[str, str], name: str, default: tuple) -> tuple:
+    """Read a comma-separated setting into a tuple of stripped, non-empty items"""
+    value = env.get(name)
+    if value is None:
+        return default
+    return tuple(item.strip() for item in value.split(',') if item.strip())
+
+_ENV_READERS = {int: _env_int, bool: _env_bool, str: _env_str, tuple: _env_csv}
+
+# Directories already created by this process
+_DIRS_CREATED: set = set()
+
+_ERROR_ALREADY_EXISTS = 183
+
+def ensure_dirs(paths) -> None:
+    """
+    Create each directory once per process
+    
+    On Windows a single CreateDirectoryW call replaces the exists/stat/mkdir
+    sequence of os.makedirs; anything other than "already exists" (e.g. a
+    missing parent) falls back to os.makedirs.
+    """
+    for path in paths:
+        if path in _DIRS_CREATED:
+            continue
+        
+        if sys.platform == 'win32':
+            import ctypes
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            if not kernel32.CreateDirectoryW(path, None) and ctypes.get_last_error() != _ERROR_ALREADY_EXISTS:
+                os.makedirs(path, exist_ok=True)
+        else:
+            os.makedirs(path, exist_ok=True)
+        
+        _DIRS_CREATED.add(path)
+
+# Platforms with credential, rate-limit and enable settings
+PLATFORMS = (
+    'LINKEDIN', 'INDEED', 'GLASSDOOR', 'NAUKRI', 'INTERNSHALA',
+    'UNSTOP', 'ANGELLIST', 'DICE', 'MONSTER', 'ZIPRECRUITER'
+)
+
+def _derived(factory):
+    """Field filled in by get_config() from the other settings"""
+    return field(default_factory=factory, metadata={'env': False})
+
+def _fixed(value):
+    """Field default that is not overridable from the environment"""
+    return field(default=value, metadata={'env': False})
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration class"""
+    """Application configuration, built once from the environment by get_config()"""
     
     # API Keys
-    GROQ_API_KEY: str = os.getenv('GROQ_API_KEY', '')
-    OPENAI_API_KEY: str = os.getenv('OPENAI_API_KEY', '')
+    GROQ_API_KEY: str = ''
+    OPENAI_API_KEY: str = ''
     
     # Platform Credentials
-    LINKEDIN_EMAIL: str = os.getenv('LINKEDIN_EMAIL', '')
-    LINKEDIN_PASSWORD: str = os.getenv('LINKEDIN_PASSWORD', '')
-    LINKEDIN_PHONE: str = os.getenv('LINKEDIN_PHONE', '')
+    LINKEDIN_EMAIL: str = ''
+    LINKEDIN_PASSWORD: str = ''
+    LINKEDIN_PHONE: str = ''
 
     # Indeed Credentials
-    INDEED_EMAIL: str = os.getenv('INDEED_EMAIL', '')
-    INDEED_PASSWORD: str = os.getenv('INDEED_PASSWORD', '')
+    INDEED_EMAIL: str = ''
+    INDEED_PASSWORD: str = ''
 
     # Glassdoor Credentials
-    GLASSDOOR_EMAIL: str = os.getenv('GLASSDOOR_EMAIL', '')
-    GLASSDOOR_PASSWORD: str = os.getenv('GLASSDOOR_PASSWORD', '')
+    GLASSDOOR_EMAIL: str = ''
+    GLASSDOOR_PASSWORD: str = ''
 
     # Naukri Credentials
-    NAUKRI_EMAIL: str = os.getenv('NAUKRI_EMAIL', '')
-    NAUKRI_PASSWORD: str = os.getenv('NAUKRI_PASSWORD', '')
+    NAUKRI_EMAIL: str = ''
+    NAUKRI_PASSWORD: str = ''
 
     # Internshala Credentials
-    INTERNSHALA_EMAIL: str = os.getenv('INTERNSHALA_EMAIL', '')
-    INTERNSHALA_PASSWORD: str = os.getenv('INTERNSHALA_PASSWORD', '')
+    INTERNSHALA_EMAIL: str = ''
+    INTERNSHALA_PASSWORD: str = ''
 
     # Unstop Credentials
-    UNSTOP_EMAIL: str = os.getenv('UNSTOP_EMAIL', '')
-    UNSTOP_PASSWORD: str = os.getenv('UNSTOP_PASSWORD', '')
+    UNSTOP_EMAIL: str = ''
+    UNSTOP_PASSWORD: str = ''
 
     # AngelList Credentials
-    ANGELLIST_EMAIL: str = os.getenv('ANGELLIST_EMAIL', '')
-    ANGELLIST_PASSWORD: str = os.getenv('ANGELLIST_PASSWORD', '')
+    ANGELLIST_EMAIL: str = ''
+    ANGELLIST_PASSWORD: str = ''
 
     # Dice Credentials
-    DICE_EMAIL: str = os.getenv('DICE_EMAIL', '')
-    DICE_PASSWORD: str = os.getenv('DICE_PASSWORD', '')
+    DICE_EMAIL: str = ''
+    DICE_PASSWORD: str = ''
 
     # Monster Credentials
-    MONSTER_EMAIL: str = os.getenv('MONSTER_EMAIL', '')
-    MONSTER_PASSWORD: str = os.getenv('MONSTER_PASSWORD', '')
+    MONSTER_EMAIL: str = ''
+    MONSTER_PASSWORD: str = ''
 
     # ZipRecruiter Credentials
-    ZIPRECRUITER_EMAIL: str = os.getenv('ZIPRECRUITER_EMAIL', '')
-    ZIPRECRUITER_PASSWORD: str = os.getenv('ZIPRECRUITER_PASSWORD', '')
+    ZIPRECRUITER_EMAIL: str = ''
+    ZIPRECRUITER_PASSWORD: str = ''
     
     # Email Configuration
-    EMAIL_HOST: str = os.getenv('EMAIL_HOST', 'smtp.gmail.com')
-    EMAIL_PORT: int = int(os.getenv('EMAIL_PORT', '587'))
-    EMAIL_USER: str = os.getenv('EMAIL_USER', '')
-    EMAIL_PASSWORD: str = os.getenv('EMAIL_PASSWORD', '')
+    EMAIL_HOST: str = 'smtp.gmail.com'
+    EMAIL_PORT: int = 587
+    EMAIL_USER: str = ''
+    EMAIL_PASSWORD: str = ''
     
     # Database
-    DATABASE_URL: str = os.getenv('DATABASE_URL', 'sqlite:///job_applications.db')
+    DATABASE_URL: str = 'sqlite:///job_applications.db'
     
     # Application Settings
-    MAX_APPLICATIONS_PER_DAY: int = int(os.getenv('MAX_APPLICATIONS_PER_DAY', '50'))
-    DELAY_BETWEEN_APPLICATIONS: int = int(os.getenv('DELAY_BETWEEN_APPLICATIONS', '30'))
-    ENABLE_NOTIFICATIONS: bool = os.getenv('ENABLE_NOTIFICATIONS', 'true').lower() == 'true'
-    DEBUG_MODE: bool = os.getenv('DEBUG_MODE', 'false').lower() == 'true'
+    MAX_APPLICATIONS_PER_DAY: int = 50
+    DELAY_BETWEEN_APPLICATIONS: int = 30
+    ENABLE_NOTIFICATIONS: bool = True
+    DEBUG_MODE: bool = False
     
     # Browser Settings
-    HEADLESS_MODE: bool = os.getenv('HEADLESS_MODE', 'false').lower() == 'true'
-    BROWSER_PROFILE_PATH: str = os.getenv('BROWSER_PROFILE_PATH', './browser_profiles')
-    ENABLE_STEALTH_MODE: bool = os.getenv('ENABLE_STEALTH_MODE', 'true').lower() == 'true'
+    HEADLESS_MODE: bool = False
+    BROWSER_PROFILE_PATH: str = './browser_profiles'
+    ENABLE_STEALTH_MODE: bool = True
     
     # Job Search Preferences
-    DEFAULT_LOCATION: str = os.getenv('DEFAULT_LOCATION', 'Remote')
-    DEFAULT_EXPERIENCE_LEVEL: str = os.getenv('DEFAULT_EXPERIENCE_LEVEL', 'Mid-Level')
-    DEFAULT_JOB_TYPES: str = os.getenv('DEFAULT_JOB_TYPES', 'Full-time,Contract')
-    DEFAULT_PLATFORMS: str = os.getenv('DEFAULT_PLATFORMS', 'linkedin,indeed,glassdoor')
+    DEFAULT_LOCATION: str = 'Remote'
+    DEFAULT_EXPERIENCE_LEVEL: str = 'Mid-Level'
+    DEFAULT_JOB_TYPES: tuple = ('Full-time', 'Contract')
+    DEFAULT_PLATFORMS: tuple = ('linkedin', 'indeed', 'glassdoor')
 
     # Platform-specific Settings
-    ENABLE_LINKEDIN: bool = os.getenv('ENABLE_LINKEDIN', 'true').lower() == 'true'
-    ENABLE_INDEED: bool = os.getenv('ENABLE_INDEED', 'true').lower() == 'true'
-    ENABLE_GLASSDOOR: bool = os.getenv('ENABLE_GLASSDOOR', 'true').lower() == 'true'
-    ENABLE_NAUKRI: bool = os.getenv('ENABLE_NAUKRI', 'false').lower() == 'true'
-    ENABLE_INTERNSHALA: bool = os.getenv('ENABLE_INTERNSHALA', 'false').lower() == 'true'
-    ENABLE_UNSTOP: bool = os.getenv('ENABLE_UNSTOP', 'false').lower() == 'true'
-    ENABLE_ANGELLIST: bool = os.getenv('ENABLE_ANGELLIST', 'false').lower() == 'true'
-    ENABLE_DICE: bool = os.getenv('ENABLE_DICE', 'false').lower() == 'true'
-    ENABLE_MONSTER: bool = os.getenv('ENABLE_MONSTER', 'false').lower() == 'true'
-    ENABLE_ZIPRECRUITER: bool = os.getenv('ENABLE_ZIPRECRUITER', 'false').lower() == 'true'
+    ENABLE_LINKEDIN: bool = True
+    ENABLE_INDEED: bool = True
+    ENABLE_GLASSDOOR: bool = True
+    ENABLE_NAUKRI: bool = False
+    ENABLE_INTERNSHALA: bool = False
+    ENABLE_UNSTOP: bool = False
+    ENABLE_ANGELLIST: bool = False
+    ENABLE_DICE: bool = False
+    ENABLE_MONSTER: bool = False
+    ENABLE_ZIPRECRUITER: bool = False
 
     # Rate Limiting (requests per minute per platform)
-    LINKEDIN_RATE_LIMIT: int = int(os.getenv('LINKEDIN_RATE_LIMIT', '10'))
-    INDEED_RATE_LIMIT: int = int(os.getenv('INDEED_RATE_LIMIT', '15'))
-    GLASSDOOR_RATE_LIMIT: int = int(os.getenv('GLASSDOOR_RATE_LIMIT', '12'))
-    NAUKRI_RATE_LIMIT: int = int(os.getenv('NAUKRI_RATE_LIMIT', '20'))
-    INTERNSHALA_RATE_LIMIT: int = int(os.getenv('INTERNSHALA_RATE_LIMIT', '15'))
-    UNSTOP_RATE_LIMIT: int = int(os.getenv('UNSTOP_RATE_LIMIT', '10'))
-    ANGELLIST_RATE_LIMIT: int = int(os.getenv('ANGELLIST_RATE_LIMIT', '8'))
-    DICE_RATE_LIMIT: int = int(os.getenv('DICE_RATE_LIMIT', '12'))
-    MONSTER_RATE_LIMIT: int = int(os.getenv('MONSTER_RATE_LIMIT', '15'))
-    ZIPRECRUITER_RATE_LIMIT: int = int(os.getenv('ZIPRECRUITER_RATE_LIMIT', '10'))
+    LINKEDIN_RATE_LIMIT: int = 10
+    INDEED_RATE_LIMIT: int = 15
+    GLASSDOOR_RATE_LIMIT: int = 12
+    NAUKRI_RATE_LIMIT: int = 20
+    INTERNSHALA_RATE_LIMIT: int = 15
+    UNSTOP_RATE_LIMIT: int = 10
+    ANGELLIST_RATE_LIMIT: int = 8
+    DICE_RATE_LIMIT: int = 12
+    MONSTER_RATE_LIMIT: int = 15
+    ZIPRECRUITER_RATE_LIMIT: int = 10
+    
+    # Per-platform views of the settings above, keyed by PLATFORMS entry
+    CREDENTIALS: dict = _derived(dict)  # platform -> (email, password)
+    RATE_LIMITS: dict = _derived(dict)  # platform -> requests per minute
+    ENABLED_PLATFORMS: tuple = _derived(tuple)
     
     # File Paths
-    RESUMES_DIR: str = './data/resumes'
-    COVER_LETTERS_DIR: str = './data/cover_letters'
-    LOGS_DIR: str = './logs'
-    TEMP_DIR: str = './temp'
+    RESUMES_DIR: str = _fixed('./data/resumes')
+    COVER_LETTERS_DIR: str = _fixed('./data/cover_letters')
+    LOGS_DIR: str = _fixed('./logs')
+    TEMP_DIR: str = _fixed('./temp')
     
     # AI Model Settings
-    GROQ_MODEL: str = 'mixtral-8x7b-32768'  # Default Groq model
-    MAX_TOKENS: int = 4000
-    TEMPERATURE: float = 0.7
+    GROQ_MODEL: str = _fixed('mixtral-8x7b-32768')  # Default Groq model
+    MAX_TOKENS: int = _fixed(4000)
+    TEMPERATURE: float = _fixed(0.7)
     
-    @classmethod
-    def validate_config(cls) -> bool:
+    def validate_config(self) -> bool:
         """Validate required configuration"""
-        required_fields = ['GROQ_API_KEY']
-        missing_fields = []
-        
-        for field in required_fields:
-            if not getattr(cls, field):
-                missing_fields.append(field)
-        
-        if missing_fields:
-            print(f"Missing required configuration: {', '.join(missing_fields)}")
+        if not self.GROQ_API_KEY:
+            print("Missing required configuration: GROQ_API_KEY")
             return False
         
         return True
     
-    @classmethod
-    def create_directories(cls) -> None:
-        """Create necessary directories"""
-        directories = [
-            cls.RESUMES_DIR,
-            cls.COVER_LETTERS_DIR,
-            cls.LOGS_DIR,
-            cls.TEMP_DIR,
-            cls.BROWSER_PROFILE_PATH
-        ]
+    def create_directories(self) -> None:
+        """Create necessary directories, skipped once a previous run has left its sentinel"""
+        sentinel = os.path.join(self.TEMP_DIR, '.dirs_initialized')
+        if os.path.exists(sentinel):
+            return
         
-        for directory in directories:
-            os.makedirs(directory, exist_ok=True)
+        ensure_dirs((
+            self.RESUMES_DIR,
+            self.COVER_LETTERS_DIR,
+            self.LOGS_DIR,
+            self.TEMP_DIR,
+            self.BROWSER_PROFILE_PATH
+        ))
+        open(sentinel, 'w').close()
 
-# Initialize configuration
-config = Config()
+@functools.cache
+def get_config() -> Config:
+    """Load .env, snapshot the environment once and build the shared Config"""
+    load_dotenv()
+    env = os.environ.copy()
+    
+    values = {}
+    for f in fields(Config):
+        if f.metadata.get('env', True):
+            values[f.name] = _ENV_READERS[f.type](env, f.name, f.default)
+    
+    values['CREDENTIALS'] = {p: (values[f'{p}_EMAIL'], values[f'{p}_PASSWORD']) for p in PLATFORMS}
+    values['RATE_LIMITS'] = {p: values[f'{p}_RATE_LIMIT'] for p in PLATFORMS}
+    values['ENABLED_PLATFORMS'] = tuple(p for p in PLATFORMS if values[f'ENABLE_{p}'])
+    return Config(**values)
 
-# Validate and create directories on import
-if not config.validate_config():
-    print("Warning: Configuration validation failed. Please check your .env file.")
+def init_config() -> bool:
+    """Validate configuration and create directories; call once at startup"""
+    cfg = get_config()
+    valid = cfg.validate_config()
+    if not valid:
+        print("Warning: Configuration validation failed. Please check your .env file.")
+    
+    cfg.create_directories()
+    return valid
 
-config.create_directories()
+def __getattr__(name: str):
+    # `from config import config` builds the settings on first use, not on import
+    if name == 'config':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,19 +3,35 @@ Demo script to test the Auto Application System functionality
 """
 
 import asyncio
-import json
+import functools
+from collections import Counter
 from pathlib import Path
-from src.automation.auto_application_system import ApplicationManager, ApplicationConfig, ApplicationStatus
+from typing import TYPE_CHECKING
+
+from config import ensure_dirs
+from src.utils.demo_output import buffered_output, dump_json, task_stdout
+
+# The automation stack (selenium, AI clients) is imported by _get_manager on
+# first use, so demos that never build a manager don't pay for it
+if TYPE_CHECKING:
+    from src.automation.auto_application_system import ApplicationManager
+
+# Tracking dashboard row layout
+ROW_FMT = "{title:<25} {company:<20} {score:<8.1%} {status:<12} {applied}"
+
+@functools.lru_cache(maxsize=None)
+def _get_manager(resume_path: str, output_directory: str) -> "ApplicationManager":
+    """Application manager shared by every demo using the same resume and output directory"""
+    from src.automation.auto_application_system import ApplicationManager
+    
+    return ApplicationManager(resume_path=resume_path, output_directory=output_directory)
 
 async def demo_basic_auto_application():
     """Demonstrate basic auto application functionality"""
     print("=== Auto Application System Demo ===\n")
     
     # Initialize application manager
-    manager = ApplicationManager(
-        resume_path="sample_resume.pdf",  # You would use your actual resume
-        output_directory="temp/applications"
-    )
+    manager = _get_manager("sample_resume.pdf", "temp/applications")  # You would use your actual resume
     
     print("🤖 CONFIGURATION:")
     
@@ -73,6 +89,7 @@ async def demo_basic_auto_application():
         print(f"❌ Auto application failed: {str(e)}")
         return None
 
+@buffered_output
 async def demo_application_review_and_approval():
     """Demonstrate application review and approval process"""
     print("\n=== Application Review & Approval Demo ===\n")
@@ -106,14 +123,12 @@ async def demo_application_review_and_approval():
     
     return approval_results
 
+@buffered_output
 async def demo_configuration_options():
     """Demonstrate different configuration options"""
     print("\n=== Configuration Options Demo ===\n")
     
-    manager = ApplicationManager(
-        resume_path="sample_resume.pdf",
-        output_directory="temp/applications"
-    )
+    manager = _get_manager("sample_resume.pdf", "temp/applications")
     
     # Conservative configuration
     conservative_config = manager.create_config(
@@ -179,6 +194,7 @@ async def demo_configuration_options():
         'targeted': targeted_config
     }
 
+@buffered_output
 async def demo_application_tracking():
     """Demonstrate application tracking and reporting"""
     print("\n=== Application Tracking Demo ===\n")
@@ -215,18 +231,31 @@ async def demo_application_tracking():
     ]
     
     print("📊 APPLICATION TRACKING DASHBOARD:")
-    print(f"{'Job Title':<25} {'Company':<20} {'Score':<8} {'Status':<12} {'Applied'}")
-    print("-" * 80)
-    
+    rows = [
+        f"{'Job Title':<25} {'Company':<20} {'Score':<8} {'Status':<12} {'Applied'}",
+        "-" * 80
+    ]
+    # Rows, applied count, score total and status breakdown in one pass
+    applied_apps = 0
+    score_sum = 0.0
+    status_counts = Counter()
     for app in sample_applications:
-        applied_status = "✅ Yes" if app['applied_at'] else "⏳ No"
-        print(f"{app['job_title']:<25} {app['company_name']:<20} "
-              f"{app['match_score']:<8.1%} {app['status']:<12} {applied_status}")
+        if app['applied_at']:
+            applied_apps += 1
+        score_sum += app['match_score']
+        status_counts[app['status']] += 1
+        rows.append(ROW_FMT.format_map({
+            'title': app['job_title'],
+            'company': app['company_name'],
+            'score': app['match_score'],
+            'status': app['status'],
+            'applied': "✅ Yes" if app['applied_at'] else "⏳ No"
+        }))
+    print("\n".join(rows))
     
     # Statistics
     total_apps = len(sample_applications)
-    applied_apps = len([app for app in sample_applications if app['applied_at']])
-    avg_score = sum(app['match_score'] for app in sample_applications) / total_apps
+    avg_score = score_sum / total_apps
     
     print(f"\n📈 STATISTICS:")
     print(f"   Total Applications: {total_apps}")
@@ -234,29 +263,26 @@ async def demo_application_tracking():
     print(f"   Success Rate: {applied_apps/total_apps:.1%}")
     print(f"   Average Match Score: {avg_score:.1%}")
     
-    # Status breakdown
-    status_counts = {}
-    for app in sample_applications:
-        status = app['status']
-        status_counts[status] = status_counts.get(status, 0) + 1
-    
     print(f"\n📋 STATUS BREAKDOWN:")
     for status, count in status_counts.items():
         print(f"   {status.title()}: {count}")
 
+@buffered_output
 async def demo_export_functionality():
     """Demonstrate export and reporting functionality"""
     print("\n=== Export & Reporting Demo ===\n")
     
     # Simulate export process
     output_dir = Path("temp/reports")
-    output_dir.mkdir(exist_ok=True)
+    ensure_dirs((str(output_dir),))
     
     print("💾 EXPORT OPTIONS:")
     
-    # Application report
+    # Application report (compact, for tools) and a pretty copy for reading
     report_file = output_dir / "applications_report.json"
+    pretty_report_file = output_dir / "applications_report.pretty.json"
     print(f"   📄 Applications Report: {report_file}")
+    print(f"   📄 Applications Report (readable): {pretty_report_file}")
     
     # Session summary
     session_file = output_dir / "session_summary.json"
@@ -296,8 +322,8 @@ async def demo_export_functionality():
         ]
     }
     
-    with open(report_file, 'w') as f:
-        json.dump(sample_report, f, indent=2)
+    dump_json(sample_report, report_file, indent=False)
+    dump_json(sample_report, pretty_report_file)
     
     print(f"\n✅ Sample report generated: {report_file}")
 
@@ -310,17 +336,15 @@ async def main():
         # Demo 1: Basic auto application
         basic_results = await demo_basic_auto_application()
         
-        # Demo 2: Application review and approval
-        approval_results = await demo_application_review_and_approval()
-        
-        # Demo 3: Configuration options
-        config_options = await demo_configuration_options()
-        
-        # Demo 4: Application tracking
-        await demo_application_tracking()
-        
-        # Demo 5: Export functionality
-        await demo_export_functionality()
+        # Demos 2-5 (review, configuration, tracking, export) don't depend on
+        # each other or on demo 1, so they are scheduled together
+        with task_stdout():
+            approval_results, config_options, _, _ = await asyncio.gather(
+                demo_application_review_and_approval(),
+                demo_configuration_options(),
+                demo_application_tracking(),
+                demo_export_functionality()
+            )
         
         print("\n" + "=" * 70)
         print("✅ Auto Application System Demo completed successfully!")
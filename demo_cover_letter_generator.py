@@ -2,14 +2,27 @@
 Demo script to test the AI Cover Letter Generator functionality
 """
 
-import json
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from src.ai.cover_letter_generator import CoverLetterGenerator
-from src.parsers.resume_parser import ResumeData
-from src.parsers.job_description_parser import JobRequirements
+from typing import TYPE_CHECKING
 
-def create_sample_resume() -> ResumeData:
-    """Create a sample resume for testing"""
+from config import config
+from src.utils.demo_output import buffered_output, dump_json, task_stdout
+
+# The generator (Groq client) and parsers are imported where they are first
+# needed, so the script starts without loading the AI stack
+if TYPE_CHECKING:
+    from src.parsers.resume_parser import ResumeData
+    from src.parsers.job_description_parser import JobRequirements
+
+@lru_cache(maxsize=1)
+def create_sample_resume() -> "ResumeData":
+    """Create a sample resume for testing (built once; callers must not modify it)"""
+    from src.parsers.resume_parser import ResumeData
+    
     return ResumeData(
         raw_text="Sample resume text",
         name="Sarah Johnson",
@@ -47,8 +60,11 @@ def create_sample_resume() -> ResumeData:
         sections={}
     )
 
-def create_sample_job_requirements() -> JobRequirements:
-    """Create sample job requirements for testing"""
+@lru_cache(maxsize=1)
+def create_sample_job_requirements() -> "JobRequirements":
+    """Create sample job requirements for testing (built once; callers must not modify it)"""
+    from src.parsers.job_description_parser import JobRequirements
+    
     return JobRequirements(
         required_skills=["React", "Node.js", "JavaScript", "Python", "AWS", "PostgreSQL"],
         preferred_skills=["TypeScript", "Docker", "Kubernetes", "GraphQL", "Microservices"],
@@ -77,14 +93,10 @@ def create_sample_job_requirements() -> JobRequirements:
         industry="Technology"
     )
 
-def demo_basic_generation():
+@buffered_output
+async def demo_basic_generation(generator, sample_resume, sample_job):
     """Demonstrate basic cover letter generation"""
-    print("=== AI Cover Letter Generator Demo ===\n")
-    
-    # Initialize components
-    generator = CoverLetterGenerator()
-    sample_resume = create_sample_resume()
-    sample_job = create_sample_job_requirements()
+    print("\n=== AI Cover Letter Generator Demo ===\n")
     
     print("👤 CANDIDATE PROFILE:")
     print(f"   Name: {sample_resume.name}")
@@ -101,7 +113,7 @@ def demo_basic_generation():
     
     try:
         # Generate cover letter
-        cover_letter = generator.generate_cover_letter(
+        cover_letter = await generator.agenerate_cover_letter(
             resume_data=sample_resume,
             job_requirements=sample_job,
             company_name="TechVision Inc.",
@@ -131,20 +143,18 @@ def demo_basic_generation():
         print(f"❌ Generation failed: {str(e)}")
         return None
 
-def demo_multiple_templates():
+@buffered_output
+async def demo_multiple_templates(generator, sample_resume, sample_job):
     """Demonstrate multiple template generation"""
     print("\n=== Multiple Template Demo ===\n")
     
-    generator = CoverLetterGenerator()
-    sample_resume = create_sample_resume()
-    sample_job = create_sample_job_requirements()
-    
     templates = ['professional', 'enthusiastic', 'technical', 'concise']
     
     print("🔄 Generating multiple cover letter versions...\n")
     
     try:
-        versions = generator.generate_multiple_versions(
+        # All templates are requested at once rather than one after another
+        versions = await generator.agenerate_multiple_versions(
             sample_resume,
             sample_job,
             "DataTech Solutions",
@@ -181,25 +191,21 @@ def demo_multiple_templates():
         print(f"❌ Multiple template generation failed: {str(e)}")
         return {}
 
-def demo_personalization_levels():
+@buffered_output
+async def demo_personalization_levels(generator, sample_resume, sample_job):
     """Demonstrate different personalization levels"""
-    print("=== Personalization Levels Demo ===\n")
-    
-    generator = CoverLetterGenerator()
-    sample_resume = create_sample_resume()
-    sample_job = create_sample_job_requirements()
+    print("\n=== Personalization Levels Demo ===\n")
     
     levels = ['low', 'medium', 'high']
     
     print("🎯 Testing different personalization levels...\n")
     
-    results = {}
+    print(f"Generating {', '.join(levels)} personalization levels...")
     
-    for level in levels:
-        try:
-            print(f"Generating {level} personalization level...")
-            
-            cover_letter = generator.generate_cover_letter(
+    # One request per level, all in flight together
+    cover_letters = await asyncio.gather(
+        *(
+            generator.agenerate_cover_letter(
                 sample_resume,
                 sample_job,
                 "CloudScale Systems",
@@ -207,11 +213,18 @@ def demo_personalization_levels():
                 template='professional',
                 personalization_level=level
             )
-            
+            for level in levels
+        ),
+        return_exceptions=True
+    )
+    
+    results = {}
+    
+    for level, cover_letter in zip(levels, cover_letters):
+        if isinstance(cover_letter, Exception):
+            print(f"❌ Failed to generate {level} level: {str(cover_letter)}")
+        else:
             results[level] = cover_letter
-            
-        except Exception as e:
-            print(f"❌ Failed to generate {level} level: {str(e)}")
     
     if results:
         print("📊 PERSONALIZATION COMPARISON:")
@@ -231,17 +244,21 @@ def demo_personalization_levels():
     
     return results
 
-def demo_quality_analysis():
-    """Demonstrate cover letter quality analysis"""
-    print("=== Quality Analysis Demo ===\n")
+@buffered_output
+async def demo_quality_analysis(generator, sample_resume, sample_job, template_versions=None):
+    """
+    Demonstrate cover letter quality analysis
     
-    generator = CoverLetterGenerator()
-    sample_resume = create_sample_resume()
-    sample_job = create_sample_job_requirements()
+    template_versions is the running demo_multiple_templates task; its
+    technical letter is analyzed instead of generating another one.
+    """
+    print("\n=== Quality Analysis Demo ===\n")
     
     try:
-        # Generate a cover letter
-        cover_letter = generator.generate_cover_letter(
+        versions = await template_versions if template_versions is not None else {}
+        
+        # Generate a cover letter unless the template demo already produced one
+        cover_letter = versions.get('technical') or await generator.agenerate_cover_letter(
             sample_resume,
             sample_job,
             "InnovateAI Corp",
@@ -289,17 +306,14 @@ def demo_quality_analysis():
         print(f"❌ Quality analysis failed: {str(e)}")
         return {}
 
-def demo_export_functionality():
+@buffered_output
+async def demo_export_functionality(generator, sample_resume, sample_job):
     """Demonstrate export functionality"""
     print("\n=== Export Functionality Demo ===\n")
     
-    generator = CoverLetterGenerator()
-    sample_resume = create_sample_resume()
-    sample_job = create_sample_job_requirements()
-    
     try:
         # Generate cover letter
-        cover_letter = generator.generate_cover_letter(
+        cover_letter = await generator.agenerate_cover_letter(
             sample_resume,
             sample_job,
             "FutureTech Innovations",
@@ -319,15 +333,23 @@ def demo_export_functionality():
         
         print("💾 Exporting cover letter in multiple formats...")
         
-        for format_type, filename in formats.items():
-            output_path = output_dir / filename
-            success = generator.export_cover_letter(
-                cover_letter,
-                output_path,
-                format_type
-            )
-            
-            if success:
+        # Create the directory and build each path once, then write all formats concurrently
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_paths = {format_type: output_dir / filename for format_type, filename in formats.items()}
+        with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+            exports = {
+                format_type: executor.submit(
+                    generator.export_cover_letter,
+                    cover_letter,
+                    output_path,
+                    format_type
+                )
+                for format_type, output_path in output_paths.items()
+            }
+        
+        for format_type, export in exports.items():
+            output_path = output_paths[format_type]
+            if export.result():
                 print(f"   ✅ {format_type.upper()}: {output_path}")
             else:
                 print(f"   ❌ {format_type.upper()}: Export failed")
@@ -337,76 +359,87 @@ def demo_export_functionality():
     except Exception as e:
         print(f"❌ Export demo failed: {str(e)}")
 
+# CoverLetterData fields written by save_demo_results (candidate_name is left out)
+SAVED_FIELDS = (
+    "content", "job_title", "company_name", "word_count",
+    "personalization_score", "template_used", "key_points", "generated_at"
+)
+
 def save_demo_results(cover_letters):
     """Save demo results to file"""
     if not cover_letters:
         return
     
-    output_data = {}
-    
-    if isinstance(cover_letters, dict):
-        # Multiple cover letters
-        for name, cover_letter in cover_letters.items():
-            output_data[name] = {
-                "content": cover_letter.content,
-                "job_title": cover_letter.job_title,
-                "company_name": cover_letter.company_name,
-                "word_count": cover_letter.word_count,
-                "personalization_score": cover_letter.personalization_score,
-                "template_used": cover_letter.template_used,
-                "key_points": cover_letter.key_points,
-                "generated_at": cover_letter.generated_at
-            }
-    else:
+    if not isinstance(cover_letters, dict):
         # Single cover letter
-        output_data["single_cover_letter"] = {
-            "content": cover_letters.content,
-            "job_title": cover_letters.job_title,
-            "company_name": cover_letters.company_name,
-            "word_count": cover_letters.word_count,
-            "personalization_score": cover_letters.personalization_score,
-            "template_used": cover_letters.template_used,
-            "key_points": cover_letters.key_points,
-            "generated_at": cover_letters.generated_at
-        }
+        cover_letters = {"single_cover_letter": cover_letters}
+    
+    output_data = {
+        name: {field: getattr(cover_letter, field) for field in SAVED_FIELDS}
+        for name, cover_letter in cover_letters.items()
+    }
     
     output_file = Path("temp/cover_letter_generator_demo.json")
     output_file.parent.mkdir(exist_ok=True)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    dump_json(output_data, output_file)
     
     print(f"\n💾 Demo results saved to: {output_file}")
 
+async def run_demos(generator, sample_resume, sample_job):
+    """Run the generation demos concurrently, then the export demo; returns demo 1-4 results"""
+    with task_stdout():
+        # Demo 4 analyzes demo 2's technical letter, so it is handed the demo 2 task
+        templates = asyncio.ensure_future(demo_multiple_templates(generator, sample_resume, sample_job))
+        results = await asyncio.gather(
+            demo_basic_generation(generator, sample_resume, sample_job),
+            templates,
+            demo_personalization_levels(generator, sample_resume, sample_job),
+            demo_quality_analysis(generator, sample_resume, sample_job, template_versions=templates)
+        )
+        
+        await demo_export_functionality(generator, sample_resume, sample_job)
+    
+    return results
+
 def main():
     """Main demo function"""
+    # Every demo calls the Groq API, so stop before doing any work without a key
+    if not config.GROQ_API_KEY:
+        print("❌ GROQ_API_KEY not set - add it to your .env file to run this demo")
+        sys.exit(2)
+    
     print("🚀 Starting AI Cover Letter Generator Demo")
     print("=" * 70)
     
     all_cover_letters = {}
     
     try:
-        # Demo 1: Basic generation
-        basic_cover_letter = demo_basic_generation()
+        from src.ai.cover_letter_generator import CoverLetterGenerator
+        
+        # One generator (and its API client) and one set of sample data for every demo;
+        # generated letters are cached on disk so re-running the demo skips the API
+        generator = CoverLetterGenerator(cache_dir=Path("temp/cover_letter_cache"))
+        sample_resume = create_sample_resume()
+        sample_job = create_sample_job_requirements()
+        
+        # Demos 1-4 run concurrently on one event loop, then demo 5
+        basic_cover_letter, template_versions, personalization_results, quality_metrics = asyncio.run(
+            run_demos(generator, sample_resume, sample_job)
+        )
         if basic_cover_letter:
             all_cover_letters['basic'] = basic_cover_letter
-        
-        # Demo 2: Multiple templates
-        template_versions = demo_multiple_templates()
         all_cover_letters.update(template_versions)
         
-        # Demo 3: Personalization levels
-        personalization_results = demo_personalization_levels()
-        
-        # Demo 4: Quality analysis
-        quality_metrics = demo_quality_analysis()
-        
-        # Demo 5: Export functionality
-        demo_export_functionality()
-        
         # Save results
         save_demo_results(all_cover_letters)
         
+        # Score every generated letter in one pass
+        batch_metrics = generator.analyze_batch(list(all_cover_letters.values()))
+        print("\n📊 OVERALL SCORES:")
+        for name, metrics in zip(all_cover_letters, batch_metrics):
+            print(f"   {name.title():<12}: {metrics['overall_score']:.1%}")
+        
         print("\n" + "=" * 70)
         print("✅ AI Cover Letter Generator Demo completed successfully!")
         
@@ -2,186 +2,226 @@
 Demo script to test the Job Description Parser functionality
 """
 
-import json
+import argparse
+import asyncio
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
 from src.parsers.job_description_parser import JobDescriptionParser, JobRequirements
+from src.utils.demo_output import buffered_output, dump_json, task_stdout
+
+# One lock per parse key, so demos running together that need the same parse
+# wait for the first one instead of each calling the parser (and Groq)
+_parse_locks = defaultdict(threading.Lock)
+_parse_locks_guard = threading.Lock()
+
+# Built once at import; every demo gets the same read-only mapping (and string objects)
+_SAMPLE_JOBS: Mapping[str, str] = MappingProxyType({
+    "software_engineer": """
+    Software Engineer - Full Stack Development
+    
+    Company: TechCorp Inc.
+    Location: San Francisco, CA (Remote options available)
+    Salary: $120,000 - $180,000
+    
+    About the Role:
+    We are seeking a talented Software Engineer to join our growing team. You will be responsible for developing and maintaining our web applications using modern technologies.
+    
+    Key Responsibilities:
+    • Design and develop scalable web applications using React and Node.js
+    • Collaborate with cross-functional teams to define and implement new features
+    • Write clean, maintainable, and well-tested code
+    • Participate in code reviews and maintain high coding standards
+    • Optimize application performance and ensure security best practices
+    • Mentor junior developers and contribute to team knowledge sharing
+    
+    Required Qualifications:
+    • Bachelor's degree in Computer Science or related field
+    • 3+ years of experience in full-stack web development
+    • Strong proficiency in JavaScript, React, and Node.js
+    • Experience with SQL databases (PostgreSQL preferred)
+    • Knowledge of RESTful APIs and microservices architecture
+    • Proficient with Git version control
+    • Strong problem-solving and analytical skills
+    • Excellent communication and teamwork abilities
+    
+    Preferred Qualifications:
+    • Experience with TypeScript and modern JavaScript frameworks
+    • Knowledge of cloud platforms (AWS, Azure, or GCP)
+    • Experience with Docker and Kubernetes
+    • Familiarity with CI/CD pipelines
+    • Understanding of Agile development methodologies
+    • Experience with testing frameworks (Jest, Cypress)
+    
+    Benefits:
+    • Competitive salary and equity package
+    • Comprehensive health, dental, and vision insurance
+    • 401(k) with company matching
+    • Flexible work arrangements and unlimited PTO
+    • Professional development budget
+    • Modern office with free meals and snacks
+    
+    How to Apply:
+    Please submit your resume and cover letter through our online portal. Include links to your GitHub profile and any relevant portfolio projects.
+    """,
+    
+    "data_scientist": """
+    Senior Data Scientist - Machine Learning
+    
+    Company: DataTech Solutions
+    Location: Remote (US timezone)
+    Salary: $140,000 - $200,000 + bonus
+    
+    Position Overview:
+    Join our data science team to build cutting-edge machine learning models that drive business decisions. You'll work with large datasets and deploy models at scale.
+    
+    What You'll Do:
+    • Develop and deploy machine learning models for predictive analytics
+    • Analyze large datasets to extract actionable business insights
+    • Collaborate with engineering teams to productionize ML models
+    • Design and conduct A/B tests to measure model performance
+    • Present findings to stakeholders and executive leadership
+    • Stay current with latest ML research and industry best practices
+    
+    Must-Have Requirements:
+    • Master's degree in Data Science, Statistics, or related quantitative field
+    • 5+ years of experience in data science and machine learning
+    • Expert-level Python programming skills
+    • Strong experience with pandas, scikit-learn, and TensorFlow/PyTorch
+    • Proficiency in SQL and experience with big data tools (Spark, Hadoop)
+    • Experience with cloud ML platforms (AWS SageMaker, Google AI Platform)
+    • Strong statistical analysis and experimental design skills
+    • Excellent data visualization skills (matplotlib, seaborn, Tableau)
+    
+    Nice-to-Have:
+    • PhD in a quantitative field
+    • Experience with deep learning and neural networks
+    • Knowledge of MLOps and model deployment pipelines
+    • Experience with real-time data processing (Kafka, Kinesis)
+    • Familiarity with containerization (Docker, Kubernetes)
+    • Previous experience in fintech or e-commerce
+    
+    Certifications Preferred:
+    • AWS Certified Machine Learning - Specialty
+    • Google Cloud Professional ML Engineer
+    • Microsoft Azure AI Engineer Associate
+    
+    Company Culture:
+    We're a fast-growing startup with a collaborative, data-driven culture. We value innovation, continuous learning, and work-life balance.
+    
+    Application Process:
+    Send your resume, cover letter, and portfolio to careers@datatech.com. Include examples of your ML projects and any published research.
+    Deadline: Applications due by March 15, 2024.
+    """,
+    
+    "devops_engineer": """
+    DevOps Engineer - Infrastructure & Automation
+    
+    Company: CloudScale Systems
+    Location: Austin, TX (Hybrid - 3 days in office)
+    Compensation: $110,000 - $160,000 + benefits
+    
+    Role Summary:
+    We're looking for a DevOps Engineer to help scale our infrastructure and improve our deployment processes. You'll work with cutting-edge cloud technologies.
+    
+    Core Responsibilities:
+    • Design and maintain CI/CD pipelines using Jenkins and GitLab CI
+    • Manage AWS infrastructure using Terraform and CloudFormation
+    • Implement monitoring and alerting solutions with Prometheus and Grafana
+    • Automate deployment processes and infrastructure provisioning
+    • Ensure security best practices across all environments
+    • Troubleshoot production issues and optimize system performance
+    • Collaborate with development teams to improve deployment workflows
+    
+    Required Skills:
+    • Bachelor's degree in Computer Science, Engineering, or equivalent experience
+    • Minimum 3 years of DevOps or Site Reliability Engineering experience
+    • Strong experience with AWS services (EC2, S3, RDS, Lambda, EKS)
+    • Proficiency in Infrastructure as Code (Terraform, CloudFormation)
+    • Experience with containerization (Docker) and orchestration (Kubernetes)
+    • Solid scripting skills in Python, Bash, or PowerShell
+    • Knowledge of CI/CD tools (Jenkins, GitLab CI, GitHub Actions)
+    • Understanding of networking, security, and monitoring concepts
+    
+    Bonus Points:
+    • Experience with multiple cloud providers (Azure, GCP)
+    • Knowledge of service mesh technologies (Istio, Linkerd)
+    • Experience with configuration management (Ansible, Chef, Puppet)
+    • Familiarity with observability tools (ELK stack, Jaeger)
+    • Previous experience in a high-growth startup environment
+    
+    What We Offer:
+    • Competitive salary with performance bonuses
+    • Stock options in a growing company
+    • Health, dental, vision, and life insurance
+    • Flexible PTO and parental leave
+    • $2,000 annual learning and development budget
+    • Top-tier equipment and home office stipend
+    
+    Company Size: 200-500 employees
+    Industry: Cloud Infrastructure
+    
+    To Apply:
+    Apply online at cloudscale.com/careers or email your resume to hiring@cloudscale.com
+    """
+})
 
 def create_sample_job_descriptions():
-    """Create sample job descriptions for testing"""
-    return {
-        "software_engineer": """
-        Software Engineer - Full Stack Development
-        
-        Company: TechCorp Inc.
-        Location: San Francisco, CA (Remote options available)
-        Salary: $120,000 - $180,000
-        
-        About the Role:
-        We are seeking a talented Software Engineer to join our growing team. You will be responsible for developing and maintaining our web applications using modern technologies.
-        
-        Key Responsibilities:
-        • Design and develop scalable web applications using React and Node.js
-        • Collaborate with cross-functional teams to define and implement new features
-        • Write clean, maintainable, and well-tested code
-        • Participate in code reviews and maintain high coding standards
-        • Optimize application performance and ensure security best practices
-        • Mentor junior developers and contribute to team knowledge sharing
-        
-        Required Qualifications:
-        • Bachelor's degree in Computer Science or related field
-        • 3+ years of experience in full-stack web development
-        • Strong proficiency in JavaScript, React, and Node.js
-        • Experience with SQL databases (PostgreSQL preferred)
-        • Knowledge of RESTful APIs and microservices architecture
-        • Proficient with Git version control
-        • Strong problem-solving and analytical skills
-        • Excellent communication and teamwork abilities
-        
-        Preferred Qualifications:
-        • Experience with TypeScript and modern JavaScript frameworks
-        • Knowledge of cloud platforms (AWS, Azure, or GCP)
-        • Experience with Docker and Kubernetes
-        • Familiarity with CI/CD pipelines
-        • Understanding of Agile development methodologies
-        • Experience with testing frameworks (Jest, Cypress)
-        
-        Benefits:
-        • Competitive salary and equity package
-        • Comprehensive health, dental, and vision insurance
-        • 401(k) with company matching
-        • Flexible work arrangements and unlimited PTO
-        • Professional development budget
-        • Modern office with free meals and snacks
-        
-        How to Apply:
-        Please submit your resume and cover letter through our online portal. Include links to your GitHub profile and any relevant portfolio projects.
-        """,
-        
-        "data_scientist": """
-        Senior Data Scientist - Machine Learning
-        
-        Company: DataTech Solutions
-        Location: Remote (US timezone)
-        Salary: $140,000 - $200,000 + bonus
-        
-        Position Overview:
-        Join our data science team to build cutting-edge machine learning models that drive business decisions. You'll work with large datasets and deploy models at scale.
-        
-        What You'll Do:
-        • Develop and deploy machine learning models for predictive analytics
-        • Analyze large datasets to extract actionable business insights
-        • Collaborate with engineering teams to productionize ML models
-        • Design and conduct A/B tests to measure model performance
-        • Present findings to stakeholders and executive leadership
-        • Stay current with latest ML research and industry best practices
-        
-        Must-Have Requirements:
-        • Master's degree in Data Science, Statistics, or related quantitative field
-        • 5+ years of experience in data science and machine learning
-        • Expert-level Python programming skills
-        • Strong experience with pandas, scikit-learn, and TensorFlow/PyTorch
-        • Proficiency in SQL and experience with big data tools (Spark, Hadoop)
-        • Experience with cloud ML platforms (AWS SageMaker, Google AI Platform)
-        • Strong statistical analysis and experimental design skills
-        • Excellent data visualization skills (matplotlib, seaborn, Tableau)
-        
-        Nice-to-Have:
-        • PhD in a quantitative field
-        • Experience with deep learning and neural networks
-        • Knowledge of MLOps and model deployment pipelines
-        • Experience with real-time data processing (Kafka, Kinesis)
-        • Familiarity with containerization (Docker, Kubernetes)
-        • Previous experience in fintech or e-commerce
-        
-        Certifications Preferred:
-        • AWS Certified Machine Learning - Specialty
-        • Google Cloud Professional ML Engineer
-        • Microsoft Azure AI Engineer Associate
-        
-        Company Culture:
-        We're a fast-growing startup with a collaborative, data-driven culture. We value innovation, continuous learning, and work-life balance.
-        
-        Application Process:
-        Send your resume, cover letter, and portfolio to careers@datatech.com. Include examples of your ML projects and any published research.
-        Deadline: Applications due by March 15, 2024.
-        """,
-        
-        "devops_engineer": """
-        DevOps Engineer - Infrastructure & Automation
-        
-        Company: CloudScale Systems
-        Location: Austin, TX (Hybrid - 3 days in office)
-        Compensation: $110,000 - $160,000 + benefits
-        
-        Role Summary:
-        We're looking for a DevOps Engineer to help scale our infrastructure and improve our deployment processes. You'll work with cutting-edge cloud technologies.
-        
-        Core Responsibilities:
-        • Design and maintain CI/CD pipelines using Jenkins and GitLab CI
-        • Manage AWS infrastructure using Terraform and CloudFormation
-        • Implement monitoring and alerting solutions with Prometheus and Grafana
-        • Automate deployment processes and infrastructure provisioning
-        • Ensure security best practices across all environments
-        • Troubleshoot production issues and optimize system performance
-        • Collaborate with development teams to improve deployment workflows
-        
-        Required Skills:
-        • Bachelor's degree in Computer Science, Engineering, or equivalent experience
-        • Minimum 3 years of DevOps or Site Reliability Engineering experience
-        • Strong experience with AWS services (EC2, S3, RDS, Lambda, EKS)
-        • Proficiency in Infrastructure as Code (Terraform, CloudFormation)
-        • Experience with containerization (Docker) and orchestration (Kubernetes)
-        • Solid scripting skills in Python, Bash, or PowerShell
-        • Knowledge of CI/CD tools (Jenkins, GitLab CI, GitHub Actions)
-        • Understanding of networking, security, and monitoring concepts
-        
-        Bonus Points:
-        • Experience with multiple cloud providers (Azure, GCP)
-        • Knowledge of service mesh technologies (Istio, Linkerd)
-        • Experience with configuration management (Ansible, Chef, Puppet)
-        • Familiarity with observability tools (ELK stack, Jaeger)
-        • Previous experience in a high-growth startup environment
-        
-        What We Offer:
-        • Competitive salary with performance bonuses
-        • Stock options in a growing company
-        • Health, dental, vision, and life insurance
-        • Flexible PTO and parental leave
-        • $2,000 annual learning and development budget
-        • Top-tier equipment and home office stipend
-        
-        Company Size: 200-500 employees
-        Industry: Cloud Infrastructure
-        
-        To Apply:
-        Apply online at cloudscale.com/careers or email your resume to hiring@cloudscale.com
-        """
-    }
+    """Sample job descriptions for testing (shared and read-only)"""
+    return _SAMPLE_JOBS
+
+@lru_cache(maxsize=2)
+def _get_parser(use_ai: bool) -> JobDescriptionParser:
+    """Parser shared by every demo (and every parse) in the given mode"""
+    return JobDescriptionParser(use_ai=use_ai)
+
+def _parse_cached(description: str, job_title: str, use_ai: bool) -> JobRequirements:
+    """Parse a job description once per (description, title, mode); callers must not modify the result"""
+    key = (description, job_title, use_ai)
+    with _parse_locks_guard:
+        lock = _parse_locks[key]
+    
+    with lock:
+        return _parse_once(description, job_title, use_ai)
+
+@lru_cache(maxsize=16)
+def _parse_once(description: str, job_title: str, use_ai: bool) -> JobRequirements:
+    """Memoized parse behind _parse_cached's per-key lock"""
+    return _get_parser(use_ai).parse_job_description(description, job_title)
 
+@buffered_output
 def demo_basic_parsing():
     """Demonstrate basic job description parsing"""
-    print("=== Job Description Parser Demo ===\n")
+    print("\n=== Job Description Parser Demo ===\n")
     
     # Initialize parser
-    parser = JobDescriptionParser(use_ai=True)
+    parser = _get_parser(True)
     
     # Get sample job descriptions
     job_descriptions = create_sample_job_descriptions()
     
     print("🔍 Parsing sample job descriptions...\n")
     
-    parsed_jobs = {}
-    
-    for job_type, description in job_descriptions.items():
-        print(f"📋 Parsing {job_type.replace('_', ' ').title()} position...")
+    def parse(item):
+        job_type, description = item
         
         # Extract job title from description
         lines = description.strip().split('\n')
         job_title = lines[0].strip() if lines else job_type
         
-        # Parse the job description
-        requirements = parser.parse_job_description(description, job_title)
-        parsed_jobs[job_type] = requirements
+        return job_type, _parse_cached(description, job_title, parser.use_ai)
+    
+    # Parse all descriptions in parallel (the AI calls are I/O-bound), then report in order
+    with ThreadPoolExecutor(max_workers=len(job_descriptions)) as executor:
+        parsed_jobs = dict(executor.map(parse, job_descriptions.items()))
+    
+    for job_type, requirements in parsed_jobs.items():
+        print(f"📋 {job_type.replace('_', ' ').title()} position:")
         
         # Display key results
         print(f"   ✅ Extracted {len(requirements.required_skills)} required skills")
@@ -198,36 +238,37 @@ def demo_basic_parsing():
     
     return parsed_jobs
 
+@buffered_output
 def demo_detailed_analysis():
     """Demonstrate detailed job requirement analysis"""
-    print("=== Detailed Job Analysis Demo ===\n")
+    print("\n=== Detailed Job Analysis Demo ===\n")
     
-    parser = JobDescriptionParser(use_ai=True)
+    parser = _get_parser(True)
     job_descriptions = create_sample_job_descriptions()
     
     # Analyze the software engineer position in detail
     job_desc = job_descriptions["software_engineer"]
-    requirements = parser.parse_job_description(job_desc, "Software Engineer")
+    requirements = _parse_cached(job_desc, "Software Engineer", parser.use_ai)
     
     print("🔬 Detailed Analysis: Software Engineer Position\n")
     
     print("📋 REQUIRED SKILLS:")
-    for skill in requirements.required_skills[:10]:
+    for skill in islice(requirements.required_skills, 10):
         print(f"   • {skill}")
     
     print(f"\n🎯 PREFERRED SKILLS:")
-    for skill in requirements.preferred_skills[:10]:
+    for skill in islice(requirements.preferred_skills, 10):
         print(f"   • {skill}")
     
     print(f"\n🛠️ TECHNOLOGIES BY CATEGORY:")
     for category, skills in requirements.technologies.items():
         if skills:
             print(f"   {category.replace('_', ' ').title()}:")
-            for skill in skills[:5]:
+            for skill in islice(skills, 5):
                 print(f"     - {skill}")
     
     print(f"\n💼 RESPONSIBILITIES:")
-    for i, resp in enumerate(requirements.responsibilities[:5], 1):
+    for i, resp in enumerate(islice(requirements.responsibilities, 5), 1):
         print(f"   {i}. {resp[:100]}...")
     
     print(f"\n🎓 EDUCATION REQUIREMENTS:")
@@ -241,7 +282,7 @@ def demo_detailed_analysis():
     print(f"\n💰 COMPENSATION & BENEFITS:")
     if requirements.salary_range:
         print(f"   Salary: ${requirements.salary_range[0]:,} - ${requirements.salary_range[1]:,}")
-    for benefit in requirements.benefits[:8]:
+    for benefit in islice(requirements.benefits, 8):
         print(f"   • {benefit}")
     
     print(f"\n📊 JOB METADATA:")
@@ -250,11 +291,12 @@ def demo_detailed_analysis():
     print(f"   Company Size: {requirements.company_size}")
     print(f"   Industry: {requirements.industry}")
 
+@buffered_output
 def demo_job_matching():
     """Demonstrate job matching analysis"""
     print("\n=== Job Matching Analysis Demo ===\n")
     
-    parser = JobDescriptionParser(use_ai=True)
+    parser = _get_parser(True)
     job_descriptions = create_sample_job_descriptions()
     
     # Sample candidate skills
@@ -270,10 +312,17 @@ def demo_job_matching():
     
     print(f"\n🎯 JOB MATCHING ANALYSIS:\n")
     
-    for job_type, description in job_descriptions.items():
-        job_title = job_type.replace('_', ' ').title()
-        requirements = parser.parse_job_description(description, job_title)
-        
+    job_titles = [job_type.replace('_', ' ').title() for job_type in job_descriptions]
+    
+    # Parse all descriptions in parallel, then analyze and report in order
+    with ThreadPoolExecutor(max_workers=len(job_descriptions)) as executor:
+        parsed = list(executor.map(
+            lambda description, job_title: _parse_cached(description, job_title, parser.use_ai),
+            job_descriptions.values(),
+            job_titles
+        ))
+    
+    for job_title, requirements in zip(job_titles, parsed):
         # Analyze match
         match_analysis = parser.analyze_job_match(requirements, candidate_skills)
         
@@ -284,15 +333,16 @@ def demo_job_matching():
         print(f"   Recommendation: {match_analysis['recommendation']}")
         
         if match_analysis['missing_required_skills']:
-            print(f"   Missing Required Skills: {', '.join(match_analysis['missing_required_skills'][:5])}")
+            print(f"   Missing Required Skills: {', '.join(islice(match_analysis['missing_required_skills'], 5))}")
         
         print()
 
+@buffered_output
 def demo_application_instructions():
     """Demonstrate application instruction extraction"""
-    print("=== Application Instructions Demo ===\n")
+    print("\n=== Application Instructions Demo ===\n")
     
-    parser = JobDescriptionParser(use_ai=True)
+    parser = _get_parser(True)
     job_descriptions = create_sample_job_descriptions()
     
     for job_type, description in job_descriptions.items():
@@ -316,13 +366,11 @@ def demo_ai_vs_rule_based():
     
     # Parse with AI
     print("🤖 Parsing with AI enhancement...")
-    ai_parser = JobDescriptionParser(use_ai=True)
-    ai_results = ai_parser.parse_job_description(job_desc, "Data Scientist")
+    ai_results = _parse_cached(job_desc, "Data Scientist", True)
     
     # Parse without AI
     print("📏 Parsing with rule-based only...")
-    rule_parser = JobDescriptionParser(use_ai=False)
-    rule_results = rule_parser.parse_job_description(job_desc, "Data Scientist")
+    rule_results = _parse_cached(job_desc, "Data Scientist", False)
     
     print(f"\n📊 COMPARISON RESULTS:")
     print(f"   AI Required Skills: {len(ai_results.required_skills)}")
@@ -358,34 +406,45 @@ def save_demo_results(parsed_jobs):
     output_file = Path("temp/parsed_job_requirements_demo.json")
     output_file.parent.mkdir(exist_ok=True)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    dump_json(output_data, output_file)
     
     print(f"\n💾 Demo results saved to: {output_file}")
 
+async def run_demos(compare_ai: bool):
+    """Run the independent demos in worker threads together; returns the basic parsing results"""
+    # Build the shared parser once up front rather than racing to create it in every thread
+    _get_parser(True)
+    
+    with task_stdout():
+        parsed_jobs, _, _, _ = await asyncio.gather(
+            asyncio.to_thread(demo_basic_parsing),
+            asyncio.to_thread(demo_detailed_analysis),
+            asyncio.to_thread(demo_job_matching),
+            asyncio.to_thread(demo_application_instructions)
+        )
+    
+    # Demo 5: AI vs Rule-based comparison (optional)
+    if compare_ai:
+        print("=" * 60)
+        demo_ai_vs_rule_based()
+    
+    return parsed_jobs
+
 def main():
     """Main demo function"""
+    # Optional demos are chosen up front so the run never blocks on input
+    parser = argparse.ArgumentParser(description="Job Description Parser Demo")
+    parser.add_argument("--compare-ai", action="store_true",
+                       help="Compare AI vs rule-based parsing")
+    
+    args = parser.parse_args()
+    
     print("🚀 Starting Job Description Parser Demo")
     print("=" * 60)
     
     try:
-        # Demo 1: Basic parsing
-        parsed_jobs = demo_basic_parsing()
-        
-        # Demo 2: Detailed analysis
-        demo_detailed_analysis()
-        
-        # Demo 3: Job matching
-        demo_job_matching()
-        
-        # Demo 4: Application instructions
-        demo_application_instructions()
-        
-        # Demo 5: AI vs Rule-based comparison
-        print("=" * 60)
-        user_input = input("Compare AI vs Rule-based parsing? (y/n): ").lower().strip()
-        if user_input == 'y':
-            demo_ai_vs_rule_based()
+        # Demos 1-4 run concurrently, then the optional comparison
+        parsed_jobs = asyncio.run(run_demos(args.compare_ai))
         
         # Save results
         save_demo_results(parsed_jobs)
@@ -2,15 +2,23 @@
 Demo script to test the Job Scraper functionality
 """
 
-import json
+import argparse
 import time
+from collections import Counter
 from pathlib import Path
-from src.scrapers.job_scraper import JobScraper, SearchCriteria, JobPlatform, scrape_jobs_simple
-from src.scrapers.linkedin_scraper import LinkedInScraper
 from config import config
+from src.utils.demo_output import dump_json
+
+# The scrapers (selenium, browser drivers) are imported inside the demos that
+# use them, so --help and skipped demos don't load the browser stack
+
+# Line breaks and tabs become spaces so a preview prints on one line
+_PREVIEW_WHITESPACE = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' '})
 
 def demo_basic_scraping():
     """Demonstrate basic job scraping functionality"""
+    from src.scrapers.job_scraper import scrape_jobs_simple
+    
     print("=== Job Scraper Demo ===\n")
     
     # Test simple scraping function
@@ -41,6 +49,8 @@ def demo_basic_scraping():
 
 def demo_advanced_scraping():
     """Demonstrate advanced job scraping with criteria"""
+    from src.scrapers.job_scraper import JobScraper, SearchCriteria, JobPlatform
+    
     print("\n=== Advanced Job Scraping Demo ===\n")
     
     # Create search criteria
@@ -71,19 +81,15 @@ def demo_advanced_scraping():
             
             # Show job statistics
             if jobs:
-                companies = set(job.company for job in jobs)
+                company_counts = Counter(job.company for job in jobs)
                 locations = set(job.location for job in jobs)
                 
                 print(f"\n📊 Job Statistics:")
-                print(f"   Unique Companies: {len(companies)}")
+                print(f"   Unique Companies: {len(company_counts)}")
                 print(f"   Unique Locations: {len(locations)}")
                 
                 print(f"\n🏢 Top Companies:")
-                company_counts = {}
-                for job in jobs:
-                    company_counts[job.company] = company_counts.get(job.company, 0) + 1
-                
-                for company, count in sorted(company_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
+                for company, count in company_counts.most_common(5):
                     print(f"   • {company}: {count} jobs")
             
             return jobs
@@ -94,6 +100,8 @@ def demo_advanced_scraping():
 
 def demo_linkedin_login():
     """Demonstrate LinkedIn login functionality"""
+    from src.scrapers.linkedin_scraper import LinkedInScraper
+    
     print("\n=== LinkedIn Login Demo ===\n")
     
     if not config.LINKEDIN_EMAIL or not config.LINKEDIN_PASSWORD:
@@ -134,19 +142,13 @@ def demo_linkedin_login():
         print(f"❌ Error in LinkedIn login: {str(e)}")
         return False
 
-def demo_job_details():
-    """Demonstrate detailed job information extraction"""
+def demo_job_details(jobs):
+    """Demonstrate detailed job information extraction for jobs found by the earlier demos"""
+    from src.scrapers.job_scraper import JobScraper
+    
     print("\n=== Job Details Demo ===\n")
     
     try:
-        # Get a few jobs first
-        jobs = scrape_jobs_simple(
-            job_title="Machine Learning Engineer",
-            location="Remote",
-            max_jobs=2,
-            platforms=["linkedin"]
-        )
-        
         if not jobs:
             print("❌ No jobs found for details demo")
             return
@@ -167,7 +169,7 @@ def demo_job_details():
                 
                 if detailed_job.description:
                     # Show first 200 characters of description
-                    desc_preview = detailed_job.description[:200].replace('\n', ' ')
+                    desc_preview = detailed_job.description[:200].translate(_PREVIEW_WHITESPACE)
                     print(f"   Description preview: {desc_preview}...")
         
     except Exception as e:
@@ -175,6 +177,8 @@ def demo_job_details():
 
 def demo_anti_detection():
     """Demonstrate anti-detection features"""
+    from src.scrapers.linkedin_scraper import LinkedInScraper
+    
     print("\n=== Anti-Detection Features Demo ===\n")
     
     print("🛡️ Anti-Detection Features:")
@@ -246,13 +250,23 @@ def save_demo_results(jobs):
     output_file = Path("temp/scraped_jobs_demo.json")
     output_file.parent.mkdir(exist_ok=True)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    dump_json(output_data, output_file)
     
     print(f"\n💾 Demo results saved to: {output_file}")
 
 def main():
     """Main demo function"""
+    # Optional demos are chosen up front so the run never blocks on input
+    parser = argparse.ArgumentParser(description="Job Scraper Demo")
+    parser.add_argument("--test-login", action="store_true",
+                       help="Test LinkedIn login")
+    parser.add_argument("--job-details", action="store_true",
+                       help="Test job details extraction")
+    parser.add_argument("--anti-detection", action="store_true",
+                       help="Test anti-detection features")
+    
+    args = parser.parse_args()
+    
     print("🚀 Starting Job Scraper Demo")
     print("=" * 50)
     
@@ -268,22 +282,19 @@ def main():
         all_jobs.extend(advanced_jobs)
         
         # Demo 3: LinkedIn login (optional)
-        print("\n" + "=" * 50)
-        user_input = input("Test LinkedIn login? (y/n): ").lower().strip()
-        if user_input == 'y':
+        if args.test_login:
+            print("\n" + "=" * 50)
             demo_linkedin_login()
         
         # Demo 4: Job details (optional)
-        if all_jobs:
+        if all_jobs and args.job_details:
             print("\n" + "=" * 50)
-            user_input = input("Test job details extraction? (y/n): ").lower().strip()
-            if user_input == 'y':
-                demo_job_details()
+            # Reuse jobs already found instead of running another search
+            demo_job_details(all_jobs[:2])
         
-        # Demo 5: Anti-detection features
-        print("\n" + "=" * 50)
-        user_input = input("Test anti-detection features? (y/n): ").lower().strip()
-        if user_input == 'y':
+        # Demo 5: Anti-detection features (optional)
+        if args.anti_detection:
+            print("\n" + "=" * 50)
             demo_anti_detection()
         
         # Save results
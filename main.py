@@ -7,7 +7,7 @@ import sys
 import logging
 from pathlib import Path
 
-from config import config
+from config import config, init_config
 from src.utils.logger import setup_logger
 from src.core.job_applier import JobApplier
 
@@ -33,6 +33,8 @@ def main():
     
     args = parser.parse_args()
     
+    init_config()
+    
     # Setup logging
     logger = setup_logging()
     logger.info("Starting Smart Auto Job Applier")
@@ -5,12 +5,8 @@ Basic test of Internshala credentials and functionality
 """
 
 import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from config import config
+from src.automation.playwright_driver import PlaywrightDriver
 
 def test_internshala_basic():
     """Basic test of Internshala login and job search"""
@@ -21,144 +17,76 @@ def test_internshala_basic():
     print(f"🔒 Password: {'*' * len(config.INTERNSHALA_PASSWORD)}")
     print("="*40)
     
-    # Setup Chrome options
-    chrome_options = Options()
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    chrome_options.add_argument("--disable-web-security")
-    chrome_options.add_argument("--allow-running-insecure-content")
-    
     driver = None
     
     try:
-        print("🌐 Starting Chrome browser...")
-        driver = webdriver.Chrome(options=chrome_options)
-        wait = WebDriverWait(driver, 10)
+        # Playwright waits for each element to be visible and enabled before
+        # clicking or filling, so the per-selector lookups and sleeps are gone
+        print("🌐 Starting Chromium browser...")
+        driver = PlaywrightDriver.launch(headless=False)
         
         print("🔗 Navigating to Internshala...")
-        driver.get("https://internshala.com")
-        time.sleep(3)
+        driver.navigate("https://internshala.com")
         
-        print(f"📄 Page title: {driver.title}")
-        print(f"🌐 Current URL: {driver.current_url}")
+        print(f"📄 Page title: {driver.page.title()}")
+        print(f"🌐 Current URL: {driver.page.url}")
         
         # Look for login link
         print("🔍 Looking for login link...")
-        login_selectors = [
-            'a[href*="login"]',
-            '.login',
-            '#login',
-            'a[contains(text(), "Login")]'
-        ]
-        
-        login_link = None
-        for selector in login_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    if element.is_displayed() and 'login' in element.text.lower():
-                        login_link = element
-                        break
-                if login_link:
-                    break
-            except:
-                continue
-        
-        if login_link:
-            print("✅ Login link found!")
-            print("🖱️ Clicking login link...")
-            login_link.click()
-            time.sleep(3)
+        if driver.click('a[href*="login"] >> visible=true'):
+            print("✅ Login link found and clicked!")
+            driver.page.wait_for_load_state("domcontentloaded")
             
-            print(f"🌐 After login click URL: {driver.current_url}")
+            print(f"🌐 After login click URL: {driver.page.url}")
             
             # Try to find email/phone field
             print("🔍 Looking for email/phone field...")
-            email_selectors = [
+            email_selector = ", ".join([
                 '#email',
                 'input[name="email"]',
                 'input[type="email"]',
                 'input[placeholder*="email"]',
                 'input[placeholder*="phone"]'
-            ]
-            
-            email_field = None
-            for selector in email_selectors:
-                try:
-                    email_field = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                    if email_field.is_displayed():
-                        break
-                except:
-                    continue
+            ]) + " >> visible=true"
             
-            if email_field:
-                print("✅ Email field found!")
-                print("⌨️ Typing email...")
-                email_field.clear()
-                email_field.send_keys(config.INTERNSHALA_EMAIL)
-                time.sleep(1)
+            if driver.fill(email_selector, config.INTERNSHALA_EMAIL):
+                print("✅ Email typed!")
                 
                 # Look for password field
                 print("🔍 Looking for password field...")
-                password_selectors = [
+                password_selector = ", ".join([
                     '#password',
                     'input[name="password"]',
                     'input[type="password"]'
-                ]
+                ]) + " >> visible=true"
                 
-                password_field = None
-                for selector in password_selectors:
-                    try:
-                        password_field = driver.find_element(By.CSS_SELECTOR, selector)
-                        if password_field.is_displayed():
-                            break
-                    except:
-                        continue
-                
-                if password_field:
-                    print("✅ Password field found!")
-                    print("⌨️ Typing password...")
-                    password_field.clear()
-                    password_field.send_keys(config.INTERNSHALA_PASSWORD)
-                    time.sleep(1)
+                if driver.fill(password_selector, config.INTERNSHALA_PASSWORD):
+                    print("✅ Password typed!")
                     
                     # Look for submit button
                     print("🔍 Looking for submit button...")
-                    submit_selectors = [
+                    submit_selector = ", ".join([
                         'button[type="submit"]',
                         '#login_submit',
                         '.login-btn',
                         'input[type="submit"]'
-                    ]
-                    
-                    submit_button = None
-                    for selector in submit_selectors:
-                        try:
-                            submit_button = driver.find_element(By.CSS_SELECTOR, selector)
-                            if submit_button.is_displayed() and submit_button.is_enabled():
-                                break
-                        except:
-                            continue
+                    ]) + " >> visible=true"
                     
-                    if submit_button:
-                        print("✅ Submit button found!")
-                        print("🖱️ Clicking submit...")
-                        submit_button.click()
+                    if driver.click(submit_selector):
+                        print("✅ Submit clicked!")
                         time.sleep(5)
                         
-                        print(f"🌐 After login URL: {driver.current_url}")
+                        print(f"🌐 After login URL: {driver.page.url}")
                         
                         # Check if login was successful
-                        if 'dashboard' in driver.current_url or 'student' in driver.current_url:
+                        if 'dashboard' in driver.page.url or 'student' in driver.page.url:
                             print("🎉 LOGIN SUCCESSFUL!")
                             
                             # Try to navigate to jobs page
                             print("🔍 Looking for jobs section...")
-                            driver.get("https://internshala.com/internships")
-                            time.sleep(3)
+                            driver.navigate("https://internshala.com/internships")
                             
-                            print(f"📄 Jobs page title: {driver.title}")
+                            print(f"📄 Jobs page title: {driver.page.title()}")
                             
                             # Look for job listings
                             job_selectors = [
@@ -170,13 +98,9 @@ def test_internshala_basic():
                             
                             jobs_found = 0
                             for selector in job_selectors:
-                                try:
-                                    job_elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                                    jobs_found = len(job_elements)
-                                    if jobs_found > 0:
-                                        break
-                                except:
-                                    continue
+                                jobs_found = len(driver.find_all(selector))
+                                if jobs_found > 0:
+                                    break
                             
                             print(f"📋 Found {jobs_found} job/internship listings")
                             
@@ -186,11 +110,11 @@ def test_internshala_basic():
                             else:
                                 print("⚠️ No job listings found, but login successful")
                         
-                        elif 'login' in driver.current_url:
+                        elif 'login' in driver.page.url:
                             print("❌ Login failed - still on login page")
                             print("   Please check credentials")
                         else:
-                            print(f"⚠️ Unexpected page after login: {driver.current_url}")
+                            print(f"⚠️ Unexpected page after login: {driver.page.url}")
                     else:
                         print("❌ Submit button not found")
                 else:
@@ -203,14 +127,14 @@ def test_internshala_basic():
         # Keep browser open for manual inspection
         print("\n🔍 Browser will stay open for 30 seconds for manual inspection...")
         time.sleep(30)
-        
+    
     except Exception as e:
         print(f"❌ Error: {str(e)}")
     
     finally:
         if driver:
             print("🔒 Closing browser...")
-            driver.quit()
+            driver.close()
         
         print("\n✅ Test completed!")
 
@@ -3,6 +3,8 @@ AI Cover Letter Generator Module
 Uses Groq API to generate personalized cover letters for job applications
 """
 
+import asyncio
+import hashlib
 import logging
 import re
 from typing import Dict, List, Optional, Tuple
@@ -51,10 +53,34 @@ class CoverLetterTemplate:
 class CoverLetterGenerator:
     """AI-powered cover letter generator using Groq API"""
     
-    def __init__(self):
-        """Initialize cover letter generator"""
+    # Weights of each metric in the overall quality score
+    QUALITY_WEIGHTS = {
+        'personalization_score': 0.3,
+        'length_score': 0.2,
+        'readability_score': 0.25,
+        'structure_score': 0.15,
+        'enthusiasm_score': 0.1
+    }
+    
+    # Identical for every request so it stays part of the cached prompt prefix;
+    # tone and length come from the template section of the prompt
+    SYSTEM_MESSAGE = (
+        "You are an expert cover letter writer who creates compelling, personalized cover letters "
+        "that highlight the candidate's relevant experience and enthusiasm for the role. "
+        "Follow the tone and length given in the cover letter requirements."
+    )
+    
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize cover letter generator
+        
+        Args:
+            cache_dir: Directory for caching generated letters on disk, keyed
+                on the full request; None disables caching
+        """
         self.groq_client = GroqClient()
         self.text_processor = TextProcessor()
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
         
         # Cover letter templates
         self.templates = {
@@ -149,6 +175,67 @@ class CoverLetterGenerator:
         Returns:
             CoverLetterData object with generated cover letter
         """
+        template, context = self._start_generation(
+            resume_data, job_requirements, company_name, job_title, template, additional_context
+        )
+        
+        # Generate cover letter content
+        content = self._generate_content(
+            context, template, personalization_level
+        )
+        
+        return self._finish_generation(
+            content, context, resume_data, company_name, job_title, template, personalization_level
+        )
+    
+    async def agenerate_cover_letter(
+        self,
+        resume_data: ResumeData,
+        job_requirements: JobRequirements,
+        company_name: str,
+        job_title: str,
+        template: str = 'professional',
+        personalization_level: str = 'high',
+        additional_context: Optional[Dict] = None
+    ) -> CoverLetterData:
+        """
+        Async version of generate_cover_letter; the AI request does not block
+        the event loop, so several letters can be generated concurrently
+        
+        Args:
+            resume_data: Candidate's resume data
+            job_requirements: Target job requirements
+            company_name: Target company name
+            job_title: Target job title
+            template: Cover letter template to use
+            personalization_level: Level of personalization (low, medium, high)
+            additional_context: Additional context for personalization
+            
+        Returns:
+            CoverLetterData object with generated cover letter
+        """
+        template, context = self._start_generation(
+            resume_data, job_requirements, company_name, job_title, template, additional_context
+        )
+        
+        content = await self._agenerate_content(
+            context, template, personalization_level
+        )
+        
+        return self._finish_generation(
+            content, context, resume_data, company_name, job_title, template, personalization_level
+        )
+    
+    def _start_generation(
+        self,
+        resume_data: ResumeData,
+        job_requirements: JobRequirements,
+        company_name: str,
+        job_title: str,
+        template: str,
+        additional_context: Optional[Dict]
+    ) -> Tuple[str, Dict]:
+        """Validate the template and prepare the generation context"""
         logger.info(f"Generating cover letter for {job_title} at {company_name}")
         
         # Validate inputs
@@ -160,12 +247,19 @@ class CoverLetterGenerator:
         context = self._prepare_context(
             resume_data, job_requirements, company_name, job_title, additional_context
         )
-        
-        # Generate cover letter content
-        content = self._generate_content(
-            context, template, personalization_level
-        )
-        
+        return template, context
+    
+    def _finish_generation(
+        self,
+        content: str,
+        context: Dict,
+        resume_data: ResumeData,
+        company_name: str,
+        job_title: str,
+        template: str,
+        personalization_level: str
+    ) -> CoverLetterData:
+        """Post-process generated content into a CoverLetterData"""
         # Post-process and validate
         processed_content = self._post_process_content(content, context)
         
@@ -323,13 +417,19 @@ class CoverLetterGenerator:
         # Create comprehensive prompt
         prompt = self._create_cover_letter_prompt(context, template_config, personalization_level)
         
+        key = self._cache_key(prompt)
+        cached = self._read_cached_content(key)
+        if cached is not None:
+            return cached
+        
         try:
             # Generate content using Groq
             content = self.groq_client.generate_completion(
                 prompt,
-                system_message=f"You are an expert cover letter writer who creates compelling, personalized cover letters that highlight the candidate's relevant experience and enthusiasm for the role. Use a {template_config.tone} tone and {template_config.length} length."
+                system_message=self.SYSTEM_MESSAGE
             )
             
+            self._write_cached_content(key, content)
             return content
             
         except Exception as e:
@@ -337,6 +437,61 @@ class CoverLetterGenerator:
             # Fallback to template-based generation
             return self._generate_fallback_content(context, template_config)
     
+    async def _agenerate_content(
+        self,
+        context: Dict,
+        template: str,
+        personalization_level: str
+    ) -> str:
+        """Generate cover letter content using AI without blocking the event loop"""
+        
+        template_config = self.templates[template]
+        prompt = self._create_cover_letter_prompt(context, template_config, personalization_level)
+        
+        key = self._cache_key(prompt)
+        cached = self._read_cached_content(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            content = await self.groq_client.agenerate_completion(
+                prompt,
+                system_message=self.SYSTEM_MESSAGE
+            )
+            
+            self._write_cached_content(key, content)
+            return content
+            
+        except Exception as e:
+            logger.error(f"Cover letter generation failed: {str(e)}")
+            return self._generate_fallback_content(context, template_config)
+    
+    def _cache_key(self, prompt: str) -> Optional[str]:
+        """Key for a generated letter (hash of the model and full request), or None when caching is off"""
+        if self.cache_dir is None:
+            return None
+        request = f"{self.groq_client.model}\n{self.SYSTEM_MESSAGE}\n{prompt}"
+        return hashlib.sha256(request.encode('utf-8')).hexdigest()
+    
+    def _read_cached_content(self, key: Optional[str]) -> Optional[str]:
+        """Previously generated content for key, if any"""
+        if key is None:
+            return None
+        try:
+            return (self.cache_dir / f"{key}.txt").read_text(encoding='utf-8')
+        except OSError:
+            return None
+    
+    def _write_cached_content(self, key: Optional[str], content: str) -> None:
+        """Store generated content for key"""
+        if key is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / f"{key}.txt").write_text(content, encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"Could not cache cover letter: {str(e)}")
+    
     def _create_cover_letter_prompt(
         self,
         context: Dict,
@@ -356,8 +511,29 @@ class CoverLetterGenerator:
             'high': "Create a highly personalized letter with company research, specific examples, and strong value proposition."
         }
         
+        # Ordered from most to least shared: the fixed instructions, then the
+        # candidate, then the job, and only then the per-call template, level,
+        # company and title. Groq caches identical prompt prefixes, so letters
+        # for the same resume and job reuse everything before the tail.
         prompt = f"""
-        Write a compelling cover letter for the following job application:
+        Write a compelling cover letter for the job application described below.
+        
+        GENERAL INSTRUCTIONS:
+        - Start with a compelling opening that mentions the specific role and company
+        - Highlight 2-3 most relevant experiences with specific examples
+        - Demonstrate knowledge of the company and role requirements
+        - Show enthusiasm and cultural fit
+        - Include a strong call-to-action closing
+        - Use professional business letter format
+        - Keep paragraphs concise and impactful
+        - Incorporate relevant keywords naturally
+        - Maintain authenticity and avoid generic phrases
+        
+        FORMATTING:
+        - Include proper business letter header with date
+        - Address to hiring manager or relevant title
+        - Use clear paragraph breaks
+        - Professional closing signature
         
         CANDIDATE INFORMATION:
         Name: {candidate['name']}
@@ -365,14 +541,10 @@ class CoverLetterGenerator:
         Key Skills: {', '.join(candidate['skills'][:10])}
         Relevant Experience: {len(analysis['relevant_experience'])} positions
         
-        JOB DETAILS:
-        Position: {job['title']}
-        Company: {job['company']}
+        REQUIREMENTS ANALYSIS:
         Industry: {job['industry']}
         Job Level: {job['job_level']}
         Remote Work: {job['remote_work']}
-        
-        REQUIREMENTS ANALYSIS:
         Required Skills: {', '.join(job['required_skills'][:8])}
         Matching Skills: {', '.join(analysis['matching_skills'])}
         Skill Match Score: {analysis['skill_match_score']:.1%}
@@ -394,25 +566,11 @@ class CoverLetterGenerator:
         Length: {template_config.length}
         Structure: {' → '.join(template_config.structure)}
         Personalization Level: {personalization_level}
-        
-        INSTRUCTIONS:
         {personalization_instructions[personalization_level]}
         
-        - Start with a compelling opening that mentions the specific role and company
-        - Highlight 2-3 most relevant experiences with specific examples
-        - Demonstrate knowledge of the company and role requirements
-        - Show enthusiasm and cultural fit
-        - Include a strong call-to-action closing
-        - Use professional business letter format
-        - Keep paragraphs concise and impactful
-        - Incorporate relevant keywords naturally
-        - Maintain authenticity and avoid generic phrases
-        
-        FORMATTING:
-        - Include proper business letter header with date
-        - Address to hiring manager or relevant title
-        - Use clear paragraph breaks
-        - Professional closing signature
+        JOB DETAILS:
+        Position: {job['title']}
+        Company: {job['company']}
         
         Generate the complete cover letter:
         """
@@ -659,6 +817,59 @@ Sincerely,
 
         return versions
 
+    async def agenerate_multiple_versions(
+        self,
+        resume_data: ResumeData,
+        job_requirements: JobRequirements,
+        company_name: str,
+        job_title: str,
+        templates: List[str] = None,
+        personalization_level: str = 'high'
+    ) -> Dict[str, CoverLetterData]:
+        """
+        Generate multiple cover letter versions concurrently, so the total
+        wait is one AI round trip instead of one per template
+
+        Args:
+            resume_data: Candidate's resume data
+            job_requirements: Target job requirements
+            company_name: Target company name
+            job_title: Target job title
+            templates: List of templates to use
+            personalization_level: Level of personalization
+
+        Returns:
+            Dictionary mapping template names to cover letters
+        """
+        if templates is None:
+            templates = ['professional', 'enthusiastic', 'technical']
+
+        templates = [template for template in templates if template in self.templates]
+        results = await asyncio.gather(
+            *(
+                self.agenerate_cover_letter(
+                    resume_data,
+                    job_requirements,
+                    company_name,
+                    job_title,
+                    template=template,
+                    personalization_level=personalization_level
+                )
+                for template in templates
+            ),
+            return_exceptions=True
+        )
+
+        versions = {}
+
+        for template, result in zip(templates, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to generate {template} version: {str(result)}")
+            else:
+                versions[template] = result
+
+        return versions
+
     def export_cover_letter(
         self,
         cover_letter: CoverLetterData,
@@ -764,19 +975,26 @@ Sincerely,
         }
 
         # Overall quality score (weighted average)
-        weights = {
-            'personalization_score': 0.3,
-            'length_score': 0.2,
-            'readability_score': 0.25,
-            'structure_score': 0.15,
-            'enthusiasm_score': 0.1
-        }
-
-        overall_score = sum(metrics[key] * weights[key] for key in weights)
+        overall_score = sum(metrics[key] * weight for key, weight in self.QUALITY_WEIGHTS.items())
         metrics['overall_score'] = overall_score
 
         return metrics
 
+    def analyze_batch(self, cover_letters: List[CoverLetterData]) -> List[Dict[str, float]]:
+        """
+        Analyze quality metrics for several cover letters
+
+        The metrics are computed locally (no AI calls), so this is a single
+        pass over the letters sharing the precomputed weights.
+
+        Args:
+            cover_letters: Cover letters to analyze
+
+        Returns:
+            Quality metrics for each letter, in input order
+        """
+        return [self.analyze_cover_letter_quality(cover_letter) for cover_letter in cover_letters]
+
     def _calculate_length_score(self, word_count: int) -> float:
         """Calculate score based on optimal length"""
         if 200 <= word_count <= 350:
@@ -4,7 +4,7 @@ Groq API client for AI-powered resume and cover letter generation
 
 import logging
 from typing import Dict, List, Optional, Any
-from groq import Groq
+from groq import Groq, AsyncGroq
 
 from config import config
 
@@ -13,6 +13,10 @@ logger = logging.getLogger(__name__)
 class GroqClient:
     """Client for interacting with Groq API"""
     
+    # Retries for rate limits (429), server errors and dropped connections; the
+    # SDK backs off exponentially between attempts (0.5s doubling, capped at 8s)
+    MAX_RETRIES = 3
+    
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize Groq client
@@ -24,7 +28,8 @@ class GroqClient:
         if not self.api_key:
             raise ValueError("Groq API key is required")
         
-        self.client = Groq(api_key=self.api_key)
+        self.client = Groq(api_key=self.api_key, max_retries=self.MAX_RETRIES)
+        self._async_client = None
         self.model = config.GROQ_MODEL
         self.max_tokens = config.MAX_TOKENS
         self.temperature = config.TEMPERATURE
@@ -49,16 +54,61 @@ class GroqClient:
             Generated text completion
         """
         try:
-            messages = []
-            
-            if system_message:
-                messages.append({"role": "system", "content": system_message})
-            
-            messages.append({"role": "user", "content": prompt})
-            
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=messages,
+                messages=self._build_messages(prompt, system_message),
+                max_tokens=max_tokens or self.max_tokens,
+                temperature=temperature or self.temperature
+            )
+            
+            return response.choices[0].message.content.strip()
+        
+        except Exception as e:
+            logger.error(f"Error generating completion: {str(e)}")
+            raise
+    
+    @staticmethod
+    def _build_messages(prompt: str, system_message: Optional[str]) -> List[Dict[str, str]]:
+        """Chat messages for a prompt with an optional system message"""
+        messages = []
+        
+        if system_message:
+            messages.append({"role": "system", "content": system_message})
+        
+        messages.append({"role": "user", "content": prompt})
+        return messages
+    
+    @property
+    def async_client(self) -> AsyncGroq:
+        """Async Groq client, created on first use"""
+        if self._async_client is None:
+            self._async_client = AsyncGroq(api_key=self.api_key, max_retries=self.MAX_RETRIES)
+        return self._async_client
+    
+    async def agenerate_completion(
+        self, 
+        prompt: str, 
+        system_message: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None
+    ) -> str:
+        """
+        Generate completion without blocking the event loop, so several
+        requests can be awaited together with asyncio.gather
+        
+        Args:
+            prompt: User prompt
+            system_message: System message for context
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+        
+        Returns:
+            Generated text completion
+        """
+        try:
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=self._build_messages(prompt, system_message),
                 max_tokens=max_tokens or self.max_tokens,
                 temperature=temperature or self.temperature
             )
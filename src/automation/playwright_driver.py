@@ -0,0 +1,213 @@
+"""
+Playwright Driver for Job Application Automation
+"""
+
+import random
+import logging
+from typing import List, Protocol, Sequence
+from playwright.sync_api import sync_playwright, Page, Locator, Error as PlaywrightError
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+class Driver(Protocol):
+    """Browser operations the application flows rely on"""
+    
+    def navigate(self, url: str) -> bool: ...
+    
+    def click(self, selector: str, timeout: float = 10) -> bool: ...
+    
+    def fill(self, selector: str, text: str, timeout: float = 10) -> bool: ...
+    
+    def find_all(self, selector: str) -> List[Locator]: ...
+    
+    def close(self) -> None: ...
+
+class PlaywrightDriver:
+    """Driver backed by Playwright's Chromium with built-in auto-waiting"""
+    
+    # Resource types aborted before they hit the network
+    BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+    
+    USER_AGENTS = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+    )
+    
+    VIEWPORTS = ((1366, 768), (1920, 1080), (1440, 900), (1536, 864))
+    
+    def __init__(self, page: Page, playwright=None, browser=None):
+        """
+        Wrap an existing Playwright page
+        
+        Args:
+            page: Page to drive
+            playwright: Playwright instance to stop on close
+            browser: Browser to close on close
+        """
+        self.page = page
+        self._playwright = playwright
+        self._browser = browser
+    
+    @classmethod
+    def launch(cls, headless: bool = None, block_resources: bool = True) -> "PlaywrightDriver":
+        """
+        Start Chromium and open a page with a randomized fingerprint
+        
+        Args:
+            headless: Run in headless mode
+            block_resources: Abort image, font and media requests
+        
+        Returns:
+            PlaywrightDriver instance
+        """
+        if headless is None:
+            headless = config.HEADLESS_MODE
+        
+        playwright = sync_playwright().start()
+        browser = None
+        try:
+            browser = playwright.chromium.launch(
+                headless=headless,
+                args=["--disable-blink-features=AutomationControlled"]
+            )
+            
+            width, height = random.choice(cls.VIEWPORTS)
+            context = browser.new_context(
+                user_agent=random.choice(cls.USER_AGENTS),
+                viewport={'width': width, 'height': height}
+            )
+            context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined});")
+            
+            page = context.new_page()
+            if block_resources:
+                page.route("**/*", cls._block_heavy_resources)
+        except Exception:
+            # Don't leave Chromium or the Playwright driver process running
+            if browser:
+                browser.close()
+            playwright.stop()
+            raise
+        
+        logger.info(f"Playwright browser launched (headless={headless})")
+        return cls(page, playwright, browser)
+    
+    @classmethod
+    def _block_heavy_resources(cls, route) -> None:
+        """Route handler aborting resources the flows never look at"""
+        if route.request.resource_type in cls.BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+    
+    def navigate(self, url: str) -> bool:
+        """
+        Navigate to URL, returning once the DOM is ready
+        
+        Args:
+            url: Page URL
+        
+        Returns:
+            True if navigation succeeded
+        """
+        try:
+            self.page.goto(url, wait_until="domcontentloaded")
+            return True
+        except PlaywrightError as e:
+            logger.warning(f"Navigation to {url} failed: {str(e)}")
+            return False
+    
+    def click(self, selector: str, timeout: float = 10) -> bool:
+        """
+        Click the first element matching selector
+        
+        Playwright waits for the element to be attached, visible, stable and
+        enabled, which replaces the scroll/wait/retry ladder used with Selenium.
+        
+        Args:
+            selector: CSS or Playwright selector
+            timeout: Seconds to wait for the element
+        
+        Returns:
+            True if the element was clicked
+        """
+        try:
+            self.page.locator(selector).first.click(timeout=timeout * 1000)
+            return True
+        except PlaywrightError as e:
+            logger.debug(f"Click on {selector} failed: {str(e)}")
+            return False
+    
+    def fill(self, selector: str, text: str, timeout: float = 10) -> bool:
+        """
+        Fill the first input matching selector
+        
+        Args:
+            selector: CSS or Playwright selector
+            text: Text to enter
+            timeout: Seconds to wait for the element
+        
+        Returns:
+            True if the field was filled
+        """
+        try:
+            self.page.locator(selector).first.fill(text, timeout=timeout * 1000)
+            return True
+        except PlaywrightError as e:
+            logger.debug(f"Fill of {selector} failed: {str(e)}")
+            return False
+    
+    def find_all(self, selector: str) -> List[Locator]:
+        """
+        Get locators for every element matching selector
+        
+        Args:
+            selector: CSS or Playwright selector
+        
+        Returns:
+            List of locators (empty if nothing matches)
+        """
+        return self.page.locator(selector).all()
+    
+    def dismiss_popups(self, selectors: Sequence[str]) -> int:
+        """
+        Click every visible popup close button
+        
+        Args:
+            selectors: Close button selectors, queried together in one pass
+        
+        Returns:
+            Number of popups dismissed
+        """
+        dismissed = 0
+        for button in self.find_all(", ".join(selectors)):
+            try:
+                if button.is_visible():
+                    button.click(timeout=2000)
+                    dismissed += 1
+            except PlaywrightError:
+                continue
+        
+        if dismissed:
+            logger.info(f"Dismissed {dismissed} popups")
+        return dismissed
+    
+    def close(self) -> None:
+        """Close the browser and stop Playwright"""
+        try:
+            if self._browser:
+                self._browser.close()
+        except Exception as e:
+            logger.error(f"Error closing Playwright browser: {str(e)}")
+        finally:
+            # Stop the driver process even when the browser wouldn't close
+            try:
+                if self._playwright:
+                    self._playwright.stop()
+            except Exception as e:
+                logger.error(f"Error stopping Playwright: {str(e)}")
+            finally:
+                self._browser = None
+                self._playwright = None
@@ -21,6 +21,27 @@ from src.ai.groq_client import GroqClient
 
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import and shared by every parser instance
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s.,;:()\-+/]')
+_BULLET_RE = re.compile(r'[•·▪▫◦‣⁃]|\d+\.|\-\s')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+_EDUCATION_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"bachelor'?s?\s+(?:degree\s+)?(?:in\s+)?([a-zA-Z\s]+)",
+    r"master'?s?\s+(?:degree\s+)?(?:in\s+)?([a-zA-Z\s]+)",
+    r"phd\s+(?:in\s+)?([a-zA-Z\s]+)",
+    r"(?:bs|ba|ms|ma|mba)\s+(?:in\s+)?([a-zA-Z\s]+)"
+))
+
+# Matched against lower-cased text
+_DEADLINE_RES = tuple(re.compile(pattern) for pattern in (
+    r'deadline[:\s]+([^.]+)',
+    r'apply by[:\s]+([^.]+)',
+    r'closing date[:\s]+([^.]+)'
+))
+
 @dataclass
 class JobRequirements:
     """Data class for parsed job requirements"""
@@ -127,8 +148,8 @@ class JobDescriptionParser:
         self.matcher.add("EDUCATION", education_patterns)
     
     def _setup_regex_patterns(self):
-        """Setup regex patterns for various extractions"""
-        self.patterns = {
+        """Setup regex patterns for various extractions (compiled case-insensitive)"""
+        patterns = {
             'salary': [
                 r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*-\s*\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',
                 r'\$(\d{1,3}(?:,\d{3})*(?:k|K))\s*-\s*\$(\d{1,3}(?:,\d{3})*(?:k|K))',
@@ -158,6 +179,11 @@ class JobDescriptionParser:
                 r'(?:fortune\s+500|multinational)',
             ]
         }
+        
+        self.patterns = {
+            name: [re.compile(pattern, re.IGNORECASE) for pattern in group]
+            for name, group in patterns.items()
+        }
     
     def parse_job_description(self, job_description: str, job_title: str = "") -> JobRequirements:
         """
@@ -213,13 +239,13 @@ class JobDescriptionParser:
             Cleaned text
         """
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', ' ', text)
+        text = _HTML_TAG_RE.sub(' ', text)
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Remove special characters but keep important punctuation
-        text = re.sub(r'[^\w\s.,;:()\-+/]', ' ', text)
+        text = _SPECIAL_CHARS_RE.sub(' ', text)
         
         return text.strip()
     
@@ -249,7 +275,7 @@ class JobDescriptionParser:
             # Check if sentence contains responsibility indicators
             if any(indicator in sentence_lower for indicator in responsibility_indicators):
                 # Extract bullet points or numbered lists
-                if re.search(r'[•·▪▫◦‣⁃]|\d+\.|\-\s', sentence):
+                if _BULLET_RE.search(sentence):
                     responsibilities.append(sentence.strip())
                 continue
             
@@ -397,7 +423,7 @@ class JobDescriptionParser:
         # Extract years of experience
         experience_years = {}
         for pattern in self.patterns['experience_years']:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text)
             for match in matches:
                 years = int(match.group(1))
                 # Try to find what the experience is for
@@ -418,15 +444,8 @@ class JobDescriptionParser:
         
         # Extract education requirements
         education_requirements = []
-        education_patterns = [
-            r"bachelor'?s?\s+(?:degree\s+)?(?:in\s+)?([a-zA-Z\s]+)",
-            r"master'?s?\s+(?:degree\s+)?(?:in\s+)?([a-zA-Z\s]+)",
-            r"phd\s+(?:in\s+)?([a-zA-Z\s]+)",
-            r"(?:bs|ba|ms|ma|mba)\s+(?:in\s+)?([a-zA-Z\s]+)"
-        ]
-        
-        for pattern in education_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in _EDUCATION_RES:
+            matches = pattern.finditer(text)
             for match in matches:
                 education_requirements.append(match.group().strip())
         
@@ -446,7 +465,7 @@ class JobDescriptionParser:
         # Extract salary range
         salary_range = None
         for pattern in self.patterns['salary']:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 try:
                     min_sal = self._parse_salary(match.group(1))
@@ -459,32 +478,32 @@ class JobDescriptionParser:
         # Extract job level
         job_level = "Mid-Level"  # Default
         for pattern in self.patterns['job_level']:
-            if re.search(pattern, text + " " + job_title, re.IGNORECASE):
-                if 'senior' in pattern or 'lead' in pattern:
+            if pattern.search(text + " " + job_title):
+                if 'senior' in pattern.pattern or 'lead' in pattern.pattern:
                     job_level = "Senior"
-                elif 'junior' in pattern or 'entry' in pattern:
+                elif 'junior' in pattern.pattern or 'entry' in pattern.pattern:
                     job_level = "Entry"
-                elif 'director' in pattern or 'manager' in pattern:
+                elif 'director' in pattern.pattern or 'manager' in pattern.pattern:
                     job_level = "Management"
                 break
         
         # Extract remote work info
         remote_work = False
         for pattern in self.patterns['remote_work']:
-            if re.search(pattern, text, re.IGNORECASE):
-                if 'remote' in pattern or 'wfh' in pattern:
+            if pattern.search(text):
+                if 'remote' in pattern.pattern or 'wfh' in pattern.pattern:
                     remote_work = True
                 break
         
         # Extract company size
         company_size = "Unknown"
         for pattern in self.patterns['company_size']:
-            if re.search(pattern, text, re.IGNORECASE):
-                if 'startup' in pattern or 'small' in pattern:
+            if pattern.search(text):
+                if 'startup' in pattern.pattern or 'small' in pattern.pattern:
                     company_size = "Small"
-                elif 'medium' in pattern:
+                elif 'medium' in pattern.pattern:
                     company_size = "Medium"
-                elif 'large' in pattern or 'enterprise' in pattern:
+                elif 'large' in pattern.pattern or 'enterprise' in pattern.pattern:
                     company_size = "Large"
                 break
         
@@ -708,8 +727,8 @@ class JobDescriptionParser:
         # Overall match score (weighted)
         overall_score = (required_match * 0.7) + (preferred_match * 0.3)
 
-        # Find missing skills
-        candidate_skills_lower = [skill.lower() for skill in candidate_skills]
+        # Find missing skills (set lookups instead of scanning the candidate list per skill)
+        candidate_skills_lower = {skill.lower() for skill in candidate_skills}
         missing_required = [
             skill for skill in job_requirements.required_skills
             if skill.lower() not in candidate_skills_lower
@@ -767,8 +786,7 @@ class JobDescriptionParser:
         elif 'email' in text_lower and '@' in job_description:
             instructions['application_method'] = 'Email'
             # Extract email
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            emails = re.findall(email_pattern, job_description)
+            emails = _EMAIL_RE.findall(job_description)
             if emails:
                 instructions['contact_info'] = emails[0]
 
@@ -783,14 +801,8 @@ class JobDescriptionParser:
                 instructions['required_documents'].append(keyword.title())
 
         # Extract deadline
-        deadline_patterns = [
-            r'deadline[:\s]+([^.]+)',
-            r'apply by[:\s]+([^.]+)',
-            r'closing date[:\s]+([^.]+)'
-        ]
-
-        for pattern in deadline_patterns:
-            match = re.search(pattern, text_lower)
+        for pattern in _DEADLINE_RES:
+            match = pattern.search(text_lower)
             if match:
                 instructions['application_deadline'] = match.group(1).strip()
                 break
@@ -3,6 +3,7 @@ Main Job Scraper Module
 Coordinates multiple job platforms and provides unified interface
 """
 
+import re
 import logging
 from typing import List, Dict, Optional, Union
 from enum import Enum
@@ -14,6 +15,19 @@ from config import config
 
 logger = logging.getLogger(__name__)
 
+# Posted-date units, matched case-insensitively in one pass
+_POSTED_UNIT_RE = re.compile(r'(minute|hour|day|week|month)', re.I)
+_POSTED_NUMBER_RE = re.compile(r'\d+')
+
+# unit -> (score with no count, score lost per unit of count)
+_POSTED_UNIT_SCORES = {
+    'minute': (100, 0),
+    'hour': (100, 0),
+    'day': (50, 1),
+    'week': (20, 7),
+    'month': (5, 0)
+}
+
 class JobPlatform(Enum):
     """Supported job platforms"""
     LINKEDIN = "linkedin"
@@ -246,28 +260,15 @@ class JobScraper:
         Returns:
             Numeric score (higher = more recent)
         """
-        posted_date_lower = posted_date.lower()
-        
-        if "hour" in posted_date_lower or "minute" in posted_date_lower:
-            return 100
-        elif "day" in posted_date_lower:
-            # Extract number of days
-            import re
-            match = re.search(r'(\d+)', posted_date_lower)
-            if match:
-                days = int(match.group(1))
-                return max(0, 50 - days)
-            return 50
-        elif "week" in posted_date_lower:
-            match = re.search(r'(\d+)', posted_date_lower)
-            if match:
-                weeks = int(match.group(1))
-                return max(0, 20 - weeks * 7)
-            return 20
-        elif "month" in posted_date_lower:
-            return 5
-        else:
+        unit = _POSTED_UNIT_RE.search(posted_date)
+        if not unit:
             return 0
+        
+        score, per_unit = _POSTED_UNIT_SCORES[unit.group(1).lower()]
+        count = _POSTED_NUMBER_RE.search(posted_date)
+        if count and per_unit:
+            return max(0, score - int(count.group()) * per_unit)
+        return score
     
     def get_job_details(self, job: JobListing, platform: JobPlatform = None) -> JobListing:
         """
@@ -0,0 +1,257 @@
+"""
+Test cases for Advanced Job Applier
+"""
+
+import logging
+import pytest
+from unittest.mock import Mock, patch
+
+import advanced_job_applier
+from advanced_job_applier import AdvancedJobApplier, _PLATFORM_CONFIGS
+
+class TestStealthBrowser:
+    """Test cases for AdvancedJobApplier browser creation"""
+    
+    @pytest.fixture
+    def applier(self):
+        """Create applier without logging or history side effects"""
+        applier = AdvancedJobApplier.__new__(AdvancedJobApplier)
+        applier.platform = 'internshala'
+        applier.platform_config = dict(_PLATFORM_CONFIGS['internshala'])
+        applier.logger = logging.getLogger('test_advanced_job_applier')
+        applier.driver = None
+        applier._actions = None
+        return applier
+    
+    @pytest.fixture
+    def chrome(self):
+        """Patch Chrome so browser creation returns a mock driver"""
+        with patch('selenium.webdriver.Chrome') as chrome:
+            yield chrome
+    
+    @pytest.fixture(autouse=True)
+    def empty_pool(self):
+        """Keep pooled browsers from leaking between tests"""
+        with patch.dict(advanced_job_applier._DRIVER_POOL, clear=True):
+            yield
+    
+    @staticmethod
+    def cdp_calls(driver, command):
+        """Arguments of every execute_cdp_cmd call for one command"""
+        return [c.args[1] for c in driver.execute_cdp_cmd.call_args_list if c.args[0] == command]
+    
+    def test_new_browser_installs_popup_observer(self, applier, chrome):
+        """Test the popup observer is registered for every new document"""
+        assert applier.create_stealth_browser(use_profile=False) is True
+    
+        sources = self.cdp_calls(chrome.return_value, 'Page.addScriptToEvaluateOnNewDocument')
+        assert sources == [{'source': AdvancedJobApplier.POPUP_OBSERVER_JS}]
+    
+    def test_pooled_browser_installs_popup_observer(self, applier):
+        """Test a reused browser gets the observer too"""
+        driver = Mock()
+        advanced_job_applier._DRIVER_POOL[('ua', '1280,800', None)] = [driver]
+    
+        assert applier.create_stealth_browser(use_profile=False) is True
+    
+        assert applier.driver is driver
+        sources = self.cdp_calls(driver, 'Page.addScriptToEvaluateOnNewDocument')
+        assert sources == [{'source': AdvancedJobApplier.POPUP_OBSERVER_JS}]
+    
+    def test_pooled_browser_keeps_registered_observer(self, applier):
+        """Test a browser that already has the observer isn't given another"""
+        driver = Mock()
+        driver._popup_observer_id = '1'
+        advanced_job_applier._DRIVER_POOL[('ua', '1280,800', None)] = [driver]
+        
+        assert applier.create_stealth_browser(use_profile=False) is True
+        
+        assert self.cdp_calls(driver, 'Page.addScriptToEvaluateOnNewDocument') == []
+    
+    def test_observer_identifier_saved(self, applier, chrome):
+        """Test the script identifier is kept on the driver"""
+        chrome.return_value.execute_cdp_cmd.return_value = {'identifier': '7'}
+        
+        assert applier.create_stealth_browser(use_profile=False) is True
+        
+        assert chrome.return_value._popup_observer_id == '7'
+    
+    def test_new_browser_blocks_heavy_resources(self, applier, chrome):
+        """Test resource blocking is sent right after Chrome starts"""
+        assert applier.create_stealth_browser(use_profile=False) is True
+    
+        driver = chrome.return_value
+        commands = [c.args[0] for c in driver.execute_cdp_cmd.call_args_list]
+        assert commands[:2] == ['Network.enable', 'Network.setBlockedURLs']
+    
+        urls = self.cdp_calls(driver, 'Network.setBlockedURLs')[0]['urls']
+        assert set(AdvancedJobApplier.BLOCKED_URL_PATTERNS) <= set(urls)
+    
+    def test_pooled_browser_blocks_heavy_resources(self, applier):
+        """Test a reused browser gets the blocked URL list again"""
+        driver = Mock()
+        advanced_job_applier._DRIVER_POOL[('ua', '1280,800', None)] = [driver]
+    
+        assert applier.create_stealth_browser(use_profile=False) is True
+    
+        assert len(self.cdp_calls(driver, 'Network.setBlockedURLs')) == 1
+    
+    @pytest.mark.parametrize('platform', sorted(_PLATFORM_CONFIGS))
+    def test_platform_tracking_patterns_blocked(self, applier, chrome, platform):
+        """Test each platform's tracking endpoints are in the blocked URL list"""
+        applier.platform = platform
+        applier.platform_config = dict(_PLATFORM_CONFIGS[platform])
+    
+        assert applier.create_stealth_browser(use_profile=False) is True
+    
+        urls = self.cdp_calls(chrome.return_value, 'Network.setBlockedURLs')[0]['urls']
+        assert _PLATFORM_CONFIGS[platform]['blocked_patterns']
+        assert set(_PLATFORM_CONFIGS[platform]['blocked_patterns']) <= set(urls)
+
+class TestFindElementSafe:
+    """Test cases for AdvancedJobApplier.find_element_safe"""
+    
+    @pytest.fixture
+    def applier(self):
+        """Create applier around a mock driver"""
+        applier = AdvancedJobApplier.__new__(AdvancedJobApplier)
+        applier.logger = logging.getLogger('test_advanced_job_applier')
+        applier.driver = Mock()
+        return applier
+    
+    def test_selectors_passed_in_priority_order(self, applier):
+        """Test CSS and XPath selectors reach the lookup script in list order"""
+        element = Mock()
+        applier.driver.execute_script.return_value = [2, element]
+    
+        found = applier.find_element_safe(AdvancedJobApplier.INTERNSHALA_APPLY_SEL, "apply button", timeout=1)
+    
+        assert found is element
+        script, tagged = applier.driver.execute_script.call_args.args
+        assert script == AdvancedJobApplier.FIRST_VISIBLE_MATCH_JS
+        assert [sel for _, sel in tagged] == [
+            sel if isinstance(sel, str) else sel[1] for sel in AdvancedJobApplier.INTERNSHALA_APPLY_SEL
+        ]
+        assert [by for by, _ in tagged] == ['css selector', 'css selector', 'xpath', 'xpath']
+    
+    def test_not_found(self, applier):
+        """Test None is returned when no selector has a visible match"""
+        applier.driver.execute_script.return_value = None
+    
+        assert applier.find_element_safe('.missing', "missing element", timeout=0.3) is None
+
+class TestApplyToJobsParallel:
+    """Test cases for AdvancedJobApplier.apply_to_jobs_parallel"""
+    
+    @pytest.fixture
+    def applier(self):
+        """Create applier with an empty application history"""
+        applier = AdvancedJobApplier.__new__(AdvancedJobApplier)
+        applier.applied_hashes = set()
+        return applier
+    
+    def test_skips_applied_jobs(self, applier):
+        """Test jobs already in the history never reach the worker pool"""
+        jobs = [
+            {'title': 'Old', 'url': 'https://example.com/jobs/1'},
+            {'title': 'New', 'url': 'https://example.com/jobs/2'},
+        ]
+        applier.applied_hashes = {applier.job_url_hash(jobs[0]['url'])}
+        applier.apply_to_jobs = Mock(return_value=1)
+        
+        assert applier.apply_to_jobs_parallel(jobs, {}, max_workers=2) == 1
+        applier.apply_to_jobs.assert_called_once_with([jobs[1]], {})
+
+class TestLinkedInGuestJobs:
+    """Test cases for AdvancedJobApplier.fetch_linkedin_guest_jobs"""
+    
+    @pytest.fixture
+    def applier(self):
+        """Create applier around a mock logged-in driver"""
+        applier = AdvancedJobApplier.__new__(AdvancedJobApplier)
+        applier.logger = logging.getLogger('test_advanced_job_applier')
+        applier.fingerprint = None
+        applier.driver = Mock()
+        return applier
+    
+    def test_missing_dependency_falls_back(self, applier):
+        """Test a missing requests/lxml returns None so the DOM scrape runs"""
+        with patch.dict('sys.modules', {'requests': None}):
+            assert applier.fetch_linkedin_guest_jobs("Python", "Remote", 5) is None
+    
+    def test_session_cookies_not_sent(self, applier):
+        """Test the unauthenticated endpoint never gets the browser's cookies"""
+        with patch('requests.Session') as session_cls:
+            session = session_cls.return_value.__enter__.return_value
+            session.get.return_value = Mock(status_code=200, text='')
+            
+            assert applier.fetch_linkedin_guest_jobs("Python", "Remote", 5) is None
+        
+        applier.driver.get_cookies.assert_not_called()
+        assert 'cookies' not in session.get.call_args.kwargs
+
+class TestClose:
+    """Test cases for AdvancedJobApplier.close"""
+    
+    @pytest.fixture(autouse=True)
+    def empty_pool(self):
+        """Keep pooled browsers from leaking between tests"""
+        with patch.dict(advanced_job_applier._DRIVER_POOL, clear=True):
+            yield
+    
+    @pytest.fixture
+    def applier(self):
+        """Create applier around a mock driver"""
+        applier = AdvancedJobApplier.__new__(AdvancedJobApplier)
+        applier.logger = logging.getLogger('test_advanced_job_applier')
+        applier.driver = Mock()
+        applier.fingerprint = ('ua', '1280,800', None)
+        applier.history = None
+        return applier
+    
+    def test_close_quits_browser(self, applier):
+        """Test a plain close quits Chrome instead of pooling it"""
+        driver = applier.driver
+        
+        applier.close()
+        
+        driver.quit.assert_called_once()
+        assert not advanced_job_applier._DRIVER_POOL
+    
+    def test_keep_alive_pools_browser(self, applier):
+        """Test keep_alive parks the browser for the next session"""
+        driver = applier.driver
+        
+        applier.close(keep_alive=True)
+        
+        driver.quit.assert_not_called()
+        assert advanced_job_applier._DRIVER_POOL[('ua', '1280,800', None)] == [driver]
+
+class TestApplyToJobs:
+    """Test cases for AdvancedJobApplier.apply_to_jobs"""
+    
+    @pytest.fixture
+    def applier(self):
+        """Create applier with fresh session stats"""
+        applier = AdvancedJobApplier.__new__(AdvancedJobApplier)
+        applier.logger = logging.getLogger('test_advanced_job_applier')
+        applier.applied_hashes = set()
+        applier.session_stats = {
+            'jobs_applied': 0,
+            'applications_successful': 0,
+            'applications_failed': 0,
+            'jobs_skipped': 0,
+            'captchas_detected': 0
+        }
+        return applier
+    
+    def test_skipped_job_not_counted_as_failure(self, applier):
+        """Test a job skipped by apply_to_single_job is counted separately"""
+        applier.apply_to_single_job = Mock(return_value=None)
+        job = {'title': 'Dup', 'company': 'Acme', 'url': 'https://example.com/jobs/1'}
+        
+        assert applier.apply_to_jobs([job], {}) == 0
+        
+        assert applier.session_stats['jobs_skipped'] == 1
+        assert applier.session_stats['applications_failed'] == 0
+        assert applier.session_stats['jobs_applied'] == 0
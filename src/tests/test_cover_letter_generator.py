@@ -2,6 +2,7 @@
 Test cases for AI Cover Letter Generator Module
 """
 
+import asyncio
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
@@ -370,6 +371,73 @@ class TestCoverLetterGenerator:
         assert result.template_used == "professional"
         assert len(result.content) > 0
     
+    def test_agenerate_multiple_versions(self):
+        """Test concurrent template generation keeps order and skips failures"""
+        async def fake_content(context, template, personalization_level):
+            if template == 'technical':
+                raise RuntimeError("API down")
+            return f"Dear Hiring Manager,\n\n{template} letter for Tech Corp.\n\nSincerely,\nJohn Doe"
+        
+        resume_data = Mock(spec=ResumeData)
+        resume_data.name = "John Doe"
+        resume_data.email = "john@example.com"
+        resume_data.summary = "Software developer"
+        resume_data.skills = ["Python"]
+        resume_data.experience = []
+        resume_data.education = []
+        
+        job_requirements = Mock(spec=JobRequirements)
+        job_requirements.required_skills = ["Python"]
+        job_requirements.preferred_skills = []
+        job_requirements.responsibilities = []
+        job_requirements.job_level = "Mid-Level"
+        job_requirements.industry = "Technology"
+        job_requirements.remote_work = True
+        job_requirements.salary_range = None
+        job_requirements.keywords = []
+        job_requirements.experience_years = {}
+        job_requirements.education_requirements = []
+        
+        self.generator.text_processor.calculate_skill_relevance = Mock(return_value=0.8)
+        
+        with patch.object(self.generator, '_agenerate_content', side_effect=fake_content):
+            versions = asyncio.run(self.generator.agenerate_multiple_versions(
+                resume_data,
+                job_requirements,
+                "Tech Corp",
+                "Software Engineer",
+                templates=['concise', 'technical', 'professional', 'unknown']
+            ))
+        
+        assert list(versions) == ['concise', 'professional']
+        assert versions['concise'].template_used == 'concise'
+        assert "concise letter" in versions['concise'].content
+    
+    def test_analyze_batch(self):
+        """Test batch quality analysis matches per-letter analysis"""
+        letters = [
+            CoverLetterData(
+                content=content,
+                job_title="Engineer",
+                company_name="Corp",
+                candidate_name="John",
+                generated_at="2024-01-01",
+                word_count=len(content.split()),
+                key_points=[],
+                personalization_score=score,
+                template_used="professional"
+            )
+            for content, score in [
+                ("Dear Hiring Manager,\n\nI am excited to apply.\n\nSincerely,\nJohn", 0.8),
+                ("Short letter.", 0.2)
+            ]
+        ]
+        
+        batch = self.generator.analyze_batch(letters)
+        
+        assert batch == [self.generator.analyze_cover_letter_quality(letter) for letter in letters]
+        assert all(0 <= metrics['overall_score'] <= 1 for metrics in batch)
+    
     def test_export_text_format(self):
         """Test text format export"""
         cover_letter = CoverLetterData(
@@ -481,6 +549,39 @@ class TestCoverLetterGeneratorWithAI:
         assert "Tech Corp" in content
         assert "John Doe" in content
 
+    @patch('src.ai.cover_letter_generator.GroqClient')
+    def test_content_cache(self, mock_groq_client, tmp_path):
+        """Test repeated requests are served from the on-disk cache"""
+        mock_ai = Mock()
+        mock_ai.model = "test-model"
+        mock_ai.generate_completion.return_value = "Dear Hiring Manager,\n\nCached letter.\n\nSincerely,\nJohn Doe"
+        mock_groq_client.return_value = mock_ai
+        
+        generator = CoverLetterGenerator(cache_dir=tmp_path)
+        context = {
+            'candidate': {'name': 'John Doe', 'summary': 'Software developer', 'skills': ['Python']},
+            'job': {
+                'title': 'Software Engineer',
+                'company': 'Tech Corp',
+                'industry': 'Technology',
+                'job_level': 'Mid-Level',
+                'remote_work': True,
+                'required_skills': ['Python']
+            },
+            'analysis': {'matching_skills': ['Python'], 'relevant_experience': [], 'skill_match_score': 1.0}
+        }
+        
+        first = generator._generate_content(context, 'professional', 'high')
+        second = generator._generate_content(context, 'professional', 'high')
+        
+        assert first == second
+        mock_ai.generate_completion.assert_called_once()
+        assert len(list(tmp_path.glob("*.txt"))) == 1
+        
+        # A different template is a different request
+        generator._generate_content(context, 'concise', 'high')
+        assert mock_ai.generate_completion.call_count == 2
+
 # Integration tests
 class TestCoverLetterGeneratorIntegration:
     """Integration tests for cover letter generator"""
@@ -268,6 +268,11 @@ class TestJobScraper:
         assert self.scraper._get_date_score("1 day ago") > self.scraper._get_date_score("5 days ago")
         assert self.scraper._get_date_score("1 week ago") > self.scraper._get_date_score("1 month ago")
     
+    def test_get_date_score_case_and_unknown(self):
+        """Test date units match regardless of case and unknown dates score zero"""
+        assert self.scraper._get_date_score("3 Days Ago") == 47
+        assert self.scraper._get_date_score("Just now") == 0
+
     def test_sort_jobs(self):
         """Test job sorting"""
         jobs = [
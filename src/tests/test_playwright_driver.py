@@ -0,0 +1,126 @@
+"""
+Test cases for Playwright Driver Module
+"""
+
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+from playwright.sync_api import Error as PlaywrightError
+
+from src.automation.playwright_driver import PlaywrightDriver
+
+class TestPlaywrightDriver:
+    """Test cases for PlaywrightDriver class"""
+    
+    @pytest.fixture
+    def page(self):
+        """Create mock Playwright page"""
+        return MagicMock()
+    
+    @pytest.fixture
+    def driver(self, page):
+        """Create PlaywrightDriver around the mock page"""
+        return PlaywrightDriver(page)
+    
+    def test_navigate(self, driver, page):
+        """Test navigation waits for DOM readiness only"""
+        assert driver.navigate("https://example.com/jobs") is True
+        page.goto.assert_called_once_with("https://example.com/jobs", wait_until="domcontentloaded")
+    
+    def test_navigate_failure(self, driver, page):
+        """Test navigation errors are reported as False"""
+        page.goto.side_effect = PlaywrightError("net::ERR_CONNECTION_RESET")
+        
+        assert driver.navigate("https://example.com/jobs") is False
+    
+    def test_click_uses_first_match_with_timeout(self, driver, page):
+        """Test click targets the first match and converts timeout to ms"""
+        assert driver.click("button.apply", timeout=5) is True
+        
+        page.locator.assert_called_once_with("button.apply")
+        page.locator.return_value.first.click.assert_called_once_with(timeout=5000)
+    
+    def test_click_failure(self, driver, page):
+        """Test click returns False when the element never becomes clickable"""
+        page.locator.return_value.first.click.side_effect = PlaywrightError("Timeout")
+        
+        assert driver.click("button.apply") is False
+    
+    def test_fill(self, driver, page):
+        """Test fill on first matching input"""
+        assert driver.fill("#search", "Python Developer") is True
+        page.locator.return_value.first.fill.assert_called_once_with("Python Developer", timeout=10000)
+    
+    def test_dismiss_popups_queries_once(self, driver, page):
+        """Test popup selectors are combined into a single locator"""
+        visible = Mock()
+        visible.is_visible.return_value = True
+        hidden = Mock()
+        hidden.is_visible.return_value = False
+        page.locator.return_value.all.return_value = [visible, hidden]
+        
+        dismissed = driver.dismiss_popups(['.close', '.modal-close'])
+        
+        assert dismissed == 1
+        page.locator.assert_called_once_with('.close, .modal-close')
+        visible.click.assert_called_once()
+        hidden.click.assert_not_called()
+    
+    def test_block_heavy_resources(self):
+        """Test route handler aborts images and lets documents through"""
+        image_route = Mock()
+        image_route.request.resource_type = 'image'
+        document_route = Mock()
+        document_route.request.resource_type = 'document'
+        
+        PlaywrightDriver._block_heavy_resources(image_route)
+        PlaywrightDriver._block_heavy_resources(document_route)
+        
+        image_route.abort.assert_called_once()
+        document_route.continue_.assert_called_once()
+    
+    def test_close(self, page):
+        """Test close shuts down browser and Playwright"""
+        playwright = Mock()
+        browser = Mock()
+        driver = PlaywrightDriver(page, playwright, browser)
+        
+        driver.close()
+        
+        browser.close.assert_called_once()
+        playwright.stop.assert_called_once()
+    
+    def test_close_stops_playwright_when_browser_close_fails(self, page):
+        """Test Playwright is stopped even if closing the browser raises"""
+        playwright = Mock()
+        browser = Mock()
+        browser.close.side_effect = PlaywrightError("Target closed")
+        driver = PlaywrightDriver(page, playwright, browser)
+        
+        driver.close()
+        
+        playwright.stop.assert_called_once()
+        assert driver._browser is None and driver._playwright is None
+    
+    def test_launch_failure_stops_playwright(self):
+        """Test a failed launch doesn't leave Playwright running"""
+        with patch('src.automation.playwright_driver.sync_playwright') as sync_playwright:
+            playwright = sync_playwright.return_value.start.return_value
+            playwright.chromium.launch.side_effect = PlaywrightError("Executable doesn't exist")
+            
+            with pytest.raises(PlaywrightError):
+                PlaywrightDriver.launch(headless=True)
+        
+        playwright.stop.assert_called_once()
+    
+    def test_launch_failure_closes_browser(self):
+        """Test a page that fails to open closes the launched browser"""
+        with patch('src.automation.playwright_driver.sync_playwright') as sync_playwright:
+            playwright = sync_playwright.return_value.start.return_value
+            browser = playwright.chromium.launch.return_value
+            browser.new_context.return_value.new_page.side_effect = PlaywrightError("Target closed")
+            
+            with pytest.raises(PlaywrightError):
+                PlaywrightDriver.launch(headless=True)
+        
+        browser.close.assert_called_once()
+        playwright.stop.assert_called_once()
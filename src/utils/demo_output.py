@@ -0,0 +1,96 @@
+"""
+Console and file output helpers shared by the demo scripts
+"""
+
+import contextlib
+import inspect
+import io
+import json
+import sys
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from typing import Any, Optional
+
+# orjson is optional; it encodes the saved results much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Output buffer of the demo running in the current context, if any
+_demo_output: ContextVar[Optional[io.StringIO]] = ContextVar('demo_output', default=None)
+
+class TaskStdout(io.TextIOBase):
+    """stdout stand-in that sends each write to the current demo's buffer"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+    
+    def write(self, text: str) -> int:
+        return (_demo_output.get() or self.stream).write(text)
+    
+    def flush(self) -> None:
+        self.stream.flush()
+
+def task_stdout():
+    """Route stdout through TaskStdout for the duration of a with block"""
+    return contextlib.redirect_stdout(TaskStdout(sys.stdout))
+
+def _write_buffer(buf: io.StringIO) -> None:
+    """Write a finished demo's output to stdout in one call"""
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+
+def buffered_output(demo):
+    """
+    Collect a demo's prints and write them to stdout in one call when it returns
+    
+    Works on plain and async functions. The buffer lives in a context variable,
+    which asyncio tasks and asyncio.to_thread each get a copy of, so demos run
+    together keep their own output (requires stdout to be a TaskStdout, see
+    task_stdout).
+    """
+    if inspect.iscoroutinefunction(demo):
+        @wraps(demo)
+        async def async_wrapper(*args, **kwargs):
+            buf = io.StringIO()
+            token = _demo_output.set(buf)
+            try:
+                return await demo(*args, **kwargs)
+            finally:
+                _demo_output.reset(token)
+                _write_buffer(buf)
+        
+        return async_wrapper
+    
+    @wraps(demo)
+    def wrapper(*args, **kwargs):
+        buf = io.StringIO()
+        token = _demo_output.set(buf)
+        try:
+            return demo(*args, **kwargs)
+        finally:
+            _demo_output.reset(token)
+            _write_buffer(buf)
+    
+    return wrapper
+
+def dump_json(data: Any, path: Path, indent: bool = True) -> None:
+    """
+    Write data to path as UTF-8 JSON, using orjson when it is installed
+    
+    Args:
+        data: JSON-serializable data
+        path: Output file
+        indent: Pretty-print with two-space indentation instead of compact separators
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None))
+        return
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        if indent:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        else:
+            json.dump(data, f, separators=(',', ':'), ensure_ascii=False)